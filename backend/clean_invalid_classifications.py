@@ -32,7 +32,7 @@ def clean_invalid_classifications():
 
         for agent in classified_agents:
             # 使用分类器的验证方法检查描述是否有效
-            is_valid = ai_classifier_service._is_valid_description(agent.description)
+            is_valid = ai_classifier_service.is_valid_description(agent.description)
 
             if not is_valid:
                 # 清除分类
@@ -1,16 +1,12 @@
 #!/bin/bash
 
-# Fast sync script - runs sync multiple times to catch up quickly
+# Fast sync script - parallel backfill up to the confirmed head, then a regular sync
+# Usage: ./fast_sync.sh [network ...]   (default: all enabled networks)
 
 echo "Starting fast sync..."
 echo "Current time: $(date)"
 
-for i in {1..15}; do
-  echo ""
-  echo "=== Sync run $i ==="
-  uv run python test_sync.py 2>&1 | grep -E "(sync_started|events_found|sync_completed|agent_created|processing_agent)"
-  sleep 1
-done
+uv run python scripts/backfill.py "$@" 2>&1 | grep -E "(backfill_started|backfill_partition_applied|backfill_completed|backfill_failed|sync_completed|✅|❌)"
 
 echo ""
 echo "Fast sync completed!"
@@ -44,7 +44,7 @@ async def reclassify_invalid_only(limit: int = None):
 
         # 找出需要清除分类的 agents
         for agent in agents:
-            is_valid = ai_classifier_service._is_valid_description(agent.description)
+            is_valid = ai_classifier_service.is_valid_description(agent.description)
             if not is_valid:
                 to_reclassify.append(agent)
 
@@ -123,7 +123,7 @@ async def reclassify_failed_only():
         invalid_count = 0
 
         for agent in agents:
-            is_valid = ai_classifier_service._is_valid_description(agent.description)
+            is_valid = ai_classifier_service.is_valid_description(agent.description)
             if is_valid:
                 valid_count += 1
             else:
@@ -0,0 +1,58 @@
+"""
+Parallel historical backfill
+
+Catches networks up to the confirmed head with parallel partition workers
+(see src/services/backfill.py). Interrupted runs resume from the last
+applied partition. The scheduled sync does the same automatically when a
+network is far behind; use this to catch up without waiting for it.
+
+Usage:
+    python scripts/backfill.py                 # all enabled networks
+    python scripts/backfill.py sepolia --workers 8 --partition-blocks 20000
+"""
+
+import sys
+import argparse
+import asyncio
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.blockchain_config import BACKFILL_WORKERS, BACKFILL_PARTITION_BLOCKS
+from src.core.networks_config import get_enabled_networks
+from src.services.blockchain_sync import get_sync_service
+import structlog
+
+logger = structlog.get_logger()
+
+
+async def backfill(network_keys: list[str], workers: int, partition_blocks: int, to_block: int = None):
+    """Backfill networks one after another (each one uses `workers` tasks)"""
+    for network_key in network_keys:
+        service = get_sync_service(network_key)
+        print(f"\n🔄 Backfilling {network_key}...")
+        blocks = await service.backfill(
+            to_block, workers=workers, partition_blocks=partition_blocks
+        )
+        print(f"✅ {network_key}: {blocks} blocks applied")
+
+        # Finish with a regular sync up to the head
+        await service.sync()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parallel historical backfill")
+    parser.add_argument("networks", nargs="*", help="Network keys (default: all enabled)")
+    parser.add_argument("--workers", type=int, default=BACKFILL_WORKERS)
+    parser.add_argument("--partition-blocks", type=int, default=BACKFILL_PARTITION_BLOCKS)
+    parser.add_argument("--to-block", type=int, default=None, help="Default: confirmed head")
+    args = parser.parse_args()
+
+    networks = args.networks or list(get_enabled_networks())
+    try:
+        asyncio.run(backfill(networks, args.workers, args.partition_blocks, args.to_block))
+    except Exception as e:
+        logger.error("backfill_script_failed", error=str(e))
+        print(f"\n❌ Backfill failed: {e}\n")
+        sys.exit(1)
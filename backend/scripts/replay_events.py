@@ -0,0 +1,52 @@
+"""
+Offline event replay
+
+Rebuilds agents, activities, reputation and sync checkpoints from the raw
+log archive into another database, without RPC calls (see
+src/services/replay.py). Replay into a fresh database, check it, then
+swap it in for the live one (stop the backend while swapping).
+
+Usage:
+    python scripts/replay_events.py --target sqlite:///./agentscan_replay.db
+    python scripts/replay_events.py sepolia --source sqlite:///./agentscan.db --target sqlite:///./replay.db
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.config import settings
+from src.core.networks_config import get_enabled_networks
+from src.services.replay import replay_databases
+import structlog
+
+logger = structlog.get_logger()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay archived events into another database")
+    parser.add_argument("networks", nargs="*", help="Network keys (default: all enabled)")
+    parser.add_argument("--source", default=settings.database_url, help="Default: DATABASE_URL")
+    parser.add_argument("--target", required=True, help="Database URL to rebuild into")
+    args = parser.parse_args()
+
+    networks = args.networks or list(get_enabled_networks())
+    try:
+        results = replay_databases(args.source, args.target, networks)
+    except Exception as e:
+        logger.error("replay_script_failed", error=str(e))
+        print(f"\n❌ Replay failed: {e}\n")
+        sys.exit(1)
+
+    for network_key, stats in results.items():
+        print(
+            f"✅ {network_key}: {stats['events']} events, {stats['agents']} agents, "
+            f"{stats['activities']} activities in {stats['seconds']}s "
+            f"({stats['events_per_second']} events/s)"
+        )
+        if stats["metadata_fetches"]:
+            print(f"   📝 {stats['metadata_fetches']} agents queued for metadata fetch")
+    print(f"\n💡 Rebuilt database: {args.target}")
@@ -14,7 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.db.database import SessionLocal
-from src.models import Agent, Activity, BlockchainSync
+from src.models import Agent, Activity, Feedback, Validation, BlockchainSync, SyncCursor, SyncRangeProgress
 from src.core.blockchain_config import START_BLOCK
 import structlog
 
@@ -38,6 +38,14 @@ def reset_database():
         activity_count = db.query(Activity).delete()
         logger.info("activities_deleted", count=activity_count)
 
+        # Delete the feedback ledger (rebuilt by the resync)
+        feedback_count = db.query(Feedback).delete()
+        logger.info("feedbacks_deleted", count=feedback_count)
+
+        # Delete the validation index (rebuilt by the resync)
+        validation_count = db.query(Validation).delete()
+        logger.info("validations_deleted", count=validation_count)
+
         # Delete all agents
         agent_count = db.query(Agent).delete()
         logger.info("agents_deleted", count=agent_count)
@@ -47,6 +55,10 @@ def reset_database():
             BlockchainSync.network_name == "sepolia"
         ).first()
 
+        # Drop the stream cursors and the backfill plan, both restart from the reset checkpoint
+        for model in (SyncCursor, SyncRangeProgress):
+            db.query(model).filter(model.network_name == "sepolia").delete()
+
         if sync_tracker:
             sync_tracker.last_block = START_BLOCK - 1
             sync_tracker.error_message = None
@@ -62,7 +74,9 @@ def reset_database():
         print(f"   Reset sync tracker to block {START_BLOCK - 1}")
         print(f"\n📌 Next steps:")
         print(f"   The blockchain sync service will automatically re-fetch all data")
-        print(f"   with correct blockchain timestamps on next sync cycle.\n")
+        print(f"   with correct blockchain timestamps on next sync cycle (parallel backfill).")
+        print(f"   Blocks already in the local log archive are replayed without RPC calls.")
+        print(f"   To catch up right away: python scripts/backfill.py sepolia\n")
 
     except Exception as e:
         db.rollback()
@@ -12,7 +12,7 @@ import asyncio
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.services.reputation_sync import reputation_sync_service
+from src.services.reputation_sync import get_reputation_sync_service
 import structlog
 
 logger = structlog.get_logger()
@@ -23,7 +23,7 @@ async def main():
     print("\n🔄 开始同步 Reputation 数据...\n")
 
     try:
-        await reputation_sync_service.sync()
+        await get_reputation_sync_service().sync()
         print("\n✅ Reputation 同步完成！\n")
     except Exception as e:
         logger.error("reputation_sync_failed", error=str(e))
@@ -1,15 +1,21 @@
 """Feedback and Validation API
 
 Endpoints for querying feedback (reviews) and validation history.
-Uses Subgraph as primary source, with on-chain fallback for agents not indexed.
+Feedback and validations are served from the local feedbacks/validations
+tables the sync fills; Subgraph (with on-chain fallback) is used while the
+network's stream is not caught up.
 """
 
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, Query, HTTPException, Depends
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 import structlog
 
 from src.db.database import get_db
-from src.models import Agent
+from src.models import Agent, Feedback, Validation, SyncCursor
 from src.schemas.feedback import (
     FeedbackListResponse,
     FeedbackResponse,
@@ -25,6 +31,11 @@ router = APIRouter()
 logger = structlog.get_logger(__name__)
 
 
+def _utc_iso(value: Optional[datetime]) -> Optional[str]:
+    """ISO 8601 string of a naive UTC datetime column (same format as the subgraph path)"""
+    return value.isoformat() + "Z" if value else None
+
+
 def _get_agent_info(agent_id: str, db: Session) -> tuple[int, str, int]:
     """
     Get agent's token_id, network_key, and reputation_count from database.
@@ -56,6 +67,135 @@ def _get_agent_info(agent_id: str, db: Session) -> tuple[int, str, int]:
     return agent.token_id, network_key, reputation_count
 
 
+def _stream_synced(db: Session, network_key: str, stream: str) -> bool:
+    """True when the network's `stream` is synced as far as its other streams"""
+    positions = dict(db.query(SyncCursor.stream, SyncCursor.last_block).filter(
+        SyncCursor.network_name == network_key
+    ).all())
+    return stream in positions and positions[stream] == max(positions.values())
+
+
+def _parse_cursor(cursor: str) -> tuple[int, int]:
+    """Keyset cursor "<block_number>-<log_index>" of the last row of a page"""
+    try:
+        block_number, log_index = cursor.split("-")
+        return int(block_number), int(log_index)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _local_feedbacks(
+    db: Session,
+    agent_id: str,
+    network_key: str,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+) -> FeedbackListResponse:
+    """Feedback page from the feedbacks table, newest first
+
+    With a cursor the page starts right after it (keyset pagination over the
+    agent/block index); without one, `page` is resolved with an offset.
+    """
+    query = db.query(Feedback).filter(Feedback.agent_id == agent_id)
+    total = query.count()
+
+    query = query.order_by(Feedback.block_number.desc(), Feedback.log_index.desc())
+    if cursor:
+        block_number, log_index = _parse_cursor(cursor)
+        query = query.filter(or_(
+            Feedback.block_number < block_number,
+            and_(Feedback.block_number == block_number, Feedback.log_index < log_index)
+        ))
+    elif page > 1:
+        query = query.offset((page - 1) * page_size)
+
+    rows = query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    items = [
+        FeedbackResponse(
+            id=f"{network_key}-{row.block_number}-{row.log_index}",
+            score=row.score,
+            client_address=row.client_address,
+            tag1=row.tag1,
+            tag2=row.tag2,
+            feedback_uri=row.feedback_uri,
+            feedback_hash=row.feedback_hash,
+            is_revoked=row.revoked,
+            timestamp=_utc_iso(row.block_timestamp),
+            block_number=row.block_number,
+            transaction_hash=row.tx_hash,
+        )
+        for row in rows
+    ]
+
+    return FeedbackListResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size if total > 0 else 1,
+        subgraph_available=False,
+        data_source="local",
+        next_cursor=f"{rows[-1].block_number}-{rows[-1].log_index}" if has_more else None,
+    )
+
+
+def _local_validations(
+    db: Session,
+    agent_id: str,
+    network_key: str,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+) -> ValidationListResponse:
+    """Validation page from the validations table, newest request first (paginated like _local_feedbacks)"""
+    query = db.query(Validation).filter(Validation.agent_id == agent_id)
+    total = query.count()
+
+    query = query.order_by(Validation.block_number.desc(), Validation.log_index.desc())
+    if cursor:
+        block_number, log_index = _parse_cursor(cursor)
+        query = query.filter(or_(
+            Validation.block_number < block_number,
+            and_(Validation.block_number == block_number, Validation.log_index < log_index)
+        ))
+    elif page > 1:
+        query = query.offset((page - 1) * page_size)
+
+    rows = query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    items = [
+        ValidationResponse(
+            id=f"{network_key}-{row.block_number}-{row.request_hash[2:10]}",
+            request_hash=row.request_hash,
+            validator_address=row.validator_address,
+            response=row.response,
+            status="COMPLETED" if row.response_block is not None else "PENDING",
+            requested_at=_utc_iso(row.requested_at),
+            completed_at=_utc_iso(row.completed_at),
+            block_number=row.block_number,
+            transaction_hash=row.tx_hash,
+        )
+        for row in rows
+    ]
+
+    return ValidationListResponse(
+        items=items,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size if total > 0 else 1,
+        subgraph_available=False,
+        data_source="local",
+        next_cursor=f"{rows[-1].block_number}-{rows[-1].log_index}" if has_more else None,
+    )
+
+
 @router.get(
     "/agents/{agent_id}/feedbacks",
     response_model=FeedbackListResponse,
@@ -64,16 +204,21 @@ async def get_agent_feedbacks(
     agent_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (keyset pagination)"),
     db: Session = Depends(get_db),
 ):
     """
     Get feedback history for an agent.
 
-    Returns a paginated list of feedbacks/reviews. Uses Subgraph as primary
-    data source, with on-chain fallback for agents not indexed by Subgraph.
+    Returns a paginated list of feedbacks/reviews, newest first. Served from
+    the local feedback ledger; Subgraph (with on-chain fallback) is only
+    queried while the network's reputation stream is still catching up.
     """
     token_id, network_key, db_reputation_count = _get_agent_info(agent_id, db)
 
+    if _stream_synced(db, network_key, "reputation"):
+        return _local_feedbacks(db, agent_id, network_key, page, page_size, cursor)
+
     subgraph = get_subgraph_service()
 
     # Check if network has subgraph support - if not, use on-chain fallback
@@ -158,17 +303,21 @@ async def get_agent_validations(
     agent_id: str,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=50, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (keyset pagination)"),
     db: Session = Depends(get_db),
 ):
     """
     Get validation history for an agent.
 
-    Returns a paginated list of validations from the Agent0 subgraph.
-    If the network doesn't have subgraph support, returns empty list with
-    subgraph_available=False.
+    Returns a paginated list of validations, newest request first. Served
+    from the local validation index; Subgraph (with on-chain fallback) is
+    only queried while the network's validation stream is not caught up.
     """
     token_id, network_key, _ = _get_agent_info(agent_id, db)
 
+    if _stream_synced(db, network_key, "validation"):
+        return _local_validations(db, agent_id, network_key, page, page_size, cursor)
+
     subgraph = get_subgraph_service()
 
     # Check if network has subgraph support - if not, use on-chain fallback
@@ -5,7 +5,6 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from web3 import Web3
 from typing import List, Dict, Any
 from pydantic import BaseModel
 
@@ -16,6 +15,8 @@ from src.schemas.common import (
     NetworkSyncStatus, MultiNetworkSyncStatus
 )
 from src.core.networks_config import NETWORKS, get_enabled_networks
+from src.services.network_registry import get_network_registry
+from src.services.rpc_client import use_shared_session
 
 
 class RegistrationTrendData(BaseModel):
@@ -61,11 +62,11 @@ async def _fetch_latest_block(network_key: str, rpc_url: str) -> tuple[str, int
     if cached is not None:
         return (network_key, cached)
 
-    # 缓存未命中，发起 RPC 请求
+    # 缓存未命中，通过网络共享的 AsyncWeb3 发起 RPC 请求（与同步任务共用节点池限流）
     try:
-        loop = asyncio.get_event_loop()
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        latest_block = await loop.run_in_executor(None, lambda: w3.eth.block_number)
+        w3 = get_network_registry().get(network_key).async_web3
+        await use_shared_session(w3)
+        latest_block = await w3.eth.block_number
         _update_block_cache(network_key, latest_block)
         return (network_key, latest_block)
     except Exception:
@@ -1,10 +1,12 @@
 """Blockchain sync status API"""
 
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from src.db.database import get_db
-from src.models import BlockchainSync
+from src.models import BlockchainSync, SyncCursor
 
 router = APIRouter()
 
@@ -27,6 +29,8 @@ async def get_sync_status(db: Session = Depends(get_db)):
             "error_message": None
         }
 
+    cursors = db.query(SyncCursor).filter(SyncCursor.network_name == sync.network_name).all()
+
     return {
         "network": sync.network_name,
         "contract_address": sync.contract_address,
@@ -35,5 +39,24 @@ async def get_sync_status(db: Session = Depends(get_db)):
         "sync_lag": (sync.current_block or 0) - sync.last_block if sync.current_block else 0,
         "status": sync.status.value,
         "last_synced_at": sync.last_synced_at.isoformat() if sync.last_synced_at else None,
-        "error_message": sync.error_message
+        "error_message": sync.error_message,
+        "streams": {cursor.stream: cursor.last_block for cursor in cursors}
     }
+
+
+@router.post("/sync/networks/{network_key}/streams/reset")
+async def reset_sync_streams(
+    network_key: str,
+    streams: list[str] = Query(..., description="Streams to replay, e.g. reputation"),
+    to_block: Optional[int] = Query(None, description="Last block kept (default: replay from start_block)"),
+):
+    """Rewind event stream cursors; the next syncs replay those streams only"""
+    from src.services.blockchain_sync import get_sync_service
+
+    try:
+        service = get_sync_service(network_key)
+        positions = await service.reset_streams(streams, to_block)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"network": network_key, "streams": positions}
@@ -97,12 +97,75 @@ REGISTRY_ABI = [
 START_BLOCK = 9989393  # Start from this block (contract deployment block)
 BLOCKS_PER_BATCH = 1000  # Process 1000 blocks at a time (reduce RPC calls)
 MAX_BATCHES_PER_RUN = 50  # Max batches to process in one sync run (50 batches = 50k blocks = ~5-10 mins)
-# Note: Interval is now controlled by CronTrigger in scheduler.py (every 10 minutes)
-# This constant is kept for reference but not actively used
-SYNC_INTERVAL_MINUTES = 2  # Sync every 10 minutes (low cost, frequent updates)
+# Default per-network sync interval (networks can override it with "sync_interval_minutes")
+SYNC_INTERVAL_MINUTES = 2  # Sync every 2 minutes (low cost, frequent updates)
+SYNC_FAILURE_BACKOFF_MAX_MINUTES = 30  # Failing networks back off up to this between runs
+
+# Live head-following: a WebSocket eth_subscribe stream when the network has a
+# ws_url, eth_newFilter polling otherwise. Range sync then only repairs gaps.
+LIVE_TAIL_ENABLED = os.getenv("LIVE_TAIL_ENABLED", "true").lower() in ("1", "true", "yes")
+# Filter polling costs more requests than the scheduled range sync, so networks
+# without a ws_url only follow the head when this is enabled
+LIVE_TAIL_POLLING_ENABLED = os.getenv("LIVE_TAIL_POLLING_ENABLED", "false").lower() in ("1", "true", "yes")
+LIVE_TAIL_POLL_SECONDS = 4  # eth_getFilterChanges interval (filter polling mode)
+LIVE_TAIL_CHECKPOINT_SECONDS = 60  # Empty polls advance the checkpoint at most this often
+LIVE_TAIL_RECONNECT_MAX_SECONDS = 60  # Reconnect backoff cap
+
+# Reorg safety: blocks within this many blocks of the head are not final; their
+# hashes are kept and the checkpoint is verified against the chain before each
+# range/live batch (networks can override it with "confirmation_depth")
+DEFAULT_CONFIRMATION_DEPTH = 64
+
+# Historical backfill: a network more than BACKFILL_THRESHOLD_BLOCKS behind the
+# confirmed head is caught up by parallel workers fetching fixed partitions,
+# applied in block order with a checkpoint per partition (sync_range_progress)
+BACKFILL_THRESHOLD_BLOCKS = 100000
+BACKFILL_PARTITION_BLOCKS = int(os.getenv("BACKFILL_PARTITION_BLOCKS", "50000"))
+BACKFILL_WORKERS = int(os.getenv("BACKFILL_WORKERS", "4"))  # Partitions fetched concurrently
+BACKFILL_MAX_ATTEMPTS = 3  # Fetch attempts per partition before the backfill stops
+
+# Raw log archive (raw_logs table): fetched logs are kept locally and archived
+# block ranges are never fetched from the RPC again
+LOG_ARCHIVE_ENABLED = os.getenv("LOG_ARCHIVE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Reputation is aggregated locally from feedback events (feedbacks table); every
+# interval a random sample of agents with feedback is checked against getSummary
+REPUTATION_RECONCILE_INTERVAL_MINUTES = int(os.getenv("REPUTATION_RECONCILE_INTERVAL_MINUTES", "60"))
+REPUTATION_RECONCILE_SAMPLE_SIZE = int(os.getenv("REPUTATION_RECONCILE_SAMPLE_SIZE", "100"))  # 0 = disabled
+
+# On-chain fallback scans (feedback/validation history of agents without subgraph
+# data): block chunks fetched concurrently through the network's rate-limited RPC pool
+FALLBACK_SCAN_CHUNK_BLOCKS = 50000
+FALLBACK_SCAN_CONCURRENCY = int(os.getenv("FALLBACK_SCAN_CONCURRENCY", "4"))  # Chunks in flight per scan
+# Agents whose confirmed feedback events the fallback keeps in memory (least recently used evicted)
+FALLBACK_FEEDBACK_CACHE_AGENTS = int(os.getenv("FALLBACK_FEEDBACK_CACHE_AGENTS", "1000"))
+
 MAX_RETRIES = 1  # Max retry attempts for failed operations
 RETRY_DELAY_SECONDS = 5  # Delay between retries
-REQUEST_DELAY_SECONDS = 0.5  # Delay between individual requests to avoid rate limiting
+
+# Pipelined sync configuration
+# Ranges fetched ahead of processing (0 = fetch and process each range sequentially)
+SYNC_PREFETCH_DEPTH = int(os.getenv("SYNC_PREFETCH_DEPTH", "3"))
+# RPC request budget per endpoint (requests per second, bursts up to the same amount)
+# Networks can override it with "rpc_rate_limit" in networks_config.py
+RPC_MAX_REQUESTS_PER_SECOND = float(os.getenv("RPC_MAX_REQUESTS_PER_SECOND", "5"))
 
 # IPFS gateway
 IPFS_GATEWAY = "https://ipfs.io/ipfs/"
+
+# Metadata fetching (shared pooled client, bounded concurrency)
+METADATA_FETCH_TIMEOUT_SECONDS = 10
+METADATA_MAX_CONCURRENCY = 32  # Concurrent metadata fetches in total
+METADATA_PER_HOST_CONCURRENCY = 6  # Concurrent fetches per host (keeps IPFS gateways happy)
+# Persistent metadata cache (SQLite file, empty = disabled); IPFS documents never expire,
+# HTTP documents are revalidated with ETag / Last-Modified
+METADATA_CACHE_PATH = os.getenv("METADATA_CACHE_PATH", "./metadata_cache.db")
+METADATA_CACHE_MAX_BYTES = int(os.getenv("METADATA_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Enrichment queue (metadata fetch + classification, decoupled from chain sync)
+ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", "8"))  # Concurrent jobs
+ENRICHMENT_BATCH_SIZE = 100  # Jobs claimed per drain round
+ENRICHMENT_POLL_SECONDS = 10  # Queue polling interval
+ENRICHMENT_MAX_ATTEMPTS = 5  # Attempts before a job is marked failed
+ENRICHMENT_RETRY_BASE_SECONDS = 60  # Retry backoff: base * 2^(attempt - 1)
+ENRICHMENT_STALE_MINUTES = 15  # Running jobs older than this are requeued (crashed worker)
@@ -1,20 +1,38 @@
 """Multi-network configuration for ERC-8004"""
 
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 from dotenv import load_dotenv
 
 # 加载 .env 文件
 load_dotenv()
 
+
+def _env_urls(name: str) -> List[str]:
+    """Comma-separated URL list from an environment variable"""
+    return [url.strip() for url in os.getenv(name, "").split(",") if url.strip()]
+
+
 # Network configurations
 # RPC URLs are loaded from environment variables to prevent exposure
 # Updated: Jan 2026 Test Net deployment
+# blocks_per_batch is the initial eth_getLogs window; the sync adapts it per run
+# (optional min_blocks_per_batch / max_blocks_per_batch bound the adaptive window)
+# rpc_urls are fallback endpoints used alongside rpc_url; requests go to the
+# healthiest one and fail over on throttling/outages (optional rpc_rate_limit
+# overrides RPC_MAX_REQUESTS_PER_SECOND per endpoint)
+# Every enabled network gets its own sync job (optional sync_interval_minutes
+# overrides SYNC_INTERVAL_MINUTES) and, with LIVE_TAIL_ENABLED, a live tail that
+# subscribes over ws_url when set and polls an eth_newFilter otherwise
+# (live_tail: False opts a network out)
+# confirmation_depth overrides DEFAULT_CONFIRMATION_DEPTH (reorg-protected window)
 NETWORKS: Dict[str, Dict[str, Any]] = {
     "sepolia": {
         "name": "Sepolia",
         "chain_id": 11155111,
         "rpc_url": os.getenv("SEPOLIA_RPC_URL", ""),
+        "rpc_urls": _env_urls("SEPOLIA_RPC_URLS"),
+        "ws_url": os.getenv("SEPOLIA_WS_URL", ""),
         "explorer_url": "https://sepolia.etherscan.io",
         "contracts": {
             "identity": "0x8004A818BFB912233c491871b3d84c89A494BD9e",
@@ -30,6 +48,8 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "name": "Base Sepolia",
         "chain_id": 84532,
         "rpc_url": os.getenv("BASE_SEPOLIA_RPC_URL", ""),
+        "rpc_urls": _env_urls("BASE_SEPOLIA_RPC_URLS"),
+        "ws_url": os.getenv("BASE_SEPOLIA_WS_URL", ""),
         "explorer_url": "https://sepolia.basescan.org",
         "contracts": {
             "identity": "",  # to be deployed
@@ -56,6 +76,8 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "name": "Polygon Amoy",
         "chain_id": 80002,
         "rpc_url": os.getenv("POLYGON_AMOY_RPC_URL", ""),
+        "rpc_urls": _env_urls("POLYGON_AMOY_RPC_URLS"),
+        "ws_url": os.getenv("POLYGON_AMOY_WS_URL", ""),
         "explorer_url": "https://amoy.polygonscan.com",
         "contracts": {
             "identity": "",  # to be deployed
@@ -82,6 +104,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "name": "HyperEVM Testnet",
         "chain_id": 998,  # Placeholder - need actual chain ID
         "rpc_url": os.getenv("HYPEREVM_TESTNET_RPC_URL", ""),
+        "rpc_urls": _env_urls("HYPEREVM_TESTNET_RPC_URLS"),
         "explorer_url": "",
         "contracts": {
             "identity": "",  # to be deployed
@@ -95,6 +118,7 @@ NETWORKS: Dict[str, Dict[str, Any]] = {
         "name": "SKALE Testnet",
         "chain_id": 0,  # Placeholder - need actual chain ID
         "rpc_url": os.getenv("SKALE_TESTNET_RPC_URL", ""),
+        "rpc_urls": _env_urls("SKALE_TESTNET_RPC_URLS"),
         "explorer_url": "",
         "contracts": {
             "identity": "",  # to be deployed
@@ -115,3 +139,9 @@ def get_enabled_networks():
 def get_network(network_key: str):
     """Get network configuration by key"""
     return NETWORKS.get(network_key)
+
+# Get all RPC endpoints of a network
+def get_rpc_urls(network_config: Dict[str, Any]) -> List[str]:
+    """Primary rpc_url followed by the rpc_urls fallbacks, without duplicates"""
+    urls = [network_config.get("rpc_url", "")] + list(network_config.get("rpc_urls", []))
+    return list(dict.fromkeys(url for url in urls if url))
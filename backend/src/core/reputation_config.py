@@ -81,3 +81,40 @@ REPUTATION_REGISTRY_ABI = [
 # Updated: Jan 2026 Test Net deployment block
 REPUTATION_START_BLOCK = 9989393  # Same as identity registry
 REPUTATION_BLOCKS_PER_BATCH = 10000
+
+# Multicall3 (same address on most EVM chains, see https://www.multicall3.com)
+# Used to batch getSummary reads; networks can override it via contracts["multicall3"]
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"}
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+MULTICALL_CHUNK_SIZE = 100  # getSummary calls per aggregate3 / JSON-RPC batch
@@ -0,0 +1,29 @@
+"""Validation Registry Configuration"""
+
+# Validation Registry ABI (minimal, only needed events)
+VALIDATION_REGISTRY_ABI = [
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "validatorAddress", "type": "address"},
+            {"indexed": True, "internalType": "uint256", "name": "agentId", "type": "uint256"},
+            {"indexed": False, "internalType": "string", "name": "requestUri", "type": "string"},
+            {"indexed": True, "internalType": "bytes32", "name": "requestHash", "type": "bytes32"},
+        ],
+        "name": "ValidationRequest",
+        "type": "event",
+    },
+    {
+        "anonymous": False,
+        "inputs": [
+            {"indexed": True, "internalType": "address", "name": "validatorAddress", "type": "address"},
+            {"indexed": True, "internalType": "uint256", "name": "agentId", "type": "uint256"},
+            {"indexed": True, "internalType": "bytes32", "name": "requestHash", "type": "bytes32"},
+            {"indexed": False, "internalType": "uint8", "name": "response", "type": "uint8"},
+            {"indexed": False, "internalType": "string", "name": "responseUri", "type": "string"},
+            {"indexed": False, "internalType": "bytes32", "name": "tag", "type": "bytes32"},
+        ],
+        "name": "ValidationResponse",
+        "type": "event",
+    },
+]
@@ -0,0 +1,71 @@
+"""Migration: Add block position fields to agents and activities
+
+agents.registered_block and activities.block_number/log_index record which
+log produced a row, so rows written from blocks dropped by a chain reorg can
+be rolled back.
+"""
+
+import sqlite3
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def migrate():
+    """Add registered_block to agents and block_number/log_index to activities"""
+    # Get database path from environment variable or use default
+    db_url = os.getenv("DATABASE_URL", "sqlite:///./8004scan.db")
+
+    if db_url.startswith("sqlite:///"):
+        db_path = db_url.replace("sqlite:///", "")
+        # Remove leading ./ if present
+        if db_path.startswith("./"):
+            db_path = db_path[2:]
+        # Handle relative path
+        if not db_path.startswith("/"):
+            db_path = Path(__file__).parent.parent.parent / db_path
+    else:
+        print("❌ This migration only works with SQLite databases")
+        return
+
+    db_path = Path(db_path)
+    if not db_path.exists():
+        print(f"⚠️ Database does not exist yet: {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    new_columns = {
+        "agents": [("registered_block", "BIGINT")],
+        "activities": [("block_number", "BIGINT"), ("log_index", "INTEGER")],
+    }
+    for table, table_columns in new_columns.items():
+        # Check which columns exist
+        cursor.execute(f"PRAGMA table_info({table})")
+        columns = [col[1] for col in cursor.fetchall()]
+
+        for column, column_type in table_columns:
+            if column not in columns:
+                print(f"Adding {table}.{column} column...")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+                conn.commit()
+                print(f"✅ {table}.{column} column added")
+            else:
+                print(f"✅ {table}.{column} column already exists")
+
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS ix_agents_registered_block ON agents (registered_block)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS ix_activities_block_number ON activities (block_number)"
+    )
+    conn.commit()
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,120 @@
+"""Migration: Backfill the feedback ledger
+
+Adds feedbacks columns/indexes introduced after the table itself (the
+block timestamp and the agent feed index behind the feedback API), and
+clears tag1 values stored as the topic hash of the indexed tag.
+
+Reputation is now aggregated from the feedbacks table, which only the
+sync fills. On an existing database the table starts empty while agents
+already have reputation, so the reputation stream cursor is moved back
+to the network's start block: the next syncs replay that stream only
+(from the local log archive where available) and rebuild the ledger. Agents keep
+their current reputation until the stream has caught up, then all of it is
+recomputed from the full ledger at once.
+"""
+
+import sqlite3
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+from src.core.networks_config import get_network
+
+load_dotenv()
+
+
+def migrate():
+    """Rewind reputation stream cursors when the feedback ledger is empty"""
+    # Get database path from environment variable or use default
+    db_url = os.getenv("DATABASE_URL", "sqlite:///./8004scan.db")
+
+    if db_url.startswith("sqlite:///"):
+        db_path = db_url.replace("sqlite:///", "")
+        # Remove leading ./ if present
+        if db_path.startswith("./"):
+            db_path = db_path[2:]
+        # Handle relative path
+        if not db_path.startswith("/"):
+            db_path = Path(__file__).parent.parent.parent / db_path
+    else:
+        print("❌ This migration only works with SQLite databases")
+        return
+
+    db_path = Path(db_path)
+    if not db_path.exists():
+        print(f"⚠️ Database does not exist yet: {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("PRAGMA table_info(feedbacks)")
+        columns = [col[1] for col in cursor.fetchall()]
+        if "block_timestamp" not in columns:
+            print("Adding feedbacks.block_timestamp column...")
+            cursor.execute("ALTER TABLE feedbacks ADD COLUMN block_timestamp DATETIME")
+            print("✅ feedbacks.block_timestamp column added")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS ix_feedbacks_agent_block ON feedbacks (agent_id, block_number, log_index)"
+        )
+        cursor.execute("UPDATE feedbacks SET tag1 = NULL WHERE tag1 IS NOT NULL")
+        if cursor.rowcount:
+            print(f"✅ Cleared {cursor.rowcount} feedbacks.tag1 topic hashes")
+        conn.commit()
+
+        cursor.execute("SELECT COUNT(*) FROM feedbacks")
+        if cursor.fetchone()[0] > 0:
+            print("✅ Feedback ledger already populated")
+            return
+
+        cursor.execute("SELECT COUNT(*) FROM agents WHERE reputation_count > 0")
+        if cursor.fetchone()[0] == 0:
+            print("✅ No existing reputation, feedback ledger fills as feedback is synced")
+            return
+
+        cursor.execute("SELECT network_name, last_block FROM blockchain_syncs")
+        for network_name, last_block in cursor.fetchall():
+            config = get_network(network_name)
+            contracts = (config or {}).get("contracts", {})
+            if not contracts.get("reputation"):
+                continue
+            replay_from = config.get("start_block", 0) - 1
+
+            cursor.execute(
+                "SELECT stream FROM sync_cursors WHERE network_name = ?", (network_name,)
+            )
+            streams = [row[0] for row in cursor.fetchall()]
+            if not streams:
+                # Cursors not created yet: identity keeps the network checkpoint
+                cursor.execute(
+                    "INSERT INTO sync_cursors (network_name, stream, contract_address, last_block, created_at, updated_at) "
+                    "VALUES (?, 'identity', ?, ?, datetime('now'), datetime('now'))",
+                    (network_name, contracts["identity"], last_block)
+                )
+            if "reputation" in streams:
+                cursor.execute(
+                    "UPDATE sync_cursors SET last_block = MIN(last_block, ?), updated_at = datetime('now') "
+                    "WHERE network_name = ? AND stream = 'reputation'",
+                    (replay_from, network_name)
+                )
+            else:
+                cursor.execute(
+                    "INSERT INTO sync_cursors (network_name, stream, contract_address, last_block, created_at, updated_at) "
+                    "VALUES (?, 'reputation', ?, ?, datetime('now'), datetime('now'))",
+                    (network_name, contracts["reputation"], replay_from)
+                )
+            cursor.execute(
+                "UPDATE blockchain_syncs SET last_block = "
+                "(SELECT MIN(last_block) FROM sync_cursors WHERE network_name = ?) WHERE network_name = ?",
+                (network_name, network_name)
+            )
+            print(f"✅ {network_name}: reputation stream will be replayed from block {replay_from + 1}")
+
+        conn.commit()
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,55 @@
+"""Migration: Add learned_window field to blockchain_syncs table
+
+Stores the adaptive eth_getLogs block window per network so it survives restarts.
+"""
+
+import sqlite3
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def migrate():
+    """Add learned_window INTEGER field to blockchain_syncs table"""
+    # Get database path from environment variable or use default
+    db_url = os.getenv("DATABASE_URL", "sqlite:///./8004scan.db")
+
+    if db_url.startswith("sqlite:///"):
+        db_path = db_url.replace("sqlite:///", "")
+        # Remove leading ./ if present
+        if db_path.startswith("./"):
+            db_path = db_path[2:]
+        # Handle relative path
+        if not db_path.startswith("/"):
+            db_path = Path(__file__).parent.parent.parent / db_path
+    else:
+        print("❌ This migration only works with SQLite databases")
+        return
+
+    db_path = Path(db_path)
+    if not db_path.exists():
+        print(f"⚠️ Database does not exist yet: {db_path}")
+        return
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Check if column exists
+    cursor.execute("PRAGMA table_info(blockchain_syncs)")
+    columns = [col[1] for col in cursor.fetchall()]
+
+    if "learned_window" not in columns:
+        print("Adding learned_window column...")
+        cursor.execute("ALTER TABLE blockchain_syncs ADD COLUMN learned_window INTEGER")
+        conn.commit()
+        print("✅ learned_window column added")
+    else:
+        print("✅ learned_window column already exists")
+
+    conn.close()
+
+
+if __name__ == "__main__":
+    migrate()
@@ -2,14 +2,18 @@
 
 This script provides a complete database reset solution:
 1. Backup current database (optional)
-2. Drop all tables
+2. Drop all tables (except the chain archive, unless --drop-archive)
 3. Recreate schema
 4. Run all migrations
 5. Initialize networks
 6. Resync blockchain data
 
+The chain archive (raw logs and block timestamps) only holds data read from
+the chain, so a resync after a reset replays it locally instead of
+re-downloading every log from the RPC provider.
+
 Usage:
-    python -m src.db.reset_database [--backup] [--resync]
+    python -m src.db.reset_database [--backup] [--resync] [--drop-archive]
 """
 
 import os
@@ -30,6 +34,9 @@ from src.db.migrate_multi_network import migrate as migrate_multi_network
 from src.db.migrate_network_ids import migrate as migrate_network_ids
 from src.db.init_networks import init_networks
 
+# Tables holding raw chain data, kept across resets by default
+ARCHIVE_TABLES = ("raw_logs", "log_archive_ranges", "block_timestamps")
+
 
 def get_db_path():
     """Get database path from environment"""
@@ -60,8 +67,8 @@ def backup_database(db_path: Path):
     return backup_path
 
 
-def drop_all_tables(db_path: Path):
-    """Drop all tables in database"""
+def drop_all_tables(db_path: Path, keep_archive: bool = True):
+    """Drop all tables in database (except ARCHIVE_TABLES if keep_archive)"""
     if not db_path.exists():
         print("⚠️  Database does not exist, skipping drop")
         return
@@ -78,6 +85,9 @@ def drop_all_tables(db_path: Path):
 
         # Drop all tables
         for table in tables:
+            if keep_archive and table in ARCHIVE_TABLES:
+                print(f"   - Keeping archive table: {table}")
+                continue
             print(f"   - Dropping table: {table}")
             cursor.execute(f"DROP TABLE IF EXISTS {table}")
 
@@ -149,7 +159,7 @@ def reset_sync_status():
         conn.close()
 
 
-def main(backup: bool = False, resync: bool = False):
+def main(backup: bool = False, resync: bool = False, drop_archive: bool = False):
     """Main reset function"""
     print("=" * 60)
     print("🔄 DATABASE RESET TOOL")
@@ -166,7 +176,7 @@ def main(backup: bool = False, resync: bool = False):
         print()
 
     # Step 2: Drop all tables
-    drop_all_tables(db_path)
+    drop_all_tables(db_path, keep_archive=not drop_archive)
     print()
 
     # Step 3: Create schema
@@ -205,6 +215,7 @@ if __name__ == "__main__":
     # Parse arguments
     backup = "--backup" in sys.argv
     resync = "--resync" in sys.argv
+    drop_archive = "--drop-archive" in sys.argv
 
     # Confirm reset
     print("⚠️  WARNING: This will DELETE ALL DATA in the database!")
@@ -212,11 +223,13 @@ if __name__ == "__main__":
         print("✓ Backup will be created")
     if resync:
         print("✓ Blockchain sync will be reset")
+    if drop_archive:
+        print("✓ Chain archive (raw logs, block timestamps) will be deleted too")
     print()
 
     response = input("Are you sure you want to continue? (yes/no): ")
 
     if response.lower() == "yes":
-        main(backup=backup, resync=resync)
+        main(backup=backup, resync=resync, drop_archive=drop_archive)
     else:
         print("❌ Reset cancelled")
@@ -1,6 +1,9 @@
 """Reset blockchain sync status for a specific network
 
 This script resets the sync status for a network, allowing it to rescan from the start block.
+Every event stream cursor (sync_cursors) is moved back before the start block and the
+network's backfill partitions (sync_range_progress) are dropped; the BlockchainSync
+checkpoint follows the cursors.
 
 Usage:
     python -m src.db.reset_sync_status <network_key>
@@ -10,109 +13,54 @@ Example:
 """
 
 import sys
-import sqlite3
-import os
-from pathlib import Path
+import asyncio
 from dotenv import load_dotenv
 
+from src.core.networks_config import NETWORKS, get_network
+from src.db.database import SessionLocal
+from src.models import Agent, Network
+
 # 加载 .env 文件
 load_dotenv()
 
 
 def reset_sync_status(network_key: str):
     """Reset sync status for a specific network"""
-
-    # Get database path from environment variable or use default
-    db_url = os.getenv("DATABASE_URL", "sqlite:///./8004scan.db")
-
-    if db_url.startswith("sqlite:///"):
-        db_path = db_url.replace("sqlite:///", "")
-        # Handle relative path
-        if not db_path.startswith("/"):
-            db_path = Path(__file__).parent.parent.parent / db_path
-    else:
-        print("❌ This script only works with SQLite databases")
+    config = get_network(network_key)
+    if not config:
+        print(f"❌ Network '{network_key}' not found in configuration")
+        print("\n📋 Available networks:")
+        for key, net in NETWORKS.items():
+            print(f"   - {key}: {net['name']} (Chain ID: {net['chain_id']})")
         return
 
-    print(f"📊 Connecting to database: {db_path}")
+    from src.services.blockchain_sync import get_sync_service
 
-    db_path = Path(db_path)
-    if not db_path.exists():
-        print("❌ Database does not exist")
-        return
+    service = get_sync_service(network_key)
+    print(f"✅ Found network: {config['name']} (Chain ID: {config['chain_id']})")
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    positions = asyncio.run(service.reset_streams(list(service.stream_contracts)))
+    print("\n🗑️  Rewound sync cursors and dropped backfill partitions:")
+    for stream, block in positions.items():
+        print(f"   - {stream}: last block {block}")
 
+    # Check existing agents for this network
+    db = SessionLocal()
     try:
-        # Get network info
-        cursor.execute(
-            "SELECT id, name, chain_id FROM networks WHERE id = ?",
-            (network_key,)
-        )
-        network = cursor.fetchone()
-
-        if not network:
-            print(f"❌ Network '{network_key}' not found in database")
-            print("\n📋 Available networks:")
-            cursor.execute("SELECT id, name, chain_id FROM networks")
-            for net in cursor.fetchall():
-                print(f"   - {net[0]}: {net[1]} (Chain ID: {net[2]})")
-            return
-
-        network_id, network_name, chain_id = network
-        print(f"✅ Found network: {network_name} (Chain ID: {chain_id})")
-
-        # Check current sync status
-        cursor.execute(
-            """SELECT last_block, current_block, status, last_synced_at
-               FROM blockchain_sync
-               WHERE network_id = ?""",
-            (network_id,)
-        )
-        sync_status = cursor.fetchone()
-
-        if sync_status:
-            last_block, current_block, status, last_synced = sync_status
-            print(f"\n📊 Current sync status:")
-            print(f"   - Last block: {last_block}")
-            print(f"   - Current block: {current_block}")
-            print(f"   - Status: {status}")
-            print(f"   - Last synced: {last_synced}")
-
-            # Delete sync status to trigger rescan
-            cursor.execute(
-                "DELETE FROM blockchain_sync WHERE network_id = ?",
-                (network_id,)
-            )
-            print(f"\n🗑️  Deleted sync status for {network_name}")
-        else:
-            print(f"\n⚠️  No sync status found for {network_name} (will start fresh)")
-
-        # Check existing agents for this network
-        cursor.execute(
-            "SELECT COUNT(*) FROM agents WHERE network_id = ?",
-            (network_id,)
-        )
-        agent_count = cursor.fetchone()[0]
-
-        if agent_count > 0:
-            print(f"\n⚠️  Found {agent_count} existing agents for {network_name}")
-            print("   These agents will NOT be deleted (unique constraint will prevent duplicates)")
-
-        conn.commit()
-        print(f"\n✅ Reset completed! Next sync will scan from start block.")
-        print(f"\n🚀 To trigger sync manually:")
-        print(f"   curl -X POST http://localhost:8000/api/sync/networks/{network_key}")
-        print(f"\n⏰ Or wait for the next scheduled sync (every 2 minutes)")
-
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        conn.rollback()
-        raise
-
+        agent_count = db.query(Agent).join(Network, Agent.network_id == Network.id).filter(
+            Network.chain_id == config["chain_id"]
+        ).count()
     finally:
-        conn.close()
+        db.close()
+
+    if agent_count > 0:
+        print(f"\n⚠️  Found {agent_count} existing agents for {config['name']}")
+        print("   These agents will NOT be deleted (unique constraint will prevent duplicates)")
+
+    print(f"\n✅ Reset completed! Next sync will scan from start block.")
+    print(f"\n🚀 To trigger sync manually:")
+    print(f"   curl -X POST http://localhost:8000/api/sync/networks/{network_key}")
+    print(f"\n⏰ Or wait for the next scheduled sync (every 2 minutes)")
 
 
 if __name__ == "__main__":
@@ -7,12 +7,18 @@ from src.core.config import settings
 from src.db.database import engine, Base
 from src.api import stats, agents, sync, networks, activities, classification, feedback, endpoint_health
 from src.services.scheduler import start_scheduler, shutdown_scheduler
+from src.services.sync_orchestrator import get_sync_orchestrator
+from src.services.rpc_client import close_http_session
+from src.services.metadata_fetcher import close_metadata_fetcher
 from src.db.migrate_add_contracts import migrate as migrate_contracts
 from src.db.migrate_add_oasf_fields import migrate as migrate_oasf
 from src.db.migrate_add_classification_source import migrate as migrate_classification_source
 from src.db.migrate_multi_network import migrate as migrate_multi_network
 from src.db.migrate_network_ids import migrate as migrate_network_ids
 from src.db.migrate_add_endpoint_status import migrate as migrate_endpoint_status
+from src.db.migrate_add_sync_window import migrate as migrate_sync_window
+from src.db.migrate_add_block_refs import migrate as migrate_block_refs
+from src.db.migrate_add_feedback_ledger import migrate as migrate_feedback_ledger
 from src.db.init_networks import init_networks
 
 # Create database tables
@@ -26,6 +32,9 @@ try:
     migrate_multi_network()
     migrate_network_ids()  # Fix orphaned network_id references
     migrate_endpoint_status()  # Add endpoint health check fields
+    migrate_sync_window()  # Add adaptive getLogs window to sync trackers
+    migrate_block_refs()  # Add block positions used by reorg rollback
+    migrate_feedback_ledger()  # Replay the reputation stream into the feedback ledger
 except Exception as e:
     print(f"Migration warning: {e}")
 
@@ -71,6 +80,12 @@ async def shutdown_event():
     """Application shutdown event"""
     # Shutdown scheduler
     shutdown_scheduler()
+    # Stop live head-following
+    await get_sync_orchestrator().stop()
+    # Close pooled RPC connections
+    await close_http_session()
+    # Close pooled metadata connections
+    await close_metadata_fetcher()
 
 
 @app.get("/")
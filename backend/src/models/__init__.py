@@ -3,7 +3,15 @@
 from src.models.agent import Agent, AgentStatus, SyncStatus
 from src.models.network import Network
 from src.models.activity import Activity, ActivityType
+from src.models.feedback import Feedback
+from src.models.validation import Validation
 from src.models.blockchain_sync import BlockchainSync, SyncStatusEnum
+from src.models.block_timestamp import BlockTimestamp
+from src.models.block_hash import BlockHash
+from src.models.raw_log import RawLog, LogArchiveRange
+from src.models.sync_cursor import SyncCursor
+from src.models.sync_range_progress import SyncRangeProgress, RangeProgressStatus
+from src.models.enrichment_job import EnrichmentJob, EnrichmentJobType, EnrichmentJobStatus
 
 __all__ = [
     "Agent",
@@ -12,6 +20,18 @@ __all__ = [
     "Network",
     "Activity",
     "ActivityType",
+    "Feedback",
+    "Validation",
     "BlockchainSync",
     "SyncStatusEnum",
+    "BlockTimestamp",
+    "BlockHash",
+    "RawLog",
+    "LogArchiveRange",
+    "SyncCursor",
+    "SyncRangeProgress",
+    "RangeProgressStatus",
+    "EnrichmentJob",
+    "EnrichmentJobType",
+    "EnrichmentJobStatus",
 ]
@@ -3,7 +3,7 @@
 import uuid
 import enum
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, DateTime, ForeignKey
+from sqlalchemy import Column, String, Enum, DateTime, ForeignKey, BigInteger, Integer
 from sqlalchemy.orm import relationship
 
 from src.db.database import Base
@@ -27,6 +27,8 @@ class Activity(Base):
     activity_type = Column(Enum(ActivityType), nullable=False)
     description = Column(String, nullable=False)
     tx_hash = Column(String, nullable=True)
+    block_number = Column(BigInteger, nullable=True, index=True)  # 产生该活动的链上事件位置（用于 reorg 回滚）
+    log_index = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # 关系
@@ -2,7 +2,7 @@
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Float, Enum, DateTime, ForeignKey, Integer, JSON, Text, UniqueConstraint
+from sqlalchemy import Column, String, Float, Enum, DateTime, ForeignKey, Integer, BigInteger, JSON, Text, UniqueConstraint
 from sqlalchemy.orm import relationship
 import enum
 
@@ -49,6 +49,7 @@ class Agent(Base):
     on_chain_data = Column(JSON, nullable=True)
     last_synced_at = Column(DateTime, nullable=True)
     sync_status = Column(Enum(SyncStatus), default=SyncStatus.SYNCING)
+    registered_block = Column(BigInteger, nullable=True, index=True)  # Block of the Registered event
 
     # Reputation data fields
     reputation_count = Column(Integer, nullable=False, default=0)  # Number of feedbacks
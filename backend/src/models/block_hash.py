@@ -0,0 +1,20 @@
+"""Recent block hash model (reorg detection)"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, JSON
+
+from src.db.database import Base
+
+
+class BlockHash(Base):
+    """Hash of a synced block that is not yet final
+
+    Kept for blocks within a network's confirmation depth of the head, so a
+    reorg under the sync checkpoint can be detected and rolled back.
+    """
+
+    __tablename__ = "block_hashes"
+
+    chain_id = Column(Integer, primary_key=True, autoincrement=False)
+    block_number = Column(BigInteger, primary_key=True, autoincrement=False)
+    block_hash = Column(String, nullable=False)
+    touched_tokens = Column(JSON, nullable=True)  # Agent token IDs written from this block
@@ -0,0 +1,15 @@
+"""Block timestamp cache model"""
+
+from sqlalchemy import Column, Integer, BigInteger
+
+from src.db.database import Base
+
+
+class BlockTimestamp(Base):
+    """Block number -> timestamp cache, shared by sync runs and backfills"""
+
+    __tablename__ = "block_timestamps"
+
+    chain_id = Column(Integer, primary_key=True, autoincrement=False)
+    block_number = Column(BigInteger, primary_key=True, autoincrement=False)
+    timestamp = Column(BigInteger, nullable=False)  # Unix seconds
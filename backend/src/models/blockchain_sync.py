@@ -26,6 +26,7 @@ class BlockchainSync(Base):
     contract_address = Column(String, nullable=False)
     last_block = Column(Integer, nullable=False, default=0)
     current_block = Column(Integer, nullable=True)
+    learned_window = Column(Integer, nullable=True)  # Adaptive eth_getLogs window (blocks), kept across runs
     status = Column(Enum(SyncStatusEnum), nullable=False, default=SyncStatusEnum.IDLE)
     error_message = Column(String, nullable=True)
     last_synced_at = Column(DateTime, nullable=True)
@@ -0,0 +1,42 @@
+"""Enrichment job model"""
+
+import enum
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, ForeignKey, Index
+
+from src.db.database import Base
+
+
+class EnrichmentJobType(str, enum.Enum):
+    """Enrichment job type"""
+
+    FETCH_METADATA = "fetch_metadata"  # Resolve metadata_uri, update name/description/OASF
+    CLASSIFY = "classify"  # AI classification of skills/domains from the description
+
+
+class EnrichmentJobStatus(str, enum.Enum):
+    """Enrichment job status (finished jobs are deleted)"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"  # Gave up after ENRICHMENT_MAX_ATTEMPTS
+
+
+class EnrichmentJob(Base):
+    """Persistent queue entry for asynchronous agent enrichment"""
+
+    __tablename__ = "enrichment_jobs"
+    __table_args__ = (
+        Index("ix_enrichment_jobs_due", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    agent_id = Column(String, ForeignKey("agents.id"), nullable=False, index=True)
+    job_type = Column(Enum(EnrichmentJobType), nullable=False)
+    status = Column(Enum(EnrichmentJobStatus), nullable=False, default=EnrichmentJobStatus.PENDING)
+    metadata_uri = Column(Text, nullable=True)  # URI to resolve (FETCH_METADATA)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    run_after = Column(DateTime, nullable=False, default=datetime.utcnow)  # Retry backoff
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
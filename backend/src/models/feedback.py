@@ -0,0 +1,41 @@
+"""Feedback ledger model"""
+
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, ForeignKey, Text, UniqueConstraint, Index
+
+from src.db.database import Base
+
+
+class Feedback(Base):
+    """One NewFeedback given to an agent, as synced from the reputation registry
+
+    FeedbackRevoked events set `revoked`; an agent's reputation is the
+    count and average score of its unrevoked feedback.
+    """
+
+    __tablename__ = "feedbacks"
+    __table_args__ = (
+        # A client's feedback index is unique per agent (FeedbackRevoked refers to it)
+        UniqueConstraint("agent_id", "client_address", "feedback_index", name="uq_feedback_client_index"),
+        # Feedback pages of an agent, newest first (keyset pagination, scanned backwards)
+        Index("ix_feedbacks_agent_block", "agent_id", "block_number", "log_index"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    agent_id = Column(String, ForeignKey("agents.id"), nullable=False, index=True)
+    client_address = Column(String, nullable=False)
+    feedback_index = Column(BigInteger, nullable=False)
+    score = Column(Integer, nullable=False)
+    tag1 = Column(String, nullable=True)  # Indexed in NewFeedback, so not recoverable from logs (NULL when synced)
+    tag2 = Column(String, nullable=True)
+    endpoint = Column(Text, nullable=True)
+    feedback_uri = Column(Text, nullable=True)
+    feedback_hash = Column(String, nullable=True)
+    revoked = Column(Boolean, nullable=False, default=False)
+    revoked_block = Column(BigInteger, nullable=True)  # Block of the FeedbackRevoked event
+    block_number = Column(BigInteger, nullable=False, index=True)
+    log_index = Column(Integer, nullable=False)
+    tx_hash = Column(String, nullable=True)
+    block_timestamp = Column(DateTime, nullable=True)  # Time of the NewFeedback block
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
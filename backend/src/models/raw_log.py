@@ -0,0 +1,40 @@
+"""Raw log archive models"""
+
+from sqlalchemy import Column, Integer, BigInteger, String, Text, JSON, Index
+
+from src.db.database import Base
+
+
+class RawLog(Base):
+    """Raw event log fetched from the chain, archived as returned by eth_getLogs"""
+
+    __tablename__ = "raw_logs"
+
+    chain_id = Column(Integer, primary_key=True, autoincrement=False)
+    block_number = Column(BigInteger, primary_key=True, autoincrement=False)
+    log_index = Column(Integer, primary_key=True, autoincrement=False)
+    block_hash = Column(String, nullable=False)
+    tx_hash = Column(String, nullable=False)
+    tx_index = Column(Integer, nullable=False)
+    address = Column(String, nullable=False)  # Checksummed contract address
+    topics = Column(JSON, nullable=False)  # Hex strings, topic0 first
+    data = Column(Text, nullable=False)  # Hex string
+
+
+class LogArchiveRange(Base):
+    """Block range for which every log of (address, topic0) is in raw_logs
+
+    Ranges of one (address, topic0) never overlap; adjacent ones are merged.
+    """
+
+    __tablename__ = "log_archive_ranges"
+    __table_args__ = (
+        Index("ix_log_archive_ranges_lookup", "chain_id", "address", "topic", "from_block"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    chain_id = Column(Integer, nullable=False)
+    address = Column(String, nullable=False)
+    topic = Column(String, nullable=False)  # topic0 (event signature hash)
+    from_block = Column(BigInteger, nullable=False)
+    to_block = Column(BigInteger, nullable=False)
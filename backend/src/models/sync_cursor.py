@@ -0,0 +1,27 @@
+"""Per-stream sync cursor model"""
+
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, UniqueConstraint
+
+from src.db.database import Base
+
+
+class SyncCursor(Base):
+    """Checkpoint of one event stream (e.g. "identity", "reputation") of a network
+
+    Every stream is synced through its own last_block; BlockchainSync.last_block
+    is the lowest of them, the block through which the network is fully synced.
+    """
+
+    __tablename__ = "sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("network_name", "stream", name="uq_sync_cursors_stream"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    network_name = Column(String, nullable=False, index=True)
+    stream = Column(String, nullable=False)
+    contract_address = Column(String, nullable=False)
+    last_block = Column(BigInteger, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
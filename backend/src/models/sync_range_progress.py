@@ -0,0 +1,34 @@
+"""Backfill range progress model"""
+
+import enum
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, String, Text, Enum, DateTime, UniqueConstraint
+
+from src.db.database import Base
+
+
+class RangeProgressStatus(str, enum.Enum):
+    """Backfill partition status"""
+
+    PENDING = "pending"  # Planned, not applied yet
+    APPLIED = "applied"  # Events written and the sync checkpoint moved past it
+
+
+class SyncRangeProgress(Base):
+    """One partition of a network's historical backfill plan"""
+
+    __tablename__ = "sync_range_progress"
+    __table_args__ = (
+        UniqueConstraint("network_name", "from_block", name="uq_sync_range_progress_start"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    network_name = Column(String, nullable=False, index=True)
+    from_block = Column(BigInteger, nullable=False)
+    to_block = Column(BigInteger, nullable=False)
+    status = Column(Enum(RangeProgressStatus), nullable=False, default=RangeProgressStatus.PENDING)
+    window = Column(Integer, nullable=True)  # Adaptive eth_getLogs window learned inside the partition
+    events = Column(Integer, nullable=True)  # Tracked events found in the partition
+    last_error = Column(Text, nullable=True)  # Why the backfill stopped at this partition
+    applied_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,40 @@
+"""Validation index model"""
+
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, ForeignKey, Text, UniqueConstraint, Index
+
+from src.db.database import Base
+
+
+class Validation(Base):
+    """One ValidationRequest of an agent merged with its latest ValidationResponse
+
+    Synced from the validation registry; the response columns stay empty
+    (status PENDING) until a ValidationResponse for the request hash arrives.
+    """
+
+    __tablename__ = "validations"
+    __table_args__ = (
+        # ValidationResponse refers to the request by its hash
+        UniqueConstraint("agent_id", "request_hash", name="uq_validation_request"),
+        # Validation pages of an agent, newest request first (scanned backwards)
+        Index("ix_validations_agent_block", "agent_id", "block_number", "log_index"),
+    )
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    agent_id = Column(String, ForeignKey("agents.id"), nullable=False, index=True)
+    request_hash = Column(String, nullable=False)  # 0x-prefixed bytes32
+    validator_address = Column(String, nullable=False)
+    request_uri = Column(Text, nullable=True)
+    block_number = Column(BigInteger, nullable=False, index=True)  # Block of the ValidationRequest
+    log_index = Column(Integer, nullable=False)
+    tx_hash = Column(String, nullable=True)
+    requested_at = Column(DateTime, nullable=True)  # Time of the request block
+    response = Column(Integer, nullable=True)  # 0-100, latest response
+    response_uri = Column(Text, nullable=True)
+    tag = Column(String, nullable=True)
+    response_block = Column(BigInteger, nullable=True)
+    completed_at = Column(DateTime, nullable=True)  # Time of the latest response block
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
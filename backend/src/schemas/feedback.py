@@ -32,7 +32,8 @@ class FeedbackListResponse(BaseModel):
     page_size: int
     total_pages: int
     subgraph_available: bool = True  # False if network doesn't have subgraph support
-    data_source: str = "subgraph"  # "subgraph" or "on-chain"
+    data_source: str = "subgraph"  # "local", "subgraph" or "on-chain"
+    next_cursor: Optional[str] = None  # Keyset cursor of the next page (local data only)
 
 
 class ValidationResponse(BaseModel):
@@ -58,7 +59,8 @@ class ValidationListResponse(BaseModel):
     page_size: int
     total_pages: int
     subgraph_available: bool = True  # False if network doesn't have subgraph support
-    data_source: str = "subgraph"  # "subgraph" or "on-chain"
+    data_source: str = "subgraph"  # "local", "subgraph" or "on-chain"
+    next_cursor: Optional[str] = None  # Keyset cursor of the next page (local data only)
 
 
 class ReputationSummaryResponse(BaseModel):
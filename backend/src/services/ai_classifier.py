@@ -11,6 +11,7 @@
 
 import os
 import json
+import asyncio
 from typing import Dict, List, Optional
 import structlog
 from openai import OpenAI
@@ -112,7 +113,7 @@ class AIClassifierService:
             logger.error("llm_initialization_failed", error=str(e))
             self.use_fallback = True
 
-    def _is_valid_description(self, description: str) -> bool:
+    def is_valid_description(self, description: str) -> bool:
         """检查 description 是否足够有效以进行分类
 
         返回 True 如果 description 有效，否则返回 False
@@ -204,7 +205,7 @@ class AIClassifierService:
             {"skills": [...], "domains": [...]}
         """
         # 检查 description 是否有效
-        if not self._is_valid_description(description):
+        if not self.is_valid_description(description):
             logger.debug(
                 "invalid_description_skipped",
                 name=name,
@@ -234,7 +235,9 @@ class AIClassifierService:
         prompt = self._build_prompt(name, description)
 
         try:
-            response = self.client.chat.completions.create(
+            # OpenAI SDK client is blocking, keep it off the event loop
+            response = await asyncio.to_thread(
+                self.client.chat.completions.create,
                 model=self.model_name,
                 messages=[
                     {
@@ -0,0 +1,278 @@
+"""Parallel historical backfill
+
+Catches a network up from its lowest stream cursor to the confirmed head
+(head minus the confirmation depth, so no reorg bookkeeping is needed) much
+faster than the per-run batch limit of the range sync allows:
+
+- The span is split into fixed partitions, persisted in sync_range_progress
+  so a restarted backfill resumes with the same plan and learned windows.
+- Up to BACKFILL_WORKERS tasks fetch partitions concurrently (eth_getLogs
+  with an adaptive window inside each partition, plus the block timestamps
+  of the registrations found). Workers share the network's RPC provider
+  pool, so per-endpoint rate limits still hold.
+- A single apply stage writes partitions strictly in block order through
+  the regular event pipeline, committing each partition together with the
+  stream cursors and the BlockchainSync checkpoint, so event semantics (registration before URI
+  update, end-of-range reputation reads) are the same as in a range sync.
+
+Like the range sync, each partition only fetches the streams whose cursor
+is below its end. Workers run at most two partitions per worker ahead of
+the apply stage, which bounds the events held in memory.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from sqlalchemy.orm import Session
+
+from src.core.blockchain_config import (
+    BACKFILL_PARTITION_BLOCKS,
+    BACKFILL_WORKERS,
+    BACKFILL_MAX_ATTEMPTS,
+)
+from src.db.database import SessionLocal
+from src.models import BlockchainSync, SyncRangeProgress, RangeProgressStatus
+from src.services.range_sizer import AdaptiveRangeSizer, is_range_error
+from src.services.sync_cursors import StreamCursors, TIMESTAMPED_EVENTS
+
+logger = structlog.get_logger(__name__)
+
+
+class HistoricalBackfill:
+    """Partitioned, parallel catch-up of one network (run under its write lock)"""
+
+    def __init__(
+        self,
+        service,
+        workers: int = BACKFILL_WORKERS,
+        partition_blocks: int = BACKFILL_PARTITION_BLOCKS,
+    ):
+        """
+        Args:
+            service: The network's NetworkSyncService
+            workers: Partitions fetched concurrently
+            partition_blocks: Blocks per partition
+        """
+        self.service = service
+        self.network_key = service.network_key
+        self.workers = max(1, workers)
+        self.partition_blocks = max(1, partition_blocks)
+        self.initial_window = service.blocks_per_batch  # For partitions without a learned window
+        self.positions: dict[str, int] = {}  # Stream cursors when the run started
+        self._fetch_slots = asyncio.Semaphore(self.workers)
+
+    def plan(self, db: Session, from_block: int, to_block: int) -> list[SyncRangeProgress]:
+        """Partitions covering [from_block, to_block], resuming a stored plan (commits)
+
+        Pending partitions that continue the checkpoint are kept (with their
+        learned windows); anything else above the checkpoint is stale, e.g.
+        after a reset, and replaced.
+        """
+        rows = db.query(SyncRangeProgress).filter(
+            SyncRangeProgress.network_name == self.network_key,
+            SyncRangeProgress.to_block >= from_block
+        ).order_by(SyncRangeProgress.from_block).all()
+
+        partitions: list[SyncRangeProgress] = []
+        next_block = from_block
+        for row in rows:
+            resumable = (
+                row.status == RangeProgressStatus.PENDING
+                and row.from_block == next_block
+                and row.to_block <= to_block
+            )
+            if resumable:
+                partitions.append(row)
+                next_block = row.to_block + 1
+            else:
+                db.delete(row)
+
+        while next_block <= to_block:
+            row = SyncRangeProgress(
+                network_name=self.network_key,
+                from_block=next_block,
+                to_block=min(next_block + self.partition_blocks - 1, to_block),
+                status=RangeProgressStatus.PENDING
+            )
+            db.add(row)
+            partitions.append(row)
+            next_block = row.to_block + 1
+
+        db.commit()
+        return partitions
+
+    async def run(self, db: Session, sync_tracker: BlockchainSync, to_block: int) -> int:
+        """Backfill from the lowest stream cursor through `to_block` (cursors loaded)
+
+        Returns the number of blocks applied. Raises on the first partition
+        that keeps failing; partitions applied before it stay committed.
+        """
+        self.positions = dict(self.service.cursors.positions)
+        from_block = min(self.positions.values()) + 1
+        if from_block > to_block:
+            return 0
+
+        self.initial_window = sync_tracker.learned_window or self.service.blocks_per_batch
+        partitions = self.plan(db, from_block, to_block)
+        total_blocks = to_block - from_block + 1
+        logger.info(
+            "backfill_started",
+            network=self.network_key,
+            from_block=from_block,
+            to_block=to_block,
+            partitions=len(partitions),
+            workers=self.workers
+        )
+
+        # Fetches are started in order, at most 2 partitions per worker ahead of the apply stage
+        max_ahead = self.workers * 2
+        fetches: deque[asyncio.Task] = deque()
+        next_fetch = 0
+        started = time.monotonic()
+        applied_blocks = 0
+        total_events = 0
+
+        partition = None
+        try:
+            for index, partition in enumerate(partitions):
+                while next_fetch < len(partitions) and next_fetch < index + max_ahead:
+                    # Workers get plain values, never the apply stage's session objects
+                    ahead = partitions[next_fetch]
+                    fetches.append(asyncio.create_task(
+                        self._fetch(ahead.from_block, ahead.to_block, ahead.window)
+                    ))
+                    next_fetch += 1
+
+                events, timestamps, window = await fetches.popleft()
+
+                await self.service._apply_events(
+                    db, events, timestamps, replay=partition.to_block <= max(self.positions.values())
+                )
+                self.service._advance_streams(
+                    db, sync_tracker, StreamCursors.behind(self.positions, partition.to_block),
+                    partition.to_block
+                )
+                partition.status = RangeProgressStatus.APPLIED
+                partition.window = window
+                partition.events = len(events)
+                partition.last_error = None
+                partition.applied_at = datetime.utcnow()
+                sync_tracker.last_synced_at = datetime.utcnow()
+                db.commit()
+
+                applied_blocks += partition.to_block - partition.from_block + 1
+                total_events += len(events)
+                elapsed = time.monotonic() - started
+                logger.info(
+                    "backfill_partition_applied",
+                    network=self.network_key,
+                    partition=f"{index + 1}/{len(partitions)}",
+                    from_block=partition.from_block,
+                    to_block=partition.to_block,
+                    events=len(events),
+                    progress=f"{applied_blocks}/{total_blocks}",
+                    blocks_per_second=round(applied_blocks / elapsed) if elapsed else None
+                )
+        except Exception as e:
+            db.rollback()
+            if partition is not None:
+                partition.last_error = str(e)[:500]
+                db.commit()
+            logger.error(
+                "backfill_failed",
+                network=self.network_key,
+                applied_blocks=applied_blocks,
+                checkpoint=self.service.cursors.floor,
+                error=str(e)[:500]
+            )
+            raise
+        finally:
+            for task in fetches:
+                task.cancel()
+            await asyncio.gather(*fetches, return_exceptions=True)
+
+        logger.info(
+            "backfill_completed",
+            network=self.network_key,
+            blocks=applied_blocks,
+            events=total_events,
+            duration_seconds=round(time.monotonic() - started, 2)
+        )
+        return applied_blocks
+
+    async def _fetch(
+        self, from_block: int, to_block: int, window: Optional[int]
+    ) -> tuple[list, dict[int, int], int]:
+        """Fetch one partition, retrying up to BACKFILL_MAX_ATTEMPTS times
+
+        Returns (decoded events, block timestamps of TIMESTAMPED_EVENTS, learned window).
+        """
+        initial_window = window or self.initial_window
+
+        async with self._fetch_slots:
+            for attempt in range(1, BACKFILL_MAX_ATTEMPTS + 1):
+                try:
+                    return await self._fetch_partition(from_block, to_block, initial_window)
+                except Exception as e:
+                    if attempt == BACKFILL_MAX_ATTEMPTS:
+                        raise
+                    logger.warning(
+                        "backfill_partition_retry",
+                        network=self.network_key,
+                        from_block=from_block,
+                        to_block=to_block,
+                        attempt=attempt,
+                        error=str(e)[:200]
+                    )
+                    await asyncio.sleep(2 ** attempt)
+
+    async def _fetch_partition(
+        self, from_block: int, to_block: int, initial_window: int
+    ) -> tuple[list, dict[int, int], int]:
+        service = self.service
+        sizer = AdaptiveRangeSizer(
+            initial_window,
+            min_window=service.min_blocks_per_batch,
+            max_window=service.max_blocks_per_batch,
+        )
+
+        events: list = []
+        range_from = from_block
+        while range_from <= to_block:
+            range_to = min(range_from + sizer.window - 1, to_block)
+            blocks = range_to - range_from + 1
+            try:
+                batch, _ = await service._fetch_stream_logs(self.positions, range_from, range_to)
+            except Exception as e:
+                if not is_range_error(e) or not sizer.record_failure(blocks, e):
+                    raise
+                continue
+            sizer.record_success(blocks, len(batch))
+            events.extend(batch)
+            range_from = range_to + 1
+
+        # Block timestamps are resolved here, off the apply stage's critical path
+        timestamp_blocks = [e['blockNumber'] for e in events if e['event'] in TIMESTAMPED_EVENTS]
+        timestamps: dict[int, int] = {}
+        if timestamp_blocks:
+            db = SessionLocal()
+            try:
+                timestamps, missing = service.block_timestamps.lookup(db, timestamp_blocks)
+            finally:
+                db.close()
+            if missing:
+                timestamps.update(await service.block_timestamps.fetch(missing))
+
+        logger.debug(
+            "backfill_partition_fetched",
+            network=self.network_key,
+            from_block=from_block,
+            to_block=to_block,
+            events=len(events),
+            window=sizer.window
+        )
+        return events, timestamps, sizer.window
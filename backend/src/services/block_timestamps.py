@@ -0,0 +1,101 @@
+"""Block timestamp cache
+
+Resolves block numbers to timestamps through an in-memory LRU backed by the
+block_timestamps table. Blocks missing from both are fetched with a single
+JSON-RPC batch of eth_getBlockByNumber calls per chunk.
+"""
+
+from collections import OrderedDict
+from typing import Iterable
+from sqlalchemy.orm import Session
+from web3 import AsyncWeb3
+import structlog
+
+from src.models import BlockTimestamp
+
+logger = structlog.get_logger(__name__)
+
+LRU_MAX_ENTRIES = 10000
+RPC_BATCH_SIZE = 50  # Block headers per JSON-RPC batch request
+
+
+class BlockTimestampCache:
+    """Per-chain block number -> unix timestamp cache"""
+
+    def __init__(self, chain_id: int, w3: AsyncWeb3, max_entries: int = LRU_MAX_ENTRIES):
+        self.chain_id = chain_id
+        self.w3 = w3
+        self.max_entries = max_entries
+        self._lru: OrderedDict[int, int] = OrderedDict()
+
+    def _remember(self, block_number: int, timestamp: int):
+        self._lru[block_number] = timestamp
+        self._lru.move_to_end(block_number)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def forget_above(self, block_number: int):
+        """Drop cached timestamps of blocks above `block_number` (reorged away)"""
+        for cached in [n for n in self._lru if n > block_number]:
+            del self._lru[cached]
+
+    def lookup(self, db: Session, block_numbers: Iterable[int]) -> tuple[dict[int, int], list[int]]:
+        """Resolve from memory and database only
+
+        Returns (timestamps, missing block numbers).
+        """
+        timestamps: dict[int, int] = {}
+        missing = []
+        for block_number in sorted(set(block_numbers)):
+            if block_number in self._lru:
+                self._lru.move_to_end(block_number)
+                timestamps[block_number] = self._lru[block_number]
+            else:
+                missing.append(block_number)
+
+        if missing:
+            rows = db.query(BlockTimestamp).filter(
+                BlockTimestamp.chain_id == self.chain_id,
+                BlockTimestamp.block_number.in_(missing)
+            ).all()
+            for row in rows:
+                timestamps[row.block_number] = row.timestamp
+                self._remember(row.block_number, row.timestamp)
+            missing = [n for n in missing if n not in timestamps]
+
+        return timestamps, missing
+
+    async def fetch(self, block_numbers: list[int]) -> dict[int, int]:
+        """Fetch block timestamps from the RPC in JSON-RPC batches"""
+        timestamps: dict[int, int] = {}
+        for i in range(0, len(block_numbers), RPC_BATCH_SIZE):
+            chunk = block_numbers[i:i + RPC_BATCH_SIZE]
+            try:
+                async with self.w3.batch_requests() as batch:
+                    for block_number in chunk:
+                        batch.add(self.w3.eth.get_block(block_number))
+                    blocks = await batch.async_execute()
+            except Exception as e:
+                # Some providers reject batch requests, fall back to single calls
+                logger.warning(
+                    "block_batch_fetch_failed",
+                    chain_id=self.chain_id,
+                    blocks=len(chunk),
+                    error=str(e)
+                )
+                blocks = [await self.w3.eth.get_block(block_number) for block_number in chunk]
+
+            for block in blocks:
+                timestamps[block['number']] = block['timestamp']
+
+        return timestamps
+
+    def store(self, db: Session, timestamps: dict[int, int]):
+        """Remember fetched timestamps in memory and in the database (caller commits)"""
+        for block_number, timestamp in timestamps.items():
+            self._remember(block_number, timestamp)
+            db.merge(BlockTimestamp(
+                chain_id=self.chain_id,
+                block_number=block_number,
+                timestamp=timestamp
+            ))
@@ -1,27 +1,57 @@
 """Blockchain synchronization service - Multi-network support"""
 
 import asyncio
-import httpx
+import uuid
+from contextlib import aclosing
 from datetime import datetime
 from typing import Optional
-from web3 import Web3
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from web3 import AsyncWeb3
 
 from src.core.blockchain_config import (
-    REGISTRY_ABI,
-    MAX_RETRIES,
-    RETRY_DELAY_SECONDS,
-    REQUEST_DELAY_SECONDS,
-    IPFS_GATEWAY,
+    SYNC_PREFETCH_DEPTH,
+    DEFAULT_CONFIRMATION_DEPTH,
+    BACKFILL_THRESHOLD_BLOCKS,
+    LOG_ARCHIVE_ENABLED,
+    REPUTATION_RECONCILE_SAMPLE_SIZE,
 )
-from src.core.reputation_config import REPUTATION_REGISTRY_ABI
-from src.core.networks_config import NETWORKS, get_network
+from src.core.networks_config import get_network
 from src.models import (
     Agent, BlockchainSync, SyncStatusEnum, SyncStatus,
-    AgentStatus, Activity, ActivityType, Network
+    AgentStatus, Activity, ActivityType, SyncRangeProgress
 )
 from src.db.database import SessionLocal
-from src.services.ai_classifier import ai_classifier_service
+from src.services.network_registry import CONTRACT_ABIS, get_network_registry
+from src.services.rpc_client import use_shared_session
+from src.services.log_reader import LogReader
+from src.services.log_archive import LogArchive
+from src.services.block_timestamps import BlockTimestampCache
+from src.services.reputation_reader import ReputationReader
+from src.services.reputation_ledger import ReputationLedger
+from src.services.validation_index import ValidationIndex
+from src.services.reorg_guard import ReorgGuard, ChainReorgDetected
+from src.services.backfill import HistoricalBackfill
+from src.services.sync_cursors import (
+    StreamCursors,
+    SYNC_STREAMS,
+    EVENT_STREAMS,
+    REPUTATION_EVENTS,
+    VALIDATION_EVENTS,
+    TIMESTAMPED_EVENTS,
+)
+from src.services.sync_writer import RangeWriteBuffer
+from src.services.enrichment_queue import (
+    new_agent_id,
+    placeholder_name,
+    PENDING_DESCRIPTION,
+)
+from src.services.range_sizer import (
+    AdaptiveRangeSizer,
+    is_range_error,
+    MIN_BLOCKS_PER_RANGE,
+    MAX_BLOCKS_PER_RANGE,
+)
 import structlog
 
 logger = structlog.get_logger()
@@ -34,11 +64,12 @@ DEFAULT_MAX_BATCHES_PER_RUN = 50
 class NetworkSyncService:
     """Service for synchronizing blockchain data for a specific network"""
 
-    def __init__(self, network_key: str):
+    def __init__(self, network_key: str, w3: Optional[AsyncWeb3] = None):
         """Initialize sync service for a specific network
 
         Args:
             network_key: Key from networks_config.py (e.g., 'sepolia', 'base-sepolia')
+            w3: Client used instead of the network's shared RPC pool (offline replay)
         """
         self.network_key = network_key
         self.network_config = get_network(network_key)
@@ -49,42 +80,82 @@ class NetworkSyncService:
         if not self.network_config.get("enabled", True):
             raise ValueError(f"Network '{network_key}' is disabled")
 
-        # Initialize Web3 with network-specific RPC
-        rpc_url = self.network_config["rpc_url"]
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Shared AsyncWeb3 and contracts of the network (runs on the app's event loop)
+        # Each endpoint is rate limited on its own; requests fail over between them
+        self.network = get_network_registry().get(network_key)
+        self._shared_client = w3 is None
+        self.w3 = self.network.async_web3 if w3 is None else w3
 
-        # Inject POA middleware for chains like BSC that use Proof of Authority
-        # This handles the extraData field that exceeds 32 bytes in POA chains
-        from web3.middleware import ExtraDataToPOAMiddleware
-        self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-
-        # Get contract addresses
-        contracts = self.network_config.get("contracts", {})
-        identity_address = contracts.get("identity")
-        reputation_address = contracts.get("reputation")
+        identity_address = self.network.contract_address("identity")
+        reputation_address = self.network.contract_address("reputation")
 
         if not identity_address:
             raise ValueError(f"Identity contract not configured for '{network_key}'")
 
-        # Initialize contracts
-        self.contract = self.w3.eth.contract(
-            address=identity_address,
-            abi=REGISTRY_ABI
-        )
+        self.contract = self._contract("identity")
+        self.reputation_contract = self._contract("reputation")
+        if not self.reputation_contract:
+            logger.warning("no_reputation_contract", network=network_key)
 
-        if reputation_address:
-            self.reputation_contract = self.w3.eth.contract(
-                address=reputation_address,
-                abi=REPUTATION_REGISTRY_ABI
+        # Batched getSummary reads (Multicall3, JSON-RPC batch fallback)
+        if self.reputation_contract:
+            self.reputation_reader = ReputationReader(
+                self.w3,
+                self.reputation_contract,
+                multicall_address=self.network.contract_address("multicall3")
             )
         else:
-            self.reputation_contract = None
-            logger.warning("no_reputation_contract", network=network_key)
+            self.reputation_reader = None
+
+        # Reputation is aggregated locally from the feedback events (feedbacks table)
+        self.reputation_ledger = ReputationLedger(network_key)
+        # Validation requests merged with their responses (validations table)
+        self.validation_index = ValidationIndex(network_key)
+
+        # Fetched logs are archived locally; archived ranges are never fetched again
+        self.log_archive = LogArchive(self.network_config["chain_id"]) if LOG_ARCHIVE_ENABLED else None
+
+        # Streams of the deployed contracts; one eth_getLogs request per range
+        # covers every stream that is due (log_reader: all of them, for the live tail)
+        self.stream_contracts = {
+            stream: self._contract(kind)
+            for stream, (kind, _) in SYNC_STREAMS.items()
+            if self.network.contract_address(kind)
+        }
+        self._stream_readers: dict[frozenset, LogReader] = {}
+        self.log_reader = self._stream_reader(self.stream_contracts)
+
+        # Registration timestamps, cached across ranges and runs
+        self.block_timestamps = BlockTimestampCache(self.network_config["chain_id"], self.w3)
+
+        # Hashes of unconfirmed blocks, checked against the chain before each batch
+        self.reorg_guard = ReorgGuard(
+            self.network_config["chain_id"],
+            self.w3,
+            self.network_config.get("confirmation_depth", DEFAULT_CONFIRMATION_DEPTH)
+        )
+
+        self._sync_tracker_id: Optional[str] = None
+        self.last_error: Optional[str] = None  # Error of the latest run, None if it succeeded
+        # Serializes range syncs and live-tail writes of this network
+        self._write_lock = asyncio.Lock()
 
         # Sync configuration
         self.start_block = self.network_config.get("start_block", 0)
         self.blocks_per_batch = self.network_config.get(
             "blocks_per_batch", DEFAULT_BLOCKS_PER_BATCH
+        )  # Initial window, adapted per run and remembered in BlockchainSync
+        self.min_blocks_per_batch = self.network_config.get(
+            "min_blocks_per_batch", MIN_BLOCKS_PER_RANGE
+        )
+        self.max_blocks_per_batch = self.network_config.get(
+            "max_blocks_per_batch", MAX_BLOCKS_PER_RANGE
+        )
+
+        self.cursors = StreamCursors(
+            network_key,
+            {stream: contract.address for stream, contract in self.stream_contracts.items()},
+            self.start_block
         )
 
         logger.info(
@@ -93,22 +164,68 @@ class NetworkSyncService:
             chain_id=self.network_config["chain_id"],
             identity_contract=identity_address,
             reputation_contract=reputation_address,
+            streams=list(self.stream_contracts),
             start_block=self.start_block
         )
 
-    async def sync(self):
-        """Main sync method with smart sync logic"""
+    def _contract(self, kind: str):
+        """Contract of the network on this service's client, None if not deployed"""
+        if self._shared_client:
+            return self.network.async_contract(kind)
+        address = self.network.contract_address(kind)
+        return self.w3.eth.contract(address=address, abi=CONTRACT_ABIS[kind]) if address else None
+
+    def _stream_reader(self, streams) -> LogReader:
+        """LogReader covering the events of a set of streams (cached per set)"""
+        key = frozenset(streams)
+        reader = self._stream_readers.get(key)
+        if reader is None:
+            reader = LogReader(self.w3, self.log_archive)
+            for stream, contract in self.stream_contracts.items():
+                if stream in key:
+                    reader.add_events(contract, SYNC_STREAMS[stream][1])
+            self._stream_readers[key] = reader
+        return reader
+
+    async def sync(self) -> bool:
+        """Main sync method with smart sync logic
+
+        Returns True once the network is caught up with the chain head.
+        """
+        async with self._write_lock:
+            return await self._sync()
+
+    async def _sync(self) -> bool:
+        self.last_error = None
         db = SessionLocal()
         try:
-            # Get or create sync tracker
+            # Get or create sync tracker, and the network row before any range is written
             sync_tracker = self._get_sync_tracker(db)
+            self._get_network_id(db)
+            self.cursors.load(db, sync_tracker)
+
+            # Share the pooled HTTP session of the running event loop
+            await use_shared_session(self.w3)
 
             # Get current block number
-            current_block = self.w3.eth.block_number
+            current_block = await self.w3.eth.block_number
             sync_tracker.current_block = current_block
 
-            # Calculate starting point
-            from_block = sync_tracker.last_block + 1
+            # Roll back first if the furthest checkpoint's block was reorged away
+            fork_block = await self.reorg_guard.detect(db, self.cursors.head)
+            if fork_block is not None:
+                await self._rollback(db, sync_tracker, fork_block)
+
+            # Far behind (fresh deployment, reset or new stream): parallel backfill up to the confirmed head
+            confirmed_block = current_block - self.reorg_guard.confirmation_depth
+            if confirmed_block - self.cursors.floor > BACKFILL_THRESHOLD_BLOCKS:
+                sync_tracker.status = SyncStatusEnum.RUNNING
+                db.commit()
+                await HistoricalBackfill(self).run(db, sync_tracker, confirmed_block)
+
+            # Calculate starting point: the lowest stream cursor
+            positions = dict(self.cursors.positions)
+            from_block = min(positions.values()) + 1
 
             # Smart sync: skip if no new blocks
             if from_block > current_block:
@@ -119,7 +236,7 @@ class NetworkSyncService:
                     last_synced_block=sync_tracker.last_block,
                     current_block=current_block
                 )
-                return
+                return True
 
             # Update status to running
             sync_tracker.status = SyncStatusEnum.RUNNING
@@ -134,43 +251,50 @@ class NetworkSyncService:
                 from_block=from_block,
                 current_block=current_block,
                 total_blocks_to_sync=total_blocks_to_sync,
-                max_batches=DEFAULT_MAX_BATCHES_PER_RUN
+                max_batches=DEFAULT_MAX_BATCHES_PER_RUN,
+                window=sync_tracker.learned_window or self.blocks_per_batch,
+                lagging_streams=self.cursors.lagging()
             )
 
             # Loop through batches until caught up or hit limit
             batch_count = 0
             total_blocks_processed = 0
+            sizer = AdaptiveRangeSizer(
+                sync_tracker.learned_window or self.blocks_per_batch,
+                min_window=self.min_blocks_per_batch,
+                max_window=self.max_blocks_per_batch,
+            )
 
-            while from_block <= current_block and batch_count < DEFAULT_MAX_BATCHES_PER_RUN:
-                batch_count += 1
-                to_block = min(from_block + self.blocks_per_batch - 1, current_block)
-                blocks_in_batch = to_block - from_block + 1
+            batches = self._iter_ranges(from_block, current_block, sizer, positions)
+            async with aclosing(batches):
+                async for range_from, range_to, events, range_hash, streams in batches:
+                    batch_count += 1
+                    blocks_in_batch = range_to - range_from + 1
 
-                logger.info(
-                    "batch_processing",
-                    network=self.network_key,
-                    batch=batch_count,
-                    from_block=from_block,
-                    to_block=to_block,
-                    blocks=blocks_in_batch,
-                    progress=f"{total_blocks_processed}/{total_blocks_to_sync}"
-                )
-
-                # Process events for this batch
-                await self._process_events(db, from_block, to_block)
+                    logger.info(
+                        "batch_processing",
+                        network=self.network_key,
+                        batch=batch_count,
+                        from_block=range_from,
+                        to_block=range_to,
+                        blocks=blocks_in_batch,
+                        events=len(events),
+                        progress=f"{total_blocks_processed}/{total_blocks_to_sync}"
+                    )
 
-                # Update sync tracker after each batch
-                sync_tracker.last_block = to_block
-                sync_tracker.last_synced_at = datetime.utcnow()
-                db.commit()
+                    # Process events for this batch in block/log-index order
+                    await self._apply_events(db, events, replay=range_to <= self.cursors.head)
+                    self.reorg_guard.record(db, events, range_to, range_hash, current_block)
 
-                # Update counters
-                total_blocks_processed += blocks_in_batch
-                from_block = to_block + 1
+                    # Update cursors and tracker in the same transaction as the batch's writes
+                    self._advance_streams(db, sync_tracker, streams, range_to)
+                    sync_tracker.learned_window = sizer.window
+                    sync_tracker.last_synced_at = datetime.utcnow()
+                    db.commit()
 
-                # Small delay between batches to avoid overwhelming the RPC
-                if from_block <= current_block and batch_count < DEFAULT_MAX_BATCHES_PER_RUN:
-                    await asyncio.sleep(1)
+                    # Update counters
+                    total_blocks_processed += blocks_in_batch
+                    from_block = range_to + 1
 
             # Final status update
             sync_tracker.status = SyncStatusEnum.IDLE
@@ -199,279 +323,492 @@ class NetworkSyncService:
                     remaining_blocks=remaining_blocks,
                     note="Will continue in next run"
                 )
+            return from_block > current_block
 
         except Exception as e:
             logger.error("sync_failed", network=self.network_key, error=str(e))
+            self.last_error = str(e)
+            # Drop the partially applied range, its checkpoint was not advanced
+            db.rollback()
             if 'sync_tracker' in locals():
                 sync_tracker.status = SyncStatusEnum.ERROR
                 sync_tracker.error_message = str(e)[:500]
                 db.commit()
+            return False
         finally:
             db.close()
 
-    async def _process_events(self, db: Session, from_block: int, to_block: int):
-        """Process blockchain events with rate limiting"""
+    async def backfill(self, to_block: Optional[int] = None, **options) -> int:
+        """Run a parallel historical backfill now (defaults to the confirmed head)
 
-        # Get Registered events
-        registered_events = self.contract.events.Registered.get_logs(
-            from_block=from_block,
-            to_block=to_block
-        )
+        Args:
+            to_block: Last block to backfill
+            **options: HistoricalBackfill options (workers, partition_blocks)
 
-        logger.info(
-            "events_found",
-            network=self.network_key,
-            event_type="Registered",
-            count=len(registered_events)
-        )
+        Returns the number of blocks applied.
+        """
+        async with self._write_lock:
+            db = SessionLocal()
+            try:
+                sync_tracker = self._get_sync_tracker(db)
+                self._get_network_id(db)
+                self.cursors.load(db, sync_tracker)
+                await use_shared_session(self.w3)
+
+                if to_block is None:
+                    to_block = await self.w3.eth.block_number - self.reorg_guard.confirmation_depth
+                return await HistoricalBackfill(self, **options).run(db, sync_tracker, to_block)
+            finally:
+                db.close()
+
+    async def apply_live_events(
+        self,
+        events: list,
+        checkpoint: int,
+        head: Optional[int] = None,
+        raw_logs: Optional[list] = None,
+    ):
+        """Apply events streamed by the live tail and advance the checkpoint
 
-        for i, event in enumerate(registered_events):
-            await self._process_registered_event(db, event)
-            if i < len(registered_events) - 1:
-                await asyncio.sleep(REQUEST_DELAY_SECONDS)
+        Args:
+            events: Decoded events sorted by (blockNumber, logIndex)
+            checkpoint: Block through which every tracked log has been delivered
+            head: Latest chain head seen, if known
+            raw_logs: The raw logs `events` were decoded from, for the log archive
+        """
+        async with self._write_lock:
+            db = SessionLocal()
+            try:
+                sync_tracker = self._get_sync_tracker(db)
+                positions = self.cursors.load(db, sync_tracker)
+                last_block = self.cursors.head
+                head = head or checkpoint
+
+                # Streams behind the checkpoint (new or replaying) catch up through the range sync;
+                # blocks at or below it were already applied (e.g. by gap repair)
+                live_streams = [stream for stream, block in positions.items() if block == last_block]
+                events = [
+                    e for e in events
+                    if e['blockNumber'] > last_block and EVENT_STREAMS[e['event']] in live_streams
+                ]
+                if not events and checkpoint <= last_block:
+                    return
+
+                # Verify the checkpoint is still canonical and read the new checkpoint's hash
+                numbers = [checkpoint] if self.reorg_guard.is_unconfirmed(checkpoint, head) else []
+                if self.reorg_guard.stored_hash(db, last_block):
+                    numbers.append(last_block)
+                hashes = await self.reorg_guard.block_hashes(numbers)
+                fork_block = await self.reorg_guard.detect(db, last_block, hashes)
+                if fork_block is not None:
+                    await self._rollback(db, sync_tracker, fork_block)
+                    raise ChainReorgDetected(fork_block, "checkpoint hash changed")
+                if events:
+                    logger.info(
+                        "live_events_applying",
+                        network=self.network_key,
+                        counts=LogReader.count_by_event(events),
+                        to_block=events[-1]['blockNumber']
+                    )
+                    await self._apply_events(db, events)
+                self.reorg_guard.record(db, events, checkpoint, hashes.get(checkpoint), head)
+                if self.log_archive is not None and raw_logs is not None and checkpoint > last_block:
+                    self.log_archive.store(
+                        self._stream_reader(live_streams).pairs, raw_logs, last_block + 1, checkpoint, db=db
+                    )
 
-        # Get URIUpdated events (renamed from UriUpdated in Jan 2026 update)
-        updated_events = self.contract.events.URIUpdated.get_logs(
-            from_block=from_block,
-            to_block=to_block
-        )
+                self._advance_streams(db, sync_tracker, live_streams, checkpoint)
+                sync_tracker.current_block = max(sync_tracker.current_block or 0, head)
+                sync_tracker.last_synced_at = datetime.utcnow()
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+    async def _iter_ranges(
+        self,
+        from_block: int,
+        to_block: int,
+        sizer: AdaptiveRangeSizer,
+        positions: dict[str, int],
+    ):
+        """Yield (from_block, to_block, events, to_block_hash, streams) for each range of this run
 
-        logger.info(
-            "events_found",
-            network=self.network_key,
-            event_type="URIUpdated",
-            count=len(updated_events)
-        )
+        Range widths come from `sizer`, which grows across sparse stretches
+        and bisects ranges the provider rejects. With SYNC_PREFETCH_DEPTH > 0
+        a producer task fetches up to that many ranges ahead of the consumer,
+        so log fetching overlaps with event processing. The RPC budget is
+        enforced per endpoint by the provider pool either way.
 
-        for i, event in enumerate(updated_events):
-            await self._process_updated_event(db, event)
-            if i < len(updated_events) - 1:
-                await asyncio.sleep(REQUEST_DELAY_SECONDS)
+        to_block_hash is only read for ranges ending within the confirmation
+        depth of the head (None otherwise), and before the range's logs, so a
+        reorg in between shows up as a checkpoint hash mismatch next time.
 
-        # Get reputation events if reputation contract is configured
-        if self.reputation_contract:
-            await self._process_reputation_events(db, from_block, to_block)
+        streams are the streams fetched for the range: those whose cursor in
+        the `positions` snapshot is below the range end.
+        """
+        ranges = self._fetch_ranges(from_block, to_block, sizer, positions)
 
-    async def _process_reputation_events(
-        self, db: Session, from_block: int, to_block: int
+        if SYNC_PREFETCH_DEPTH <= 0:
+            async for item in ranges:
+                yield item
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SYNC_PREFETCH_DEPTH)
+
+        async def produce():
+            try:
+                async for item in ranges:
+                    await queue.put(item)
+                await queue.put(None)
+            except Exception as e:
+                await queue.put(e)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+            try:
+                await producer
+            except asyncio.CancelledError:
+                pass
+
+    async def _fetch_ranges(
+        self,
+        from_block: int,
+        to_block: int,
+        sizer: AdaptiveRangeSizer,
+        positions: dict[str, int],
     ):
-        """Process reputation events (NewFeedback, FeedbackRevoked)"""
-        # Get NewFeedback events
-        feedback_events = self.reputation_contract.events.NewFeedback.get_logs(
-            from_block=from_block,
-            to_block=to_block
-        )
+        """Fetch consecutive ranges, at most DEFAULT_MAX_BATCHES_PER_RUN getLogs calls"""
+        calls = 0
+        while from_block <= to_block and calls < DEFAULT_MAX_BATCHES_PER_RUN:
+            calls += 1
+            range_to = min(from_block + sizer.window - 1, to_block)
+            blocks = range_to - from_block + 1
 
-        logger.info(
-            "events_found",
-            network=self.network_key,
-            event_type="NewFeedback",
-            count=len(feedback_events)
-        )
+            try:
+                range_hash = None
+                if self.reorg_guard.is_unconfirmed(range_to, to_block):
+                    range_hash = (await self.reorg_guard.block_hashes([range_to]))[range_to]
+                events, streams = await self._fetch_events(positions, from_block, range_to)
+            except Exception as e:
+                if not is_range_error(e) or not sizer.record_failure(blocks, e):
+                    raise
+                logger.warning(
+                    "range_rejected_shrinking",
+                    network=self.network_key,
+                    from_block=from_block,
+                    to_block=range_to,
+                    new_window=sizer.window,
+                    error=str(e)[:200]
+                )
+                continue
 
-        for i, event in enumerate(feedback_events):
-            await self._process_feedback_event(db, event)
-            if i < len(feedback_events) - 1:
-                await asyncio.sleep(REQUEST_DELAY_SECONDS)
+            sizer.record_success(blocks, len(events))
+            yield from_block, range_to, events, range_hash, streams
+            from_block = range_to + 1
 
-        # Get FeedbackRevoked events
-        revoked_events = self.reputation_contract.events.FeedbackRevoked.get_logs(
-            from_block=from_block,
-            to_block=to_block
-        )
+    async def _fetch_events(
+        self, positions: dict[str, int], from_block: int, to_block: int
+    ) -> tuple[list, list[str]]:
+        """Fetch the due event streams for a range in one eth_getLogs call"""
+        events, streams = await self._fetch_stream_logs(positions, from_block, to_block)
 
         logger.info(
             "events_found",
             network=self.network_key,
-            event_type="FeedbackRevoked",
-            count=len(revoked_events)
+            from_block=from_block,
+            to_block=to_block,
+            counts=LogReader.count_by_event(events),
+            **({"streams": streams} if len(streams) < len(positions) else {})
         )
+        return events, streams
 
-        for i, event in enumerate(revoked_events):
-            await self._process_feedback_event(db, event)
-            if i < len(revoked_events) - 1:
-                await asyncio.sleep(REQUEST_DELAY_SECONDS)
+    async def _fetch_stream_logs(
+        self, positions: dict[str, int], from_block: int, to_block: int
+    ) -> tuple[list, list[str]]:
+        """Fetch events of the streams not yet synced through `to_block`
 
-    async def _process_registered_event(self, db: Session, event):
-        """Process Registered event"""
-        from sqlalchemy.exc import IntegrityError
-
-        token_id = event['args']['agentId']
-        owner = event['args']['owner']
-        metadata_uri = event['args']['agentURI']  # renamed from tokenURI in Jan 2026 update
-
-        # Get block timestamp for accurate registration time
-        block = self.w3.eth.get_block(event['blockNumber'])
-        block_timestamp = datetime.fromtimestamp(block['timestamp'])
+        Events at or below their stream's cursor are dropped. Returns the
+        decoded events sorted by (blockNumber, logIndex) and the streams fetched.
+        """
+        streams = StreamCursors.behind(positions, to_block)
+        events = await self._stream_reader(streams).get_logs(from_block, to_block)
+        events = [
+            event for event in events
+            if event['blockNumber'] > positions[EVENT_STREAMS[event['event']]]
+        ]
+        return events, streams
 
-        logger.info(
-            "processing_agent",
-            network=self.network_key,
-            agent_id=token_id,
-            owner=owner,
-            block_timestamp=block_timestamp
-        )
+    def _advance_streams(
+        self, db: Session, sync_tracker: BlockchainSync, streams: list[str], block: int
+    ):
+        """Move stream cursors to `block` and the network checkpoint to the lowest cursor (caller commits)
 
-        # Check if agent already exists (with network_id to allow same token_id on different networks)
+        When this completes a catch-up of the reputation stream, every agent's
+        reputation is recomputed from the now complete feedback ledger.
+        """
+        head = self.cursors.head
+        catching_up = "reputation" in streams and self.cursors.positions["reputation"] < head <= block
+        self.cursors.advance(db, streams, block)
+        sync_tracker.last_block = self.cursors.floor
+        if catching_up:
+            self._recompute_reputations(db)
+
+    def _recompute_reputations(self, db: Session):
+        """Set every agent's reputation from the feedback ledger, without activities (caller commits)"""
         network_id = self._get_network_id(db)
-        existing_agent = db.query(Agent).filter(
-            Agent.token_id == token_id,
-            Agent.network_id == network_id
-        ).first()
-
-        if existing_agent:
-            logger.info(
-                "agent_already_exists",
-                network=self.network_key,
-                token_id=token_id
-            )
-            return
+        summaries = self.reputation_ledger.summaries(db, network_id)
+        now = datetime.utcnow()
+        updated = 0
+        for agent in db.query(Agent).filter(Agent.network_id == network_id):
+            count, average_score = summaries.get(agent.token_id, (0, 0))
+            if agent.reputation_score != float(average_score) or agent.reputation_count != count:
+                agent.reputation_score = float(average_score)
+                agent.reputation_count = count
+                agent.reputation_last_updated = now
+                updated += 1
+        logger.info("reputation_catch_up_completed", network=self.network_key, agents_updated=updated)
+
+    async def _apply_events(
+        self,
+        db: Session,
+        events: list,
+        prefetched_timestamps: Optional[dict[int, int]] = None,
+        replay: bool = False,
+    ):
+        """Apply fetched events in block/log-index order (caller commits)
 
-        # Fetch metadata
-        metadata = await self._fetch_metadata(metadata_uri)
+        All RPC reads for the range happen first; the writes then go through
+        one RangeWriteBuffer, so the range and the sync checkpoint the caller
+        updates land in a single transaction that is never held across I/O.
 
-        try:
-            # Double-check before insert
-            existing_agent = db.query(Agent).filter(
-                Agent.token_id == token_id,
-                Agent.network_id == network_id
-            ).first()
-            if existing_agent:
-                logger.info(
-                    "agent_already_exists_recheck",
-                    network=self.network_key,
-                    token_id=token_id
-                )
-                return
-
-            # Extract or classify OASF skills and domains
-            name = metadata.get('name', f'Agent #{token_id}')
-            description = metadata.get('description', 'No description')
-            oasf_data = await self._extract_oasf_data(metadata, name, description)
+        Args:
+            prefetched_timestamps: Block timestamps already read (backfill workers)
+            replay: The range is below the furthest stream cursor (a stream catching up
+                or being replayed): state is rebuilt, but no activities are recorded again.
+                Feedback only goes into the ledger; agents' reputation is left alone until
+                the reputation stream has caught up (_advance_streams), since the ledger
+                is still partial.
+        """
+        timestamp_blocks = [
+            event['blockNumber'] for event in events if event['event'] in TIMESTAMPED_EVENTS
+        ]
 
-            # Create agent with blockchain timestamp
-            agent = Agent(
-                token_id=token_id,
-                name=name,
-                address=owner.lower(),
-                owner_address=owner.lower(),
-                description=description,
-                reputation_score=0.0,
-                status=AgentStatus.ACTIVE,
-                network_id=network_id,
-                metadata_uri=metadata_uri,
-                on_chain_data=dict(event['args']),
-                sync_status=SyncStatus.SYNCED,
-                last_synced_at=datetime.utcnow(),
-                created_at=block_timestamp,
-                skills=oasf_data.get('skills'),
-                domains=oasf_data.get('domains'),
-                classification_source=oasf_data.get('source')
-            )
+        # Feedback events are coalesced per agent: token_id -> events in this range
+        feedback_events: dict[int, list] = {}
+        for event in events:
+            if event['event'] in REPUTATION_EVENTS:
+                feedback_events.setdefault(event['args']['agentId'], []).append(event)
 
-            db.add(agent)
-            db.commit()
+        # Read phase: block timestamps of registrations, feedback and validations (one
+        # batched request for the blocks not cached yet; reputation needs no RPC reads)
+        block_timestamps, fetched_timestamps = await self._resolve_block_timestamps(
+            db, timestamp_blocks, prefetched_timestamps
+        )
 
-            # Create activity record
-            activity = Activity(
-                agent_id=agent.id,
-                activity_type=ActivityType.REGISTERED,
-                description=f"Agent '{agent.name}' (#{token_id}) registered on {self.network_config['name']}",
-                tx_hash=event['transactionHash'].hex() if 'transactionHash' in event else None,
-                created_at=block_timestamp
+        # Write phase
+        network_id = self._get_network_id(db)
+        self.block_timestamps.store(db, fetched_timestamps)
+        buffer = RangeWriteBuffer(db, network_id)
+
+        for event in events:
+            event_name = event['event']
+            if event_name == 'Registered':
+                block_timestamp = datetime.fromtimestamp(block_timestamps[event['blockNumber']])
+                self._process_registered_event(buffer, event, network_id, block_timestamp)
+            elif event_name == 'URIUpdated':
+                # renamed from newUri in Jan 2026 update
+                buffer.update_uri(event['args']['agentId'], event['args']['newURI'])
+
+        written = buffer.flush()
+        if any(written.values()):
+            logger.info("range_written", network=self.network_key, **written)
+
+        # Record feedback in the ledger, then refresh each touched agent once from it
+        if feedback_events:
+            self.reputation_ledger.record(
+                db, network_id, [event for event in events if event['event'] in REPUTATION_EVENTS],
+                block_timestamps
             )
-            db.add(activity)
-            db.commit()
+            if not replay:
+                summaries = self.reputation_ledger.summaries(db, network_id, list(feedback_events))
+                self._refresh_reputations(db, feedback_events, summaries)
+
+        validation_events = [event for event in events if event['event'] in VALIDATION_EVENTS]
+        if validation_events:
+            self.validation_index.record(db, network_id, validation_events, block_timestamps)
+
+    async def _resolve_block_timestamps(
+        self,
+        db: Session,
+        block_numbers: list[int],
+        prefetched: Optional[dict[int, int]] = None,
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """Resolve block timestamps from cache, batching RPC fetches for misses
+
+        Returns (all timestamps, newly fetched timestamps to store).
+        """
+        if not block_numbers:
+            return {}, {}
+
+        timestamps, missing = self.block_timestamps.lookup(db, block_numbers)
+        # Prefetched timestamps count as fetched: they still have to be stored
+        fetched = {n: prefetched[n] for n in missing if n in prefetched} if prefetched else {}
+        missing = [n for n in missing if n not in fetched]
+        if missing:
+            fetched.update(await self.block_timestamps.fetch(missing))
+        timestamps.update(fetched)
+
+        logger.debug(
+            "block_timestamps_resolved",
+            network=self.network_key,
+            blocks=len(timestamps),
+            fetched=len(missing)
+        )
+        return timestamps, fetched
 
-            logger.info(
-                "agent_created",
-                network=self.network_key,
-                token_id=token_id,
-                name=agent.name,
-                registered_at=block_timestamp
-            )
+    async def _read_reputation_summaries(
+        self, token_ids: list[int], block_identifier="latest"
+    ) -> dict[int, tuple[int, int]]:
+        """Resolve getSummary for distinct agents via Multicall3 / batched eth_call"""
+        if not token_ids or not self.reputation_reader:
+            return {}
 
-        except IntegrityError:
-            db.rollback()
+        token_ids = set(token_ids)
+        try:
+            return await self.reputation_reader.get_summaries(token_ids, block_identifier)
+        except Exception as e:
             logger.warning(
-                "agent_insert_conflict",
+                "reputation_summaries_failed",
                 network=self.network_key,
-                token_id=token_id,
-                error="Concurrent insert detected, skipping"
+                agents=len(token_ids),
+                error=str(e)
             )
+            return {}
+
+    def _process_registered_event(
+        self,
+        buffer: RangeWriteBuffer,
+        event,
+        network_id: str,
+        block_timestamp: datetime,
+    ):
+        """Process Registered event
 
-    async def _process_updated_event(self, db: Session, event):
-        """Process URIUpdated event (renamed from UriUpdated in Jan 2026 update)"""
+        The agent and its activity are written straight from the log; metadata
+        and classification are filled in later by the enrichment queue.
+        """
         token_id = event['args']['agentId']
-        metadata_uri = event['args']['newURI']  # renamed from newUri in Jan 2026 update
-
-        network_id = self._get_network_id(db)
-        agent = db.query(Agent).filter(
-            Agent.token_id == token_id,
-            Agent.network_id == network_id
-        ).first()
-
-        if not agent:
-            logger.warning(
-                "agent_not_found",
-                network=self.network_key,
-                token_id=token_id
-            )
-            return
-
-        # Fetch updated metadata
-        metadata = await self._fetch_metadata(metadata_uri)
-
-        # Update agent
-        name = metadata.get('name', agent.name)
-        description = metadata.get('description', agent.description)
-        oasf_data = await self._extract_oasf_data(metadata, name, description)
-
-        agent.name = name
-        agent.description = description
-        agent.metadata_uri = metadata_uri
-        agent.last_synced_at = datetime.utcnow()
-        agent.sync_status = SyncStatus.SYNCED
-        agent.skills = oasf_data.get('skills')
-        agent.domains = oasf_data.get('domains')
-        agent.classification_source = oasf_data.get('source')
-
-        db.commit()
+        owner = event['args']['owner']
+        metadata_uri = event['args']['agentURI']  # renamed from tokenURI in Jan 2026 update
 
         logger.info(
-            "agent_updated",
+            "processing_agent",
             network=self.network_key,
-            token_id=token_id
+            agent_id=token_id,
+            owner=owner,
+            block_timestamp=block_timestamp
         )
 
-    async def _process_feedback_event(self, db: Session, event):
-        """Process NewFeedback or FeedbackRevoked event"""
-        token_id = event['args']['agentId']
+        now = datetime.utcnow()
+        agent_id = self._new_agent_id(token_id)
+        name = placeholder_name(token_id)
+
+        # Create agent with blockchain timestamp, pending enrichment
+        buffer.register_agent(
+            {
+                "id": agent_id,
+                "token_id": token_id,
+                "name": name,
+                "address": owner.lower(),
+                "owner_address": owner.lower(),
+                "description": PENDING_DESCRIPTION,
+                "reputation_score": 0.0,
+                "reputation_count": 0,
+                "status": AgentStatus.ACTIVE,
+                "network_id": network_id,
+                "metadata_uri": metadata_uri,
+                "on_chain_data": dict(event['args']),
+                "sync_status": SyncStatus.SYNCING,
+                "registered_block": event['blockNumber'],
+                "last_synced_at": now,
+                "created_at": block_timestamp,
+                "updated_at": now,
+            },
+            # Create activity record
+            {
+                "id": self._new_activity_id(event, ActivityType.REGISTERED),
+                "agent_id": agent_id,
+                "activity_type": ActivityType.REGISTERED,
+                "description": f"Agent '{name}' (#{token_id}) registered on {self.network_config['name']}",
+                "tx_hash": event['transactionHash'].hex() if 'transactionHash' in event else None,
+                "block_number": event['blockNumber'],
+                "log_index": event['logIndex'],
+                "created_at": block_timestamp,
+            }
+        )
+
+    def _new_agent_id(self, token_id: int) -> str:
+        """Primary key of a newly registered agent"""
+        return new_agent_id()
+
+    def _new_activity_id(self, event, activity_type: ActivityType) -> str:
+        """Primary key of an activity attributed to `event`"""
+        return str(uuid.uuid4())
 
+    def _refresh_reputations(
+        self,
+        db: Session,
+        feedback_events: dict[int, list],
+        summaries: dict[int, tuple[int, int]],
+    ):
+        """Apply end-of-range reputation summaries to every agent with feedback events (caller commits)
+
+        Args:
+            feedback_events: token_id -> NewFeedback/FeedbackRevoked events in the range
+            summaries: token_id -> (count, average_score) after the range
+        """
         network_id = self._get_network_id(db)
-        agent = db.query(Agent).filter(
-            Agent.token_id == token_id,
+        agents = db.query(Agent).filter(
+            Agent.token_id.in_(list(feedback_events)),
             Agent.network_id == network_id
-        ).first()
+        ).all()
+        agents_by_token = {agent.token_id: agent for agent in agents}
 
-        if not agent:
-            logger.warning(
-                "agent_not_found_for_feedback",
-                network=self.network_key,
-                token_id=token_id
-            )
-            return
+        for token_id, events in feedback_events.items():
+            agent = agents_by_token.get(token_id)
+            if not agent:
+                logger.warning(
+                    "agent_not_found_for_feedback",
+                    network=self.network_key,
+                    token_id=token_id
+                )
+                continue
 
-        try:
-            # Call getSummary to get updated reputation
-            count, average_score = await asyncio.to_thread(
-                self.reputation_contract.functions.getSummary(
-                    token_id,
-                    [],
-                    b'\x00' * 32,
-                    b'\x00' * 32
-                ).call
-            )
+            summary = summaries.get(token_id)
+            if summary is None:
+                logger.warning(
+                    "reputation_update_from_event_failed",
+                    network=self.network_key,
+                    token_id=token_id,
+                    agent_name=agent.name,
+                    error="Summary not available"
+                )
+                continue
+
+            count, average_score = summary
+            last_event = events[-1]
 
             # Update reputation
             old_score = agent.reputation_score
@@ -479,310 +816,186 @@ class NetworkSyncService:
             agent.reputation_count = int(count)
             agent.reputation_last_updated = datetime.utcnow()
 
-            db.commit()
-
-            # Create activity record if score changed
+            # Create activity record if score changed, attributed to the latest event
             if old_score != float(average_score):
                 activity = Activity(
+                    id=self._new_activity_id(last_event, ActivityType.REPUTATION_UPDATE),
                     agent_id=agent.id,
                     activity_type=ActivityType.REPUTATION_UPDATE,
                     description=f"Reputation updated: {old_score:.1f} → {average_score:.1f} ({count} reviews)",
-                    tx_hash=event['transactionHash'].hex() if 'transactionHash' in event else None
+                    tx_hash=last_event['transactionHash'].hex() if 'transactionHash' in last_event else None,
+                    block_number=last_event['blockNumber'],
+                    log_index=last_event['logIndex']
                 )
                 db.add(activity)
-                db.commit()
 
             logger.info(
-                "reputation_updated_from_event",
+                "reputation_updated_from_events",
                 network=self.network_key,
                 token_id=token_id,
                 agent_name=agent.name,
                 score=average_score,
                 count=count,
-                event_type=event['event']
+                events=len(events)
             )
 
-        except Exception as e:
-            logger.warning(
-                "reputation_update_from_event_failed",
-                network=self.network_key,
-                token_id=token_id,
-                agent_name=agent.name,
-                error=str(e)
-            )
+    async def reconcile_reputations(self, sample_size: int = REPUTATION_RECONCILE_SAMPLE_SIZE) -> dict:
+        """Check the local reputation of a random sample of agents against getSummary
 
-    async def _fetch_metadata(self, uri: str, retries: int = MAX_RETRIES) -> dict:
-        """Fetch metadata from URI with retry logic"""
-        import base64
-        import json
-
-        # Handle empty URI
-        if not uri or uri.strip() == '':
-            logger.debug("empty_metadata_uri", network=self.network_key)
-            return {
-                'name': 'Unknown Agent',
-                'description': 'No metadata URI provided'
-            }
+        The contract is read at the block the local state is synced through.
+        Drifted agents are corrected from the chain and logged; persistent
+        drift means the feedback ledger is off and the reputation stream
+        should be replayed (reset_streams).
 
-        # Handle direct JSON string (object or array)
-        if uri.startswith('{') or uri.startswith('['):
-            try:
-                metadata = json.loads(uri)
-                # Handle list case
-                if isinstance(metadata, list):
-                    logger.warning(
-                        "direct_json_is_list",
-                        network=self.network_key,
-                        list_length=len(metadata)
-                    )
-                    if len(metadata) > 0 and isinstance(metadata[0], dict):
-                        metadata = metadata[0]
-                    else:
-                        return {
-                            'name': 'Unknown Agent',
-                            'description': 'Direct JSON is a list',
-                            'raw_data': metadata
-                        }
-                if not isinstance(metadata, dict):
-                    return {
-                        'name': 'Unknown Agent',
-                        'description': f'Direct JSON has unexpected type: {type(metadata).__name__}'
-                    }
-                logger.info(
-                    "direct_json_parsed",
-                    network=self.network_key,
-                    agent_id=metadata.get('agent_id', 'Unknown')
-                )
-                if 'name' not in metadata and 'agent_id' in metadata:
-                    metadata['name'] = metadata['agent_id']
-                if 'description' not in metadata:
-                    metadata['description'] = 'Agent from direct JSON'
-                return metadata
-            except Exception as e:
-                logger.warning(
-                    "direct_json_parse_failed",
-                    network=self.network_key,
-                    error=str(e),
-                    uri=uri[:100]
-                )
+        Returns {"checked": n, "drifted": [token_id, ...]}.
+        """
+        if sample_size <= 0 or not self.reputation_reader or "reputation" not in self.stream_contracts:
+            return {"checked": 0, "drifted": []}
 
-        # Handle data URI
-        if uri.startswith('data:'):
+        async with self._write_lock:
+            db = SessionLocal()
             try:
-                if 'base64,' in uri:
-                    base64_data = uri.split('base64,')[1]
-                    json_data = base64.b64decode(base64_data).decode('utf-8')
-                    metadata = json.loads(json_data)
-                elif ',' in uri:
-                    json_data = uri.split(',', 1)[1]
-                    from urllib.parse import unquote
-                    json_data = unquote(json_data)
-                    metadata = json.loads(json_data)
-                else:
+                sync_tracker = self._get_sync_tracker(db)
+                self.cursors.load(db, sync_tracker)
+                if "reputation" in self.cursors.lagging():
+                    # The ledger is still catching up; its aggregates are partial
+                    return {"checked": 0, "drifted": []}
+
+                network_id = self._get_network_id(db)
+                block = self.cursors.positions["reputation"]
+                token_ids = [
+                    token_id for (token_id,) in db.query(Agent.token_id).filter(
+                        Agent.network_id == network_id,
+                        Agent.reputation_count > 0
+                    ).order_by(func.random()).limit(sample_size)
+                ]
+
+                await use_shared_session(self.w3)
+                summaries = await self._read_reputation_summaries(token_ids, block)
+
+                drifted = []
+                for agent in db.query(Agent).filter(
+                    Agent.network_id == network_id, Agent.token_id.in_(list(summaries))
+                ):
+                    count, average_score = summaries[agent.token_id]
+                    if (agent.reputation_count, agent.reputation_score) == (count, float(average_score)):
+                        continue
+                    drifted.append(agent.token_id)
                     logger.warning(
-                        "unsupported_data_uri_format",
+                        "reputation_drift_detected",
                         network=self.network_key,
-                        uri=uri[:100]
+                        token_id=agent.token_id,
+                        block=block,
+                        local=(agent.reputation_count, agent.reputation_score),
+                        chain=(count, average_score)
                     )
-                    return {
-                        'name': 'Unknown Agent',
-                        'description': 'Unsupported data URI format'
-                    }
-
-                # Ensure metadata is a dict
-                if isinstance(metadata, list):
-                    logger.warning(
-                        "data_uri_is_list",
-                        network=self.network_key,
-                        list_length=len(metadata)
-                    )
-                    if len(metadata) > 0 and isinstance(metadata[0], dict):
-                        metadata = metadata[0]
-                    else:
-                        return {
-                            'name': 'Unknown Agent',
-                            'description': 'Data URI contains a list',
-                            'raw_data': metadata
-                        }
-                if not isinstance(metadata, dict):
-                    return {
-                        'name': 'Unknown Agent',
-                        'description': f'Data URI has unexpected type: {type(metadata).__name__}'
-                    }
+                    agent.reputation_score = float(average_score)
+                    agent.reputation_count = count
+                    agent.reputation_last_updated = datetime.utcnow()
+                db.commit()
 
                 logger.info(
-                    "data_uri_parsed",
-                    network=self.network_key,
-                    format="base64" if 'base64,' in uri else "plain",
-                    name=metadata.get('name', 'Unknown')
-                )
-                return metadata
-            except Exception as e:
-                logger.warning(
-                    "data_uri_parse_failed",
+                    "reputation_reconciled",
                     network=self.network_key,
-                    error=str(e),
-                    uri=uri[:100]
+                    block=block,
+                    checked=len(summaries),
+                    drifted=len(drifted)
                 )
-                return {
-                    'name': 'Unknown Agent',
-                    'description': 'Data URI parse failed'
-                }
-
-        # Handle IPFS URI
-        if uri.startswith('ipfs://'):
-            url = f"{IPFS_GATEWAY}{uri[7:]}"
-        else:
-            url = uri
-
-        # Fetch from HTTP/HTTPS URL
-        for attempt in range(retries):
+                return {"checked": len(summaries), "drifted": drifted}
+            finally:
+                db.close()
+
+    async def rollback_to(self, fork_block: int):
+        """Roll the network back to `fork_block` if it synced past it (removed logs seen live)"""
+        async with self._write_lock:
+            db = SessionLocal()
             try:
-                async with httpx.AsyncClient(timeout=10) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-                    # Ensure we always return a dict, not a list
-                    if isinstance(data, list):
-                        logger.warning(
-                            "metadata_is_list",
-                            network=self.network_key,
-                            url=url,
-                            list_length=len(data)
-                        )
-                        # If it's a list, try to use first item or wrap it
-                        if len(data) > 0 and isinstance(data[0], dict):
-                            return data[0]
-                        return {
-                            'name': 'Unknown Agent',
-                            'description': 'Metadata is a list, not an object',
-                            'raw_data': data
-                        }
-                    if not isinstance(data, dict):
-                        logger.warning(
-                            "metadata_unexpected_type",
-                            network=self.network_key,
-                            url=url,
-                            type=type(data).__name__
-                        )
-                        return {
-                            'name': 'Unknown Agent',
-                            'description': f'Metadata has unexpected type: {type(data).__name__}'
-                        }
-                    return data
-            except Exception as e:
-                logger.warning(
-                    "metadata_fetch_failed",
-                    network=self.network_key,
-                    url=url,
-                    attempt=attempt + 1,
-                    error=str(e)
-                )
-                if attempt < retries - 1:
-                    await asyncio.sleep(RETRY_DELAY_SECONDS)
-
-        return {
-            'name': 'Unknown Agent',
-            'description': 'Metadata fetch failed'
-        }
-
-    def _is_valid_description(self, description: str) -> bool:
-        """Check if description is valid for AI classification"""
-        if not description or not isinstance(description, str):
-            return False
-
-        description = description.strip()
-
-        MIN_DESCRIPTION_LENGTH = 20
-        if len(description) < MIN_DESCRIPTION_LENGTH:
-            return False
-
-        invalid_patterns = [
-            'no metadata', 'metadata fetch failed', 'no description',
-            'unknown agent', 'agent from direct json', 'no metadata uri provided',
-            'failed to fetch', 'error fetching', 'not available', 'n/a',
-            'test agent', 'created at', 'updated', 'lorem ipsum',
-            'todo', 'placeholder', 'example', 'demo agent',
-        ]
-
-        description_lower = description.lower()
-        for pattern in invalid_patterns:
-            if pattern in description_lower:
-                return False
-
-        digit_count = sum(c.isdigit() for c in description)
-        if digit_count / len(description) > 0.5:
-            return False
+                sync_tracker = self._get_sync_tracker(db)
+                self.cursors.load(db, sync_tracker)
+                if self.cursors.head > fork_block:
+                    await self._rollback(db, sync_tracker, fork_block)
+            finally:
+                db.close()
+
+    async def _rollback(self, db: Session, sync_tracker: BlockchainSync, fork_block: int):
+        """Undo writes from blocks above the fork point and move the checkpoint back (commits)
+
+        Agents registered above the fork are deleted (the re-sync inserts them
+        again if the canonical chain has them too). Surviving agents touched
+        above the fork get their URI re-read from the chain and their
+        reputation recomputed from the rolled back feedback ledger (unless the
+        reputation stream is still catching up).
+        """
+        network_id = self._get_network_id(db)
 
-        return True
-
-    async def _extract_oasf_data(
-        self, metadata: dict, name: str, description: str
-    ) -> dict:
-        """Extract or auto-classify OASF skills and domains"""
-        skills = []
-        domains = []
-
-        # Try to extract from metadata endpoints
-        if 'endpoints' in metadata and isinstance(metadata['endpoints'], list):
-            for endpoint in metadata['endpoints']:
-                if isinstance(endpoint, dict):
-                    if 'skills' in endpoint and isinstance(endpoint['skills'], list):
-                        skills.extend(endpoint['skills'])
-                    if 'domains' in endpoint and isinstance(endpoint['domains'], list):
-                        domains.extend(endpoint['domains'])
-
-        if skills or domains:
-            logger.info(
-                "oasf_extracted_from_metadata",
-                network=self.network_key,
-                name=name,
-                skills_count=len(skills),
-                domains_count=len(domains)
+        # Read phase: current on-chain state of the surviving touched agents
+        orphaned_tokens = {
+            token_id for (token_id,) in db.query(Agent.token_id).filter(
+                Agent.network_id == network_id,
+                Agent.registered_block > fork_block
             )
-            return {
-                "skills": list(set(skills))[:5],
-                "domains": list(set(domains))[:3],
-                "source": "metadata"
-            }
+        }
+        touched = sorted(self.reorg_guard.touched_tokens(db, fork_block) - orphaned_tokens)
+        uris = await asyncio.gather(
+            *(self.contract.functions.tokenURI(token_id).call() for token_id in touched),
+            return_exceptions=True
+        )
 
-        # Use AI classification if description is valid
-        if not self._is_valid_description(description):
-            logger.info(
-                "oasf_classification_skipped",
-                network=self.network_key,
-                name=name,
-                reason="insufficient_description",
-                description_preview=description[:50] if description else None
-            )
-            return {"skills": [], "domains": [], "source": None}
+        # Write phase (ledgers first: orphaned agents' feedback and validations are all above the fork)
+        feedbacks_deleted = self.reputation_ledger.rollback(db, network_id, fork_block)
+        validations_deleted = self.validation_index.rollback(db, network_id, fork_block)
+        deleted = self.reorg_guard.rollback(db, network_id, fork_block)
+        self.block_timestamps.forget_above(fork_block)
+        if self.log_archive is not None:
+            self.log_archive.forget_above(db, fork_block)
+
+        # URIs changed only by orphaned URIUpdated events are restored (and refetched)
+        current_uris = dict(db.query(Agent.token_id, Agent.metadata_uri).filter(
+            Agent.network_id == network_id, Agent.token_id.in_(touched)
+        ).all())
+        buffer = RangeWriteBuffer(db, network_id)
+        for token_id, uri in zip(touched, uris):
+            if not isinstance(uri, Exception) and token_id in current_uris and uri != current_uris[token_id]:
+                buffer.update_uri(token_id, uri)
+        buffer.flush()
+
+        rolled_back_from = self.cursors.head
+        reputation_lagging = "reputation" in self.cursors.lagging()
+        self.cursors.rewind(db, fork_block)
+        sync_tracker.last_block = self.cursors.floor
+
+        # While the reputation stream catches up, the ledger is partial and scores are left alone
+        if reputation_lagging and "reputation" not in self.cursors.lagging():
+            self._recompute_reputations(db)
+        elif not reputation_lagging:
+            summaries = self.reputation_ledger.summaries(db, network_id, touched)
+            for agent in db.query(Agent).filter(
+                Agent.network_id == network_id, Agent.token_id.in_(list(summaries))
+            ):
+                count, average_score = summaries[agent.token_id]
+                agent.reputation_score = float(average_score)
+                agent.reputation_count = int(count)
+                agent.reputation_last_updated = datetime.utcnow()
+        db.commit()
 
-        try:
-            classification = await ai_classifier_service.classify_agent(
-                name, description
-            )
-            logger.info(
-                "oasf_auto_classified",
-                network=self.network_key,
-                name=name,
-                skills_count=len(classification.get('skills', [])),
-                domains_count=len(classification.get('domains', []))
-            )
-            classification["source"] = "ai"
-            return classification
-        except Exception as e:
-            logger.warning(
-                "oasf_classification_failed",
-                network=self.network_key,
-                name=name,
-                error=str(e)
-            )
-            return {"skills": [], "domains": [], "source": None}
+        logger.warning(
+            "chain_reorg_rolled_back",
+            network=self.network_key,
+            fork_block=fork_block,
+            rolled_back_from=rolled_back_from,
+            agents_refreshed=len(touched),
+            feedbacks_deleted=feedbacks_deleted,
+            validations_deleted=validations_deleted,
+            **deleted
+        )
 
     def _get_sync_tracker(self, db: Session) -> BlockchainSync:
         """Get or create blockchain sync tracker for this network"""
-        contracts = self.network_config.get("contracts", {})
-        identity_address = contracts.get("identity", "")
+        # Later runs load the tracker by primary key
+        if self._sync_tracker_id is not None:
+            sync = db.get(BlockchainSync, self._sync_tracker_id)
+            if sync is not None:
+                return sync
 
         sync = db.query(BlockchainSync).filter(
             BlockchainSync.network_name == self.network_key
@@ -791,36 +1004,59 @@ class NetworkSyncService:
         if not sync:
             sync = BlockchainSync(
                 network_name=self.network_key,
-                contract_address=identity_address,
+                contract_address=self.network.contract_address("identity"),
                 last_block=self.start_block - 1,
                 status=SyncStatusEnum.IDLE
             )
             db.add(sync)
             db.commit()
 
+        self._sync_tracker_id = sync.id
         return sync
 
     def _get_network_id(self, db: Session) -> str:
-        """Get network ID from database"""
-        network = db.query(Network).filter(
-            Network.chain_id == self.network_config["chain_id"]
-        ).first()
+        """Get network ID from database (resolved once per process)"""
+        return self.network.network_id(db)
 
-        if network:
-            return network.id
+    async def reset_streams(self, streams: list[str], to_block: Optional[int] = None) -> dict[str, int]:
+        """Move stream cursors back so the next syncs replay those streams only
 
-        # Create if not exists
-        network = Network(
-            name=self.network_config["name"],
-            chain_id=self.network_config["chain_id"],
-            rpc_url=self.network_config["rpc_url"],
-            explorer_url=self.network_config["explorer_url"],
-            contracts=self.network_config.get("contracts")
-        )
-        db.add(network)
-        db.commit()
-        return network.id
+        Backfill partitions above `to_block` are dropped, so a later backfill
+        plans the range afresh instead of resuming a stale plan.
 
+        Args:
+            streams: Stream names (keys of SYNC_STREAMS)
+            to_block: Last block kept (defaults to before start_block, a full replay)
+
+        Returns the cursor positions after the reset.
+        """
+        unknown = set(streams) - set(self.stream_contracts)
+        if unknown:
+            raise ValueError(f"Unknown streams for '{self.network_key}': {sorted(unknown)}")
+
+        to_block = self.start_block - 1 if to_block is None else to_block
+        # Under the write lock, so no in-flight range moves the cursors past the reset
+        async with self._write_lock:
+            db = SessionLocal()
+            try:
+                sync_tracker = self._get_sync_tracker(db)
+                self.cursors.load(db, sync_tracker)
+                self.cursors.rewind(db, to_block, streams)
+                sync_tracker.last_block = self.cursors.floor
+                db.query(SyncRangeProgress).filter(
+                    SyncRangeProgress.network_name == self.network_key,
+                    SyncRangeProgress.to_block > to_block
+                ).delete(synchronize_session=False)
+                db.commit()
+                logger.info(
+                    "sync_streams_reset",
+                    network=self.network_key,
+                    streams=streams,
+                    to_block=to_block
+                )
+                return dict(self.cursors.positions)
+            finally:
+                db.close()
 
 # Global instances for each enabled network
 _sync_services: dict[str, NetworkSyncService] = {}
@@ -833,10 +1069,6 @@ def get_sync_service(network_key: str) -> NetworkSyncService:
     return _sync_services[network_key]
 
 
-# Backward compatibility: default Sepolia sync service
-blockchain_sync_service = get_sync_service("sepolia")
-
-
 # Convenience functions for scheduler
 async def sync_sepolia():
     """Sync Sepolia network"""
@@ -857,15 +1089,7 @@ async def sync_bsc_testnet():
 
 
 async def sync_all_networks():
-    """Sync all enabled networks sequentially"""
-    for network_key, config in NETWORKS.items():
-        if config.get("enabled", True):
-            try:
-                service = get_sync_service(network_key)
-                await service.sync()
-            except Exception as e:
-                logger.error(
-                    "network_sync_failed",
-                    network=network_key,
-                    error=str(e)
-                )
+    """Sync all enabled networks concurrently, once"""
+    from src.services.sync_orchestrator import get_sync_orchestrator
+
+    await get_sync_orchestrator().sync_all()
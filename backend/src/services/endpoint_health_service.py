@@ -18,6 +18,7 @@ from src.db.database import SessionLocal
 from src.models import Agent, Network
 from src.services.subgraph_service import get_subgraph_service
 from src.services.onchain_feedback_service import get_onchain_feedback_service
+from src.services.metadata_fetcher import get_metadata_fetcher
 
 logger = structlog.get_logger(__name__)
 
@@ -168,15 +169,12 @@ class EndpointHealthService:
         else:
             url = uri
 
-        # Fetch from HTTP/HTTPS URL
+        # Fetch from HTTP/HTTPS URL (shared client + persistent metadata cache)
         try:
-            async with httpx.AsyncClient(timeout=METADATA_FETCH_TIMEOUT) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                if isinstance(data, list) and len(data) > 0:
-                    data = data[0]
-                return data if isinstance(data, dict) else {}
+            data = await get_metadata_fetcher().fetch_json(url, timeout=METADATA_FETCH_TIMEOUT)
+            if isinstance(data, list) and len(data) > 0:
+                data = data[0]
+            return data if isinstance(data, dict) else {}
         except Exception as e:
             logger.debug("metadata_fetch_failed", url=url, error=str(e))
             return {}
@@ -0,0 +1,356 @@
+"""Agent enrichment queue
+
+Second stage of ingest. The chain sync writes agents straight from their
+Registered/URIUpdated logs (sync_status=SYNCING) and queues enrichment
+jobs here; a pool of workers then fetches metadata and classifies agents
+without holding up the sync.
+
+Jobs live in the enrichment_jobs table, so they survive restarts. Each
+job is read, worked on, then written back in three separate steps so no
+database transaction stays open across network I/O.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+import structlog
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from src.core.blockchain_config import (
+    ENRICHMENT_WORKERS,
+    ENRICHMENT_BATCH_SIZE,
+    ENRICHMENT_MAX_ATTEMPTS,
+    ENRICHMENT_RETRY_BASE_SECONDS,
+    ENRICHMENT_STALE_MINUTES,
+)
+from src.db.database import SessionLocal
+from src.models import (
+    Agent, Activity, ActivityType, SyncStatus,
+    EnrichmentJob, EnrichmentJobType, EnrichmentJobStatus,
+)
+from src.services.ai_classifier import ai_classifier_service
+from src.services.metadata_fetcher import get_metadata_fetcher
+
+logger = structlog.get_logger(__name__)
+
+PENDING_DESCRIPTION = "Metadata pending"
+
+
+def placeholder_name(token_id: int) -> str:
+    """Name shown for an agent until its metadata is fetched"""
+    return f"Agent #{token_id}"
+
+
+def new_agent_id() -> str:
+    """Agent primary key, assigned up front so jobs can reference unflushed agents"""
+    return str(uuid.uuid4())
+
+
+def enqueue(
+    db: Session,
+    agent_id: str,
+    job_type: EnrichmentJobType,
+    metadata_uri: Optional[str] = None,
+):
+    """Queue an enrichment job (caller commits)"""
+    enqueue_many(db, job_type, {agent_id: metadata_uri})
+
+
+def enqueue_metadata_fetches(db: Session, uris: dict[str, str]):
+    """Queue FETCH_METADATA jobs for many agents at once (caller commits)
+
+    Args:
+        uris: agent_id -> metadata URI to resolve
+    """
+    enqueue_many(db, EnrichmentJobType.FETCH_METADATA, uris)
+
+
+def enqueue_many(
+    db: Session,
+    job_type: EnrichmentJobType,
+    uris: dict[str, Optional[str]],
+):
+    """Queue jobs of one type for many agents (caller commits)
+
+    A pending job of the same type for an agent is reused and requeued with
+    the new URI, so a burst of URIUpdated events results in a single fetch
+    of the latest URI. New jobs are written with one bulk insert.
+
+    Args:
+        uris: agent_id -> metadata URI (None for jobs that don't need one)
+    """
+    if not uris:
+        return
+
+    pending = {
+        job.agent_id: job
+        for job in db.query(EnrichmentJob).filter(
+            EnrichmentJob.agent_id.in_(list(uris)),
+            EnrichmentJob.job_type == job_type,
+            EnrichmentJob.status == EnrichmentJobStatus.PENDING
+        )
+    }
+
+    now = datetime.utcnow()
+    new_jobs = []
+    for agent_id, metadata_uri in uris.items():
+        job = pending.get(agent_id)
+        if job:
+            job.metadata_uri = metadata_uri
+            job.attempts = 0
+            job.run_after = now
+        else:
+            new_jobs.append({
+                "agent_id": agent_id,
+                "job_type": job_type,
+                "status": EnrichmentJobStatus.PENDING,
+                "metadata_uri": metadata_uri,
+                "attempts": 0,
+                "run_after": now,
+                "created_at": now,
+                "updated_at": now,
+            })
+
+    if new_jobs:
+        db.execute(insert(EnrichmentJob), new_jobs)
+
+
+def extract_oasf_from_metadata(metadata: dict) -> Optional[dict]:
+    """OASF skills/domains declared in metadata endpoints, None if there are none"""
+    skills = []
+    domains = []
+
+    if 'endpoints' in metadata and isinstance(metadata['endpoints'], list):
+        for endpoint in metadata['endpoints']:
+            if isinstance(endpoint, dict):
+                if 'skills' in endpoint and isinstance(endpoint['skills'], list):
+                    skills.extend(endpoint['skills'])
+                if 'domains' in endpoint and isinstance(endpoint['domains'], list):
+                    domains.extend(endpoint['domains'])
+
+    if not skills and not domains:
+        return None
+
+    return {
+        "skills": list(set(skills))[:5],
+        "domains": list(set(domains))[:3],
+        "source": "metadata"
+    }
+
+
+class EnrichmentWorker:
+    """Drains the enrichment queue with a bounded pool of concurrent jobs"""
+
+    def __init__(self, concurrency: int = ENRICHMENT_WORKERS):
+        self.concurrency = concurrency
+
+    async def drain(self, max_rounds: int = 10) -> int:
+        """Run due jobs until the queue is empty (or `max_rounds` batches)
+
+        Returns the number of jobs run.
+        """
+        total = 0
+        for _ in range(max_rounds):
+            job_ids = self._claim(ENRICHMENT_BATCH_SIZE)
+            if not job_ids:
+                break
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def run(job_id: int):
+                async with semaphore:
+                    await self._run_job(job_id)
+
+            await asyncio.gather(*(run(job_id) for job_id in job_ids))
+            total += len(job_ids)
+
+            if len(job_ids) < ENRICHMENT_BATCH_SIZE:
+                break
+
+        if total:
+            logger.info("enrichment_drained", jobs=total, **self.stats())
+            metadata_cache = get_metadata_fetcher().cache
+            if metadata_cache:
+                logger.info("metadata_cache_stats", **await asyncio.to_thread(metadata_cache.stats))
+        return total
+
+    def stats(self) -> dict:
+        """Queue size per status"""
+        with SessionLocal() as db:
+            rows = db.query(EnrichmentJob.status, func.count(EnrichmentJob.id)).group_by(
+                EnrichmentJob.status
+            ).all()
+        return {status.value: count for status, count in rows}
+
+    def _claim(self, limit: int) -> list[int]:
+        """Mark up to `limit` due jobs as running and return their IDs"""
+        now = datetime.utcnow()
+        with SessionLocal() as db:
+            # Requeue jobs left running by a crashed or restarted worker
+            db.query(EnrichmentJob).filter(
+                EnrichmentJob.status == EnrichmentJobStatus.RUNNING,
+                EnrichmentJob.updated_at < now - timedelta(minutes=ENRICHMENT_STALE_MINUTES)
+            ).update({EnrichmentJob.status: EnrichmentJobStatus.PENDING}, synchronize_session=False)
+
+            jobs = db.query(EnrichmentJob).filter(
+                EnrichmentJob.status == EnrichmentJobStatus.PENDING,
+                EnrichmentJob.run_after <= now
+            ).order_by(EnrichmentJob.id).limit(limit).all()
+
+            for job in jobs:
+                job.status = EnrichmentJobStatus.RUNNING
+                job.attempts += 1
+                job.updated_at = now
+            db.commit()
+            return [job.id for job in jobs]
+
+    async def _run_job(self, job_id: int):
+        with SessionLocal() as db:
+            job = db.get(EnrichmentJob, job_id)
+            if job is None:
+                return
+            agent = db.get(Agent, job.agent_id)
+            if agent is None:
+                db.delete(job)
+                db.commit()
+                return
+            job_type = job.job_type
+            metadata_uri = job.metadata_uri
+            attempts = job.attempts
+            token_id = agent.token_id
+            name, description = agent.name, agent.description
+
+        try:
+            if job_type == EnrichmentJobType.FETCH_METADATA:
+                metadata = await get_metadata_fetcher().fetch(
+                    metadata_uri, strict=True, token_id=token_id
+                )
+                self._apply_metadata(job_id, metadata_uri, metadata)
+            else:
+                classification = await ai_classifier_service.classify_agent(name, description)
+                self._apply_classification(job_id, classification)
+        except Exception as e:
+            self._record_failure(job_id, attempts, e)
+
+    def _apply_metadata(self, job_id: int, metadata_uri: str, metadata: dict):
+        """Write fetched metadata to the agent and finish the job"""
+        with SessionLocal() as db:
+            job = db.get(EnrichmentJob, job_id)
+            agent = db.get(Agent, job.agent_id)
+
+            # A newer URIUpdated superseded this fetch, its own job will apply it
+            if agent is None or agent.metadata_uri != metadata_uri:
+                db.delete(job)
+                db.commit()
+                return
+
+            old_name = agent.name
+            agent.name = metadata.get('name') or placeholder_name(agent.token_id)
+            agent.description = metadata.get('description') or 'No description'
+            agent.sync_status = SyncStatus.SYNCED
+            agent.last_synced_at = datetime.utcnow()
+
+            oasf_data = extract_oasf_from_metadata(metadata)
+            if oasf_data:
+                agent.skills = oasf_data["skills"]
+                agent.domains = oasf_data["domains"]
+                agent.classification_source = oasf_data["source"]
+            elif ai_classifier_service.is_valid_description(agent.description):
+                enqueue(db, agent.id, EnrichmentJobType.CLASSIFY)
+            else:
+                logger.info(
+                    "oasf_classification_skipped",
+                    token_id=agent.token_id,
+                    reason="insufficient_description"
+                )
+                agent.skills = []
+                agent.domains = []
+                agent.classification_source = None
+
+            # The registration activity was written with the placeholder name
+            if old_name != agent.name:
+                activity = db.query(Activity).filter(
+                    Activity.agent_id == agent.id,
+                    Activity.activity_type == ActivityType.REGISTERED
+                ).first()
+                if activity and f"'{old_name}'" in activity.description:
+                    activity.description = activity.description.replace(
+                        f"'{old_name}'", f"'{agent.name}'", 1
+                    )
+
+            db.delete(job)
+            db.commit()
+
+            logger.info(
+                "agent_enriched",
+                token_id=agent.token_id,
+                name=agent.name,
+                oasf_source=agent.classification_source
+            )
+
+    def _apply_classification(self, job_id: int, classification: dict):
+        """Write AI classification to the agent and finish the job"""
+        with SessionLocal() as db:
+            job = db.get(EnrichmentJob, job_id)
+            agent = db.get(Agent, job.agent_id)
+
+            # Metadata-declared OASF data takes precedence over classification
+            if agent is not None and agent.classification_source != "metadata":
+                agent.skills = classification.get('skills', [])
+                agent.domains = classification.get('domains', [])
+                agent.classification_source = "ai"
+                logger.info(
+                    "oasf_auto_classified",
+                    token_id=agent.token_id,
+                    skills_count=len(agent.skills),
+                    domains_count=len(agent.domains)
+                )
+
+            db.delete(job)
+            db.commit()
+
+    def _record_failure(self, job_id: int, attempts: int, error: Exception):
+        """Schedule a retry with backoff, or give up after ENRICHMENT_MAX_ATTEMPTS"""
+        with SessionLocal() as db:
+            job = db.get(EnrichmentJob, job_id)
+            if job is None:
+                return
+
+            job.last_error = str(error)[:500]
+            if attempts >= ENRICHMENT_MAX_ATTEMPTS:
+                job.status = EnrichmentJobStatus.FAILED
+                agent = db.get(Agent, job.agent_id)
+                if agent is not None and job.job_type == EnrichmentJobType.FETCH_METADATA:
+                    agent.sync_status = SyncStatus.FAILED
+                    if agent.description == PENDING_DESCRIPTION:
+                        agent.description = 'Metadata fetch failed'
+            else:
+                job.status = EnrichmentJobStatus.PENDING
+                job.run_after = datetime.utcnow() + timedelta(
+                    seconds=ENRICHMENT_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+                )
+            db.commit()
+
+            logger.warning(
+                "enrichment_job_failed",
+                job_id=job_id,
+                job_type=job.job_type.value,
+                attempts=attempts,
+                gave_up=job.status == EnrichmentJobStatus.FAILED,
+                error=str(error)[:200]
+            )
+
+
+# Global worker instance
+_enrichment_worker: Optional[EnrichmentWorker] = None
+
+
+def get_enrichment_worker() -> EnrichmentWorker:
+    """Get the enrichment worker singleton"""
+    global _enrichment_worker
+    if _enrichment_worker is None:
+        _enrichment_worker = EnrichmentWorker()
+    return _enrichment_worker
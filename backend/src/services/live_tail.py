@@ -0,0 +1,201 @@
+"""Live head-following for the chain sync
+
+Streams the identity and reputation contract logs of one network as
+blocks arrive and applies them through NetworkSyncService within seconds:
+
+- Subscription mode (network has a ws_url): eth_subscribe("logs") plus
+  eth_subscribe("newHeads") over one WebSocket connection.
+- Filter mode (HTTP only, LIVE_TAIL_POLLING_ENABLED): an eth_newFilter
+  polled with eth_getFilterChanges on a single pinned endpoint (filters
+  live on the node that created them, so they can't go through the
+  failover pool). Empty polls cost one request; the head is read and the
+  checkpoint advanced only every LIVE_TAIL_CHECKPOINT_SECONDS without logs.
+
+The stream is opened before the gap repair runs, so no block falls between
+the two. After every (re)connect the range-based sync catches up from the
+checkpoint; while the tail is streaming the scheduled range sync is skipped.
+
+Removed logs (or a checkpoint hash mismatch found by the ReorgGuard) mean a
+reorg: the network is rolled back to the fork point and the tail reconnects,
+so the gap repair replays the canonical blocks.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import structlog
+from web3 import AsyncWeb3, WebSocketProvider
+
+from src.core.blockchain_config import (
+    LIVE_TAIL_POLL_SECONDS,
+    LIVE_TAIL_CHECKPOINT_SECONDS,
+    LIVE_TAIL_RECONNECT_MAX_SECONDS,
+    RPC_MAX_REQUESTS_PER_SECOND,
+)
+from src.services.reorg_guard import ChainReorgDetected
+from src.services.rpc_client import create_async_web3, use_shared_session
+
+logger = structlog.get_logger(__name__)
+
+
+def _as_int(value) -> int:
+    """Block numbers arrive as ints (formatted) or hex strings (raw)"""
+    return value if isinstance(value, int) else int(value, 16)
+
+
+class LiveTail:
+    """Follows the chain head of one network (one long-running task)"""
+
+    def __init__(self, service):
+        """
+        Args:
+            service: The network's NetworkSyncService
+        """
+        self.service = service
+        self.network_key = service.network_key
+        self.ws_url: str = service.network_config.get("ws_url") or ""
+        self.mode = "subscription" if self.ws_url else "filter"
+        self.streaming = False  # True while events are being applied live
+        self.failures = 0
+        self._task: Optional[asyncio.Task] = None
+        self._filter_w3: Optional[AsyncWeb3] = None
+
+    @property
+    def _log_params(self) -> dict:
+        reader = self.service.log_reader
+        return {"address": reader.addresses, "topics": [reader.topics]}
+
+    def start(self):
+        """Start following the head on the running event loop"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name=f"live_tail:{self.network_key}")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self):
+        """Follow the head forever, reconnecting with backoff"""
+        logger.info("live_tail_started", network=self.network_key, mode=self.mode)
+        while True:
+            try:
+                if self.mode == "subscription":
+                    await self._follow_subscription()
+                else:
+                    await self._follow_filter()
+                logger.warning("live_tail_stream_ended", network=self.network_key)
+            except asyncio.CancelledError:
+                raise
+            except ChainReorgDetected as e:
+                logger.warning(
+                    "live_tail_reorg", network=self.network_key, fork_block=e.fork_block
+                )
+                try:
+                    await self.service.rollback_to(e.fork_block)
+                except Exception as rollback_error:
+                    self.failures += 1
+                    logger.error(
+                        "live_tail_rollback_failed",
+                        network=self.network_key,
+                        error=str(rollback_error)[:200]
+                    )
+            except Exception as e:
+                self.failures += 1
+                logger.warning(
+                    "live_tail_disconnected",
+                    network=self.network_key,
+                    mode=self.mode,
+                    failures=self.failures,
+                    error=str(e)[:200]
+                )
+            finally:
+                self.streaming = False
+
+            await asyncio.sleep(min(LIVE_TAIL_RECONNECT_MAX_SECONDS, 2 ** self.failures))
+
+    async def _repair_gap(self):
+        """Range-sync from the checkpoint to the head (after every connect)"""
+        while not await self.service.sync():
+            if self.service.last_error:
+                raise RuntimeError(f"gap repair failed: {self.service.last_error}")
+
+    def _streaming_started(self):
+        self.streaming = True
+        self.failures = 0
+        logger.info("live_tail_streaming", network=self.network_key, mode=self.mode)
+
+    async def _follow_subscription(self):
+        async with AsyncWeb3(WebSocketProvider(self.ws_url)) as w3:
+            logs_subscription = await w3.eth.subscribe("logs", self._log_params)
+            await w3.eth.subscribe("newHeads")
+
+            await self._repair_gap()
+            self._streaming_started()
+
+            # Logs are applied per block: when a later block's log or a new head arrives
+            pending: list = []
+            async for message in w3.socket.process_subscriptions():
+                result = message["result"]
+                if message["subscription"] == logs_subscription:
+                    block_number = _as_int(result["blockNumber"])
+                    if result.get("removed"):
+                        raise ChainReorgDetected(block_number - 1, "removed log")
+                    if pending and _as_int(pending[-1]["blockNumber"]) < block_number:
+                        await self._flush(pending, block_number - 1)
+                    pending.append(result)
+                else:
+                    # Logs of the new head itself may still arrive: only earlier blocks are complete
+                    head = _as_int(result["number"])
+                    ready = [log for log in pending if _as_int(log["blockNumber"]) < head]
+                    pending[:] = [log for log in pending if _as_int(log["blockNumber"]) >= head]
+                    await self._flush(ready, head - 1, head)
+
+    async def _follow_filter(self):
+        if self._filter_w3 is None:
+            self._filter_w3 = create_async_web3(
+                self.service.network.rpc_urls[0],
+                rate_limit=self.service.network_config.get(
+                    "rpc_rate_limit", RPC_MAX_REQUESTS_PER_SECOND
+                )
+            )
+        w3 = self._filter_w3
+        await use_shared_session(w3)
+
+        log_filter = await w3.eth.filter({**self._log_params, "fromBlock": "latest"})
+        try:
+            await self._repair_gap()
+            self._streaming_started()
+
+            checkpointed_at = time.monotonic()
+            while True:
+                # Every log up to this head is in this or an earlier poll's changes
+                checkpoint_due = time.monotonic() - checkpointed_at >= LIVE_TAIL_CHECKPOINT_SECONDS
+                head = await w3.eth.block_number if checkpoint_due else 0
+                logs = await w3.eth.get_filter_changes(log_filter.filter_id)
+                removed = [_as_int(log["blockNumber"]) for log in logs if log.get("removed")]
+                if removed:
+                    raise ChainReorgDetected(min(removed) - 1, "removed log")
+                # Filters deliver a block's logs together, so the newest log's block is complete
+                if logs or checkpoint_due:
+                    checkpoint = max([head] + [_as_int(log["blockNumber"]) for log in logs])
+                    await self._flush(logs, checkpoint, checkpoint)
+                    checkpointed_at = time.monotonic()
+                await asyncio.sleep(LIVE_TAIL_POLL_SECONDS)
+        finally:
+            try:
+                await w3.eth.uninstall_filter(log_filter.filter_id)
+            except Exception:
+                pass
+
+    async def _flush(self, raw_logs: list, checkpoint: int, head: Optional[int] = None):
+        """Decode and apply buffered logs, then clear the buffer"""
+        logs = list(raw_logs)
+        raw_logs.clear()
+        events = self.service.log_reader.decode(logs)
+        await self.service.apply_live_events(events, checkpoint, head, raw_logs=logs)
@@ -0,0 +1,199 @@
+"""Local raw log archive
+
+Every log the sync fetches is kept in raw_logs, and log_archive_ranges
+records for which blocks each (contract address, topic0) pair is complete.
+LogReader reads archived ranges locally and only asks the RPC for the
+rest, so resets and resyncs (and rebuilding derived tables after a logic
+change) replay from disk instead of re-downloading the chain.
+
+Archived logs above a reorg fork point are dropped with the rest of the
+rollback (forget_above).
+"""
+
+from typing import Iterable, Optional
+
+import structlog
+from hexbytes import HexBytes
+from sqlalchemy.orm import Session
+from web3 import Web3
+
+from src.db.database import SessionLocal
+from src.models import RawLog, LogArchiveRange
+from src.services.sync_writer import dialect_insert
+
+logger = structlog.get_logger(__name__)
+
+
+def _hex(value) -> str:
+    """Hex string of a HexBytes/bytes value (raw RPC logs are already hex)"""
+    return value if isinstance(value, str) else Web3.to_hex(value)
+
+
+def _int(value) -> int:
+    return value if isinstance(value, int) else int(value, 16)
+
+
+class LogArchive:
+    """Per-chain raw log archive"""
+
+    def __init__(self, chain_id: int):
+        self.chain_id = chain_id
+
+    def covered_until(
+        self, db: Session, pairs: Iterable[tuple[str, str]], from_block: int, to_block: int
+    ) -> int:
+        """Last block of [from_block, to_block] archived for every pair (from_block - 1 if none)"""
+        archived_to = to_block
+        for address, topic in pairs:
+            row = db.query(LogArchiveRange).filter(
+                LogArchiveRange.chain_id == self.chain_id,
+                LogArchiveRange.address == address,
+                LogArchiveRange.topic == topic,
+                LogArchiveRange.from_block <= from_block,
+                LogArchiveRange.to_block >= from_block
+            ).first()
+            if row is None:
+                return from_block - 1
+            archived_to = min(archived_to, row.to_block)
+        return archived_to
+
+    def read(
+        self,
+        pairs: list[tuple[str, str]],
+        addresses: list[str],
+        topics: list[str],
+        from_block: int,
+        to_block: int,
+    ) -> tuple[list, int]:
+        """Archived logs of the longest archived prefix of [from_block, to_block]
+
+        Returns (logs in eth_getLogs format, last archived block of the range).
+        """
+        db = SessionLocal()
+        try:
+            archived_to = self.covered_until(db, pairs, from_block, to_block)
+            if archived_to < from_block:
+                return [], archived_to
+
+            wanted_topics = set(topics)
+            rows = db.query(RawLog).filter(
+                RawLog.chain_id == self.chain_id,
+                RawLog.block_number >= from_block,
+                RawLog.block_number <= archived_to,
+                RawLog.address.in_(addresses)
+            ).order_by(RawLog.block_number, RawLog.log_index).all()
+
+            logs = [self._to_log(row) for row in rows if row.topics and row.topics[0] in wanted_topics]
+            logger.debug(
+                "log_archive_hit",
+                chain_id=self.chain_id,
+                from_block=from_block,
+                to_block=archived_to,
+                logs=len(logs)
+            )
+            return logs, archived_to
+        finally:
+            db.close()
+
+    def store(
+        self,
+        pairs: list[tuple[str, str]],
+        logs: list,
+        from_block: int,
+        to_block: int,
+        db: Optional[Session] = None,
+    ):
+        """Archive the logs fetched for [from_block, to_block] and mark the range complete
+
+        Commits its own session unless `db` is given (then the caller commits).
+        A failed write only costs a refetch later, so it is logged, not raised.
+        """
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            rows = [self._to_row(log) for log in logs]
+            if rows:
+                db.execute(dialect_insert(db, RawLog).on_conflict_do_nothing(), rows)
+            for address, topic in pairs:
+                self._extend_range(db, address, topic, from_block, to_block)
+            if own_session:
+                db.commit()
+        except Exception as e:
+            if not own_session:
+                raise
+            db.rollback()
+            logger.warning(
+                "log_archive_store_failed",
+                chain_id=self.chain_id,
+                from_block=from_block,
+                to_block=to_block,
+                error=str(e)[:200]
+            )
+        finally:
+            if own_session:
+                db.close()
+
+    def forget_above(self, db: Session, block_number: int):
+        """Drop archived logs and coverage above `block_number` (reorg rollback, caller commits)"""
+        db.query(RawLog).filter(
+            RawLog.chain_id == self.chain_id,
+            RawLog.block_number > block_number
+        ).delete(synchronize_session=False)
+        db.query(LogArchiveRange).filter(
+            LogArchiveRange.chain_id == self.chain_id,
+            LogArchiveRange.from_block > block_number
+        ).delete(synchronize_session=False)
+        db.query(LogArchiveRange).filter(
+            LogArchiveRange.chain_id == self.chain_id,
+            LogArchiveRange.to_block > block_number
+        ).update({LogArchiveRange.to_block: block_number}, synchronize_session=False)
+
+    def _extend_range(self, db: Session, address: str, topic: str, from_block: int, to_block: int):
+        """Add [from_block, to_block] to the pair's coverage, merging overlapping/adjacent ranges"""
+        touching = db.query(LogArchiveRange).filter(
+            LogArchiveRange.chain_id == self.chain_id,
+            LogArchiveRange.address == address,
+            LogArchiveRange.topic == topic,
+            LogArchiveRange.from_block <= to_block + 1,
+            LogArchiveRange.to_block >= from_block - 1
+        ).all()
+        for row in touching:
+            from_block = min(from_block, row.from_block)
+            to_block = max(to_block, row.to_block)
+            db.delete(row)
+        db.add(LogArchiveRange(
+            chain_id=self.chain_id,
+            address=address,
+            topic=topic,
+            from_block=from_block,
+            to_block=to_block
+        ))
+        db.flush()
+
+    def _to_row(self, log) -> dict:
+        return {
+            "chain_id": self.chain_id,
+            "block_number": _int(log["blockNumber"]),
+            "log_index": _int(log["logIndex"]),
+            "block_hash": _hex(log["blockHash"]),
+            "tx_hash": _hex(log["transactionHash"]),
+            "tx_index": _int(log["transactionIndex"]),
+            "address": Web3.to_checksum_address(log["address"]),
+            "topics": [_hex(topic) for topic in log["topics"]],
+            "data": _hex(log["data"]),
+        }
+
+    @staticmethod
+    def _to_log(row: RawLog) -> dict:
+        """Archived row in the shape web3 returns from eth_getLogs"""
+        return {
+            "address": row.address,
+            "topics": [HexBytes(topic) for topic in row.topics],
+            "data": HexBytes(row.data),
+            "blockNumber": row.block_number,
+            "blockHash": HexBytes(row.block_hash),
+            "transactionHash": HexBytes(row.tx_hash),
+            "transactionIndex": row.tx_index,
+            "logIndex": row.log_index,
+            "removed": False,
+        }
@@ -0,0 +1,117 @@
+"""Multi-contract event log reader
+
+Fetches every tracked event for a block range with a single eth_getLogs
+request (all contract addresses + an OR-list of topic0 hashes) and decodes
+each raw log through a precomputed topic -> event decoder table.
+
+With a LogArchive, ranges already archived are read locally and fetched
+logs are archived, so a resync only asks the RPC for blocks it never saw.
+"""
+
+from collections import Counter
+from typing import Optional
+from web3 import AsyncWeb3, Web3
+import structlog
+
+from src.services.log_archive import LogArchive
+
+logger = structlog.get_logger(__name__)
+
+
+class LogReader:
+    """Single-request log reader for a set of contract events"""
+
+    def __init__(self, w3: Optional[AsyncWeb3], archive: Optional[LogArchive] = None):
+        """
+        Args:
+            w3: AsyncWeb3 to fetch with (None for a decode-only reader)
+            archive: Local raw log archive, read before and filled by fetches
+        """
+        self.w3 = w3
+        self.archive = archive
+        self._addresses: list[str] = []
+        self._decoders: dict[str, object] = {}  # topic0 hex -> ContractEvent
+        self._pairs: list[tuple[str, str]] = []  # (address, topic0) of each tracked event
+
+    def add_events(self, contract, event_names: list[str]):
+        """Track events of a contract
+
+        Args:
+            contract: Web3/AsyncWeb3 contract instance
+            event_names: Event names from the contract ABI
+        """
+        if contract.address not in self._addresses:
+            self._addresses.append(contract.address)
+
+        for event_name in event_names:
+            event = getattr(contract.events, event_name)
+            self._decoders[event.topic] = event
+            if (contract.address, event.topic) not in self._pairs:
+                self._pairs.append((contract.address, event.topic))
+
+    @property
+    def addresses(self) -> list[str]:
+        return list(self._addresses)
+
+    @property
+    def topics(self) -> list[str]:
+        return list(self._decoders)
+
+    @property
+    def pairs(self) -> list[tuple[str, str]]:
+        return list(self._pairs)
+
+    async def get_logs(self, from_block: int, to_block: int) -> list:
+        """Fetch and decode all tracked events in [from_block, to_block]
+
+        Returns decoded events sorted by (blockNumber, logIndex).
+        """
+        raw_logs = []
+        if self.archive is not None:
+            # Archived prefix of the range is read locally
+            raw_logs, archived_to = self.archive.read(
+                self._pairs, self._addresses, self.topics, from_block, to_block
+            )
+            from_block = archived_to + 1
+            if from_block > to_block:
+                return self.decode(raw_logs)
+
+        fetched = await self.w3.eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "address": self._addresses,
+            "topics": [self.topics],
+        })
+        if self.archive is not None:
+            self.archive.store(self._pairs, fetched, from_block, to_block)
+        return self.decode(raw_logs + list(fetched))
+
+    def decode(self, raw_logs: list) -> list:
+        """Route raw logs through the topic decoder table"""
+        events = []
+        for raw_log in raw_logs:
+            if not raw_log["topics"]:
+                continue
+
+            decoder = self._decoders.get(Web3.to_hex(raw_log["topics"][0]))
+            if decoder is None:
+                continue
+
+            try:
+                events.append(decoder.process_log(raw_log))
+            except Exception as e:
+                logger.warning(
+                    "log_decode_failed",
+                    event_type=decoder.event_name,
+                    block_number=raw_log.get("blockNumber"),
+                    log_index=raw_log.get("logIndex"),
+                    error=str(e)
+                )
+
+        events.sort(key=lambda e: (e["blockNumber"], e["logIndex"]))
+        return events
+
+    @staticmethod
+    def count_by_event(events: list) -> dict[str, int]:
+        """Count decoded events per event name"""
+        return dict(Counter(event["event"] for event in events))
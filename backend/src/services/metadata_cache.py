@@ -0,0 +1,230 @@
+"""Persistent metadata cache
+
+On-disk (SQLite) cache of raw metadata documents. Bodies are stored once
+per sha256 content hash; entries map a cache key to a body plus the HTTP
+validators it was served with.
+
+- IPFS documents are keyed by their CID path (ipfs://<cid>/...), whichever
+  gateway served them, and never expire: a CID always names the same bytes.
+- Other URLs are keyed by URL and revalidated with conditional GETs
+  (If-None-Match / If-Modified-Since) before being reused.
+
+The cache is bounded by METADATA_CACHE_MAX_BYTES of body data; the least
+recently used entries are evicted first.
+
+All methods are blocking; async callers run them via asyncio.to_thread.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+import structlog
+
+from src.core.blockchain_config import METADATA_CACHE_PATH, METADATA_CACHE_MAX_BYTES
+
+logger = structlog.get_logger(__name__)
+
+# CIDv0 (base58 multihash) or CIDv1 in base32 (the form gateways use)
+CID_PATTERN = re.compile(r"^(Qm[1-9A-HJ-NP-Za-km-z]{44}|b[a-z2-7]{58,})$")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    immutable INTEGER NOT NULL DEFAULT 0,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    content_hash TEXT PRIMARY KEY,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+
+def cache_key(url: str) -> tuple[str, bool]:
+    """Cache key of a URL and whether its content is immutable
+
+    Gateway URLs (https://<gateway>/ipfs/<cid>/...) and ipfs:// URIs share
+    one content-addressed key. Only a valid CID after /ipfs/ makes a URL
+    immutable; anything else is an ordinary (revalidated) URL.
+    """
+    if url.startswith("ipfs://"):
+        return url, True
+    path = urlparse(url).path
+    if "/ipfs/" in path:
+        cid_path = path.split("/ipfs/", 1)[1]
+        if CID_PATTERN.match(cid_path.split("/", 1)[0]):
+            return "ipfs://" + cid_path, True
+    return url, False
+
+
+@dataclass
+class CachedDocument:
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    immutable: bool
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidation"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class MetadataCache:
+    """Size-bounded, content-addressed metadata document store"""
+
+    def __init__(self, path: str = METADATA_CACHE_PATH, max_bytes: int = METADATA_CACHE_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared by to_thread workers of the app loop and the endpoint scan thread
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+        self.metrics = {
+            "hits": 0,          # Served from cache without a request
+            "revalidated": 0,   # Served from cache after a 304
+            "misses": 0,        # Not cached (or changed), fetched in full
+            "stale": 0,         # Served from cache because the fetch failed
+            "evictions": 0,
+        }
+
+    def get(self, url: str) -> Optional[CachedDocument]:
+        """Look up a cached document (does not count as a hit by itself)"""
+        key, _ = cache_key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.body, e.etag, e.last_modified, e.immutable "
+                "FROM entries e JOIN blobs b ON b.content_hash = e.content_hash "
+                "WHERE e.key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        return CachedDocument(
+            body=row[0], etag=row[1], last_modified=row[2], immutable=bool(row[3])
+        )
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store a fetched document and evict old entries past the size bound"""
+        key, immutable = cache_key(url)
+        content_hash = hashlib.sha256(body).hexdigest()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO blobs (content_hash, body, size) VALUES (?, ?, ?)",
+                (content_hash, body, len(body))
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, content_hash, etag, last_modified, immutable, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, content_hash, etag, last_modified, int(immutable), now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until bodies fit in max_bytes"""
+        self._conn.execute(
+            "DELETE FROM blobs WHERE content_hash NOT IN (SELECT content_hash FROM entries)"
+        )
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT e.key, e.content_hash, b.size FROM entries e "
+            "JOIN blobs b ON b.content_hash = e.content_hash ORDER BY e.accessed_at"
+        ).fetchall()
+        # A blob shared by several entries is only freed with the last of them
+        references: dict[str, int] = {}
+        for _, content_hash, _ in rows:
+            references[content_hash] = references.get(content_hash, 0) + 1
+
+        evicted = []
+        for key, content_hash, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            references[content_hash] -= 1
+            if references[content_hash] == 0:
+                total -= size
+
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self._conn.execute(
+            "DELETE FROM blobs WHERE content_hash NOT IN (SELECT content_hash FROM entries)"
+        )
+        self.metrics["evictions"] += len(evicted)
+        logger.info("metadata_cache_evicted", entries=len(evicted), size_bytes=total)
+
+    def record(self, outcome: str):
+        """Count a lookup outcome (hits / revalidated / misses / stale)"""
+        self.metrics[outcome] += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters since start plus current size"""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT (SELECT COUNT(*) FROM entries), (SELECT COALESCE(SUM(size), 0) FROM blobs)"
+            ).fetchone()
+        lookups = sum(self.metrics[k] for k in ("hits", "revalidated", "misses", "stale"))
+        served = self.metrics["hits"] + self.metrics["revalidated"] + self.metrics["stale"]
+        return {
+            **self.metrics,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+_cache: Optional[MetadataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache() -> Optional[MetadataCache]:
+    """Get the process-wide metadata cache (None when disabled or unavailable)"""
+    global _cache
+    if not METADATA_CACHE_PATH:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = MetadataCache()
+                logger.info("metadata_cache_opened", path=os.fspath(_cache.path))
+            except Exception as e:
+                logger.warning("metadata_cache_unavailable", error=str(e))
+                return None
+    return _cache
@@ -0,0 +1,273 @@
+"""Agent metadata fetcher
+
+Resolves agent metadata URIs (inline JSON, data: URIs, ipfs:// and HTTP(S))
+to dicts. Remote documents are fetched through one long-lived pooled
+httpx client per event loop (HTTP/2 when the `h2` package is installed),
+with a global concurrency bound and a per-host bound so a range with many
+registrations fans out without hammering a single gateway. Documents go
+through the persistent MetadataCache: IPFS content is served from disk,
+HTTP documents are revalidated with conditional GETs.
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import weakref
+from typing import Optional
+from urllib.parse import unquote, urlparse
+
+import httpx
+import structlog
+
+from src.core.blockchain_config import (
+    IPFS_GATEWAY,
+    MAX_RETRIES,
+    RETRY_DELAY_SECONDS,
+    METADATA_FETCH_TIMEOUT_SECONDS,
+    METADATA_MAX_CONCURRENCY,
+    METADATA_PER_HOST_CONCURRENCY,
+)
+from src.services.metadata_cache import MetadataCache, get_metadata_cache
+
+logger = structlog.get_logger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _normalize(data, label: str, event: str, log) -> tuple[dict, bool]:
+    """Normalize parsed metadata to a dict (lists use their first object)
+
+    Returns (metadata, parsed), a placeholder dict when `data` is unusable.
+    """
+    if isinstance(data, list):
+        log.warning(f"{event}_is_list", list_length=len(data))
+        if len(data) > 0 and isinstance(data[0], dict):
+            return data[0], True
+        return {
+            'name': 'Unknown Agent',
+            'description': f'{label} is a list, not an object',
+            'raw_data': data
+        }, False
+    if not isinstance(data, dict):
+        log.warning(f"{event}_unexpected_type", type=type(data).__name__)
+        return {
+            'name': 'Unknown Agent',
+            'description': f'{label} has unexpected type: {type(data).__name__}'
+        }, False
+    return data, True
+
+
+def resolve_url(uri: str) -> str:
+    """HTTP(S) URL for a remote metadata URI (ipfs:// goes through the gateway)"""
+    if uri.startswith('ipfs://'):
+        return f"{IPFS_GATEWAY}{uri[7:]}"
+    return uri
+
+
+def parse_inline(uri: str, log=logger) -> Optional[dict]:
+    """Parse metadata embedded in the URI itself
+
+    Returns None for remote URIs that need to be fetched.
+    """
+    # Handle empty URI
+    if not uri or uri.strip() == '':
+        log.debug("empty_metadata_uri")
+        return {
+            'name': 'Unknown Agent',
+            'description': 'No metadata URI provided'
+        }
+
+    # Handle direct JSON string (object or array)
+    if uri.startswith('{') or uri.startswith('['):
+        try:
+            metadata, parsed = _normalize(json.loads(uri), "Direct JSON", "direct_json", log)
+            if not parsed:
+                return metadata
+            log.info("direct_json_parsed", agent_id=metadata.get('agent_id', 'Unknown'))
+            if 'name' not in metadata and 'agent_id' in metadata:
+                metadata['name'] = metadata['agent_id']
+            if 'description' not in metadata:
+                metadata['description'] = 'Agent from direct JSON'
+            return metadata
+        except Exception as e:
+            log.warning("direct_json_parse_failed", error=str(e), uri=uri[:100])
+
+    # Handle data URI
+    if uri.startswith('data:'):
+        try:
+            if 'base64,' in uri:
+                json_data = base64.b64decode(uri.split('base64,')[1]).decode('utf-8')
+            elif ',' in uri:
+                json_data = unquote(uri.split(',', 1)[1])
+            else:
+                log.warning("unsupported_data_uri_format", uri=uri[:100])
+                return {
+                    'name': 'Unknown Agent',
+                    'description': 'Unsupported data URI format'
+                }
+
+            metadata, _ = _normalize(json.loads(json_data), "Data URI", "data_uri", log)
+            log.info(
+                "data_uri_parsed",
+                format="base64" if 'base64,' in uri else "plain",
+                name=metadata.get('name', 'Unknown')
+            )
+            return metadata
+        except Exception as e:
+            log.warning("data_uri_parse_failed", error=str(e), uri=uri[:100])
+            return {
+                'name': 'Unknown Agent',
+                'description': 'Data URI parse failed'
+            }
+
+    return None
+
+
+class MetadataFetcher:
+    """Pooled, concurrency-bounded metadata fetcher (one per event loop)"""
+
+    def __init__(
+        self,
+        max_concurrency: int = METADATA_MAX_CONCURRENCY,
+        per_host_concurrency: int = METADATA_PER_HOST_CONCURRENCY,
+        timeout: float = METADATA_FETCH_TIMEOUT_SECONDS,
+        cache: Optional[MetadataCache] = None,
+    ):
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            http2=HTTP2_AVAILABLE,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+        )
+        self.per_host_concurrency = per_host_concurrency
+        self.cache = cache
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return self._host_semaphores[host]
+
+    async def get(
+        self, url: str, headers: Optional[dict] = None, timeout: Optional[float] = None
+    ) -> httpx.Response:
+        """GET a URL through the shared client within the concurrency limits
+
+        `timeout` overrides the client's default for this request.
+        """
+        async with self._semaphore, self._host_semaphore(url):
+            return await self.client.get(
+                url,
+                headers=headers,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+            )
+
+    async def fetch_json(self, url: str, log=logger, timeout: Optional[float] = None):
+        """GET a JSON document through the cache
+
+        Raises on fetch/parse failure unless a cached copy can be served.
+        Cache reads and writes are blocking SQLite calls and run in a worker
+        thread so they don't stall the event loop.
+        """
+        cached = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        if cached is not None and cached.immutable:
+            self.cache.record("hits")
+            return json.loads(cached.body)
+
+        try:
+            response = await self.get(
+                url, cached.validators() if cached else None, timeout=timeout
+            )
+            if response.status_code == 304 and cached is not None:
+                self.cache.record("revalidated")
+                return json.loads(cached.body)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            if cached is None:
+                raise
+            self.cache.record("stale")
+            log.warning("metadata_cache_stale_served", url=url, error=str(e))
+            return json.loads(cached.body)
+
+        if self.cache:
+            self.cache.record("misses")
+            await asyncio.to_thread(
+                self.cache.put,
+                url,
+                response.content,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+            )
+        return data
+
+    async def fetch(
+        self, uri: str, retries: int = MAX_RETRIES, strict: bool = False, **log_context
+    ) -> dict:
+        """Resolve one metadata URI to a dict
+
+        Failures resolve to a placeholder dict ('Unknown Agent'); with
+        `strict` a failed remote fetch raises instead, so callers can retry.
+        """
+        log = logger.bind(**log_context)
+
+        metadata = parse_inline(uri, log)
+        if metadata is not None:
+            return metadata
+
+        url = resolve_url(uri)
+        last_error: Optional[Exception] = None
+        for attempt in range(retries):
+            try:
+                data = await self.fetch_json(url, log)
+                metadata, _ = _normalize(data, "Metadata", "metadata", log.bind(url=url))
+                return metadata
+            except Exception as e:
+                last_error = e
+                log.warning(
+                    "metadata_fetch_failed",
+                    url=url,
+                    attempt=attempt + 1,
+                    error=str(e)
+                )
+                if attempt < retries - 1:
+                    await asyncio.sleep(RETRY_DELAY_SECONDS)
+
+        if strict and last_error is not None:
+            raise last_error
+        return {
+            'name': 'Unknown Agent',
+            'description': 'Metadata fetch failed'
+        }
+
+    async def close(self):
+        await self.client.aclose()
+
+
+_fetchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MetadataFetcher]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_metadata_fetcher() -> MetadataFetcher:
+    """Get the metadata fetcher of the running event loop"""
+    loop = asyncio.get_running_loop()
+    fetcher = _fetchers.get(loop)
+    if fetcher is None:
+        fetcher = MetadataFetcher(cache=get_metadata_cache())
+        _fetchers[loop] = fetcher
+        logger.debug("metadata_fetcher_created", http2=HTTP2_AVAILABLE)
+    return fetcher
+
+
+async def close_metadata_fetcher():
+    """Close the running loop's fetcher (application shutdown)"""
+    fetcher = _fetchers.pop(asyncio.get_running_loop(), None)
+    if fetcher is not None:
+        await fetcher.close()
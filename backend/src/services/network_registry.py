@@ -0,0 +1,153 @@
+"""Process-wide network registry
+
+Resolves everything derived from a network's configuration once per
+process and shares it between services: the database Network ID, the
+AsyncWeb3 client over the network's RPC pool (so every caller shares its
+per-endpoint rate limits), a sync Web3 client for thread-offloaded
+callers, and contract instances built from the registry ABIs.
+"""
+
+import threading
+from typing import Any, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+from web3 import AsyncWeb3, Web3
+
+from src.core.blockchain_config import REGISTRY_ABI, RPC_MAX_REQUESTS_PER_SECOND
+from src.core.networks_config import get_network, get_rpc_urls
+from src.core.reputation_config import REPUTATION_REGISTRY_ABI
+from src.core.validation_config import VALIDATION_REGISTRY_ABI
+from src.models import Network
+from src.services.rpc_client import create_async_web3
+
+logger = structlog.get_logger(__name__)
+
+# Contract kind (key of a network's "contracts" config) -> ABI
+CONTRACT_ABIS = {
+    "identity": REGISTRY_ABI,
+    "reputation": REPUTATION_REGISTRY_ABI,
+    "validation": VALIDATION_REGISTRY_ABI,
+}
+
+
+class NetworkContext:
+    """Shared clients, contracts and IDs of one configured network"""
+
+    def __init__(self, key: str, config: dict[str, Any]):
+        self.key = key
+        self.config = config
+        self.chain_id: int = config["chain_id"]
+        self.rpc_urls = get_rpc_urls(config)
+        self._lock = threading.Lock()
+        self._network_id: Optional[str] = None
+        self._async_web3: Optional[AsyncWeb3] = None
+        self._web3: Optional[Web3] = None
+        self._async_contracts: dict[str, Any] = {}
+        self._contracts: dict[str, Any] = {}
+
+    def contract_address(self, kind: str) -> Optional[str]:
+        """Configured address of a contract ("identity", "reputation", ...), None if not deployed"""
+        return self.config.get("contracts", {}).get(kind) or None
+
+    @property
+    def async_web3(self) -> AsyncWeb3:
+        """AsyncWeb3 over the network's RPC pool (call use_shared_session before use)"""
+        with self._lock:
+            if self._async_web3 is None:
+                if not self.rpc_urls:
+                    raise ValueError(f"No RPC URL configured for '{self.key}'")
+                self._async_web3 = create_async_web3(
+                    self.rpc_urls,
+                    rate_limit=self.config.get("rpc_rate_limit", RPC_MAX_REQUESTS_PER_SECOND)
+                )
+            return self._async_web3
+
+    @property
+    def web3(self) -> Optional[Web3]:
+        """Blocking Web3 client on the primary RPC URL, None if none is configured"""
+        with self._lock:
+            if self._web3 is None and self.rpc_urls:
+                self._web3 = Web3(Web3.HTTPProvider(self.rpc_urls[0]))
+            return self._web3
+
+    def async_contract(self, kind: str):
+        """Contract instance on `async_web3`, None if the contract is not deployed"""
+        address = self.contract_address(kind)
+        if address is None:
+            return None
+        w3 = self.async_web3
+        with self._lock:
+            if kind not in self._async_contracts:
+                self._async_contracts[kind] = w3.eth.contract(
+                    address=address, abi=CONTRACT_ABIS[kind]
+                )
+            return self._async_contracts[kind]
+
+    def contract(self, kind: str):
+        """Contract instance on `web3`, None if not deployed or no RPC URL"""
+        address = self.contract_address(kind)
+        w3 = self.web3
+        if address is None or w3 is None:
+            return None
+        with self._lock:
+            if kind not in self._contracts:
+                self._contracts[kind] = w3.eth.contract(
+                    address=address, abi=CONTRACT_ABIS[kind]
+                )
+            return self._contracts[kind]
+
+    def network_id(self, db: Session) -> str:
+        """Database Network ID, looked up (or created and committed) on first use"""
+        if self._network_id is not None:
+            return self._network_id
+
+        network = db.query(Network).filter(Network.chain_id == self.chain_id).first()
+        if not network:
+            network = Network(
+                name=self.config["name"],
+                chain_id=self.chain_id,
+                rpc_url=self.config["rpc_url"],
+                explorer_url=self.config["explorer_url"],
+                contracts=self.config.get("contracts")
+            )
+            db.add(network)
+            db.commit()
+            logger.info("network_created", network=self.key, chain_id=self.chain_id)
+
+        self._network_id = network.id
+        return self._network_id
+
+
+class NetworkRegistry:
+    """Per-process NetworkContext cache keyed by network key"""
+
+    def __init__(self):
+        self._contexts: dict[str, NetworkContext] = {}
+        self._lock = threading.Lock()
+
+    def get(self, network_key: str) -> Optional[NetworkContext]:
+        """Context of a configured network, None for unknown keys"""
+        with self._lock:
+            context = self._contexts.get(network_key)
+            if context is None:
+                config = get_network(network_key)
+                if config is None:
+                    return None
+                context = NetworkContext(network_key, config)
+                self._contexts[network_key] = context
+            return context
+
+
+# Global registry instance
+_network_registry: Optional[NetworkRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_network_registry() -> NetworkRegistry:
+    """Get the process-wide network registry"""
+    global _network_registry
+    with _registry_lock:
+        if _network_registry is None:
+            _network_registry = NetworkRegistry()
+    return _network_registry
@@ -4,75 +4,77 @@ Fallback service for querying feedback events directly from the blockchain
 when Subgraph data is unavailable (e.g., for agents not indexed by the Subgraph).
 
 Supports multiple networks: Sepolia, Base Sepolia, Linea Sepolia, etc.
+
+Decoded NewFeedback events of an agent, with their FeedbackRevoked
+events applied, are cached up to a watermark block, kept
+confirmation_depth blocks behind the head, so later requests only scan
+the agent's events since the watermark (plus the unconfirmed tail, which
+is never cached) and pages are sliced from the cache. The cache holds the
+FALLBACK_FEEDBACK_CACHE_AGENTS most recently requested agents. Scans are
+filtered by agent and fetch their block chunks concurrently (RangeScanner).
 """
 
 import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Optional
 import structlog
-from web3 import Web3
+from web3 import AsyncWeb3
 
+from src.core.blockchain_config import DEFAULT_CONFIRMATION_DEPTH, FALLBACK_FEEDBACK_CACHE_AGENTS
 from src.core.networks_config import get_network
-from src.core.reputation_config import REPUTATION_REGISTRY_ABI
+from src.services.network_registry import get_network_registry
+from src.services.range_scanner import RangeScanner
+from src.services.rpc_client import use_shared_session
 
 logger = structlog.get_logger(__name__)
 
-# Batch size for scanning blocks (to avoid timeout)
-BLOCKS_PER_BATCH = 50000
+
+@dataclass
+class FeedbackEventCache:
+    """Parsed NewFeedback events (revocations applied) of one agent, scanned through `watermark`"""
+
+    watermark: int  # Last block scanned (confirmed blocks only)
+    feedbacks: list[dict] = field(default_factory=list)  # Oldest first
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)  # One watermark scan at a time
 
 
 class OnChainFeedbackService:
     """Service for querying feedback directly from blockchain events"""
 
-    def __init__(self):
+    def __init__(self, max_cached_agents: int = FALLBACK_FEEDBACK_CACHE_AGENTS):
         """Initialize the on-chain feedback service"""
-        self._web3_clients: dict[str, Web3] = {}
-        self._contracts: dict[str, any] = {}
+        self.networks = get_network_registry()
+        self.max_cached_agents = max(1, max_cached_agents)
+        self._caches: OrderedDict[tuple[str, int], FeedbackEventCache] = OrderedDict()  # LRU
+        self.scanner = RangeScanner()
         logger.info("onchain_feedback_service_initialized")
 
-    def _get_web3(self, network_key: str) -> Optional[Web3]:
-        """Get or create Web3 client for a network"""
-        if network_key in self._web3_clients:
-            return self._web3_clients[network_key]
-
-        network = get_network(network_key)
-        if not network or not network.get("rpc_url"):
+    def _get_web3(self, network_key: str) -> Optional[AsyncWeb3]:
+        """Get the shared AsyncWeb3 client (RPC provider pool) of a network"""
+        network = self.networks.get(network_key)
+        w3 = network.async_web3 if network and network.rpc_urls else None
+        if w3 is None:
             logger.warning(
                 "network_not_configured",
                 network_key=network_key
             )
-            return None
-
-        w3 = Web3(Web3.HTTPProvider(network["rpc_url"]))
-        self._web3_clients[network_key] = w3
         return w3
 
     def _get_contract(self, network_key: str):
-        """Get or create contract instance for a network"""
-        if network_key in self._contracts:
-            return self._contracts[network_key]
-
-        network = get_network(network_key)
+        """Get the shared async reputation contract instance of a network"""
+        network = self.networks.get(network_key)
         if not network:
             return None
 
-        reputation_address = network.get("contracts", {}).get("reputation")
-        if not reputation_address:
+        if not network.contract_address("reputation"):
             logger.warning(
                 "reputation_contract_not_configured",
                 network_key=network_key
             )
             return None
 
-        w3 = self._get_web3(network_key)
-        if not w3:
-            return None
-
-        contract = w3.eth.contract(
-            address=reputation_address,
-            abi=REPUTATION_REGISTRY_ABI
-        )
-        self._contracts[network_key] = contract
-        return contract
+        return network.async_contract("reputation")
 
     async def get_agent_feedbacks(
         self,
@@ -94,12 +96,9 @@ class OnChainFeedbackService:
             Dict with feedbacks list and pagination info
         """
         try:
-            # Get all NewFeedback events for this agent
+            # All NewFeedback events for this agent, newest first
             feedbacks = await self._fetch_feedback_events(token_id, network_key)
 
-            # Sort by block number descending (newest first)
-            feedbacks.sort(key=lambda x: x["block_number"], reverse=True)
-
             # Apply pagination
             total = len(feedbacks)
             start_idx = (page - 1) * page_size
@@ -138,13 +137,16 @@ class OnChainFeedbackService:
         token_id: int,
         network_key: str
     ) -> list[dict]:
-        """Fetch all NewFeedback events for an agent from specified network"""
-        feedbacks = []
+        """Fetch all NewFeedback events for an agent from specified network (newest first)
 
+        Confirmed blocks come from the agent's cache, which is first
+        advanced to the confirmed head; the unconfirmed tail is scanned on
+        every request.
+        """
         network = get_network(network_key)
         if not network:
             logger.error("network_not_found", network_key=network_key)
-            return feedbacks
+            return []
 
         w3 = self._get_web3(network_key)
         contract = self._get_contract(network_key)
@@ -154,56 +156,114 @@ class OnChainFeedbackService:
                 "web3_or_contract_not_available",
                 network_key=network_key
             )
-            return feedbacks
+            return []
+
+        await use_shared_session(w3)
+        current_block = await w3.eth.block_number
+        confirmed_block = current_block - network.get("confirmation_depth", DEFAULT_CONFIRMATION_DEPTH)
+        cache = self._cache_of(network_key, token_id, network.get("start_block", 0) - 1)
+
+        async with cache.lock:
+            if cache.watermark < confirmed_block:
+                await self._advance_cache(cache, contract, token_id, confirmed_block, network_key)
 
-        # Get current block and start block
-        current_block = w3.eth.block_number
-        from_block = network.get("start_block", 0)
+        recent, revoked, _ = await self._scan(
+            contract, max(cache.watermark + 1, network.get("start_block", 0)), current_block,
+            network_key, token_id=token_id
+        )
 
+        # Unconfirmed revocations only mark the returned copies, never the cache
+        feedbacks = [
+            {**feedback, "is_revoked": True} if self._feedback_key(feedback) in revoked else feedback
+            for feedback in recent + cache.feedbacks[::-1]
+        ]
         logger.info(
-            "onchain_feedback_scan_started",
+            "onchain_feedback_scan_completed",
             token_id=token_id,
             network_key=network_key,
-            from_block=from_block,
-            to_block=current_block
+            watermark=cache.watermark,
+            feedback_count=len(feedbacks)
         )
+        return feedbacks
 
-        # Scan in batches
-        while from_block <= current_block:
-            to_block = min(from_block + BLOCKS_PER_BATCH - 1, current_block)
-
-            try:
-                events = await asyncio.to_thread(
-                    contract.events.NewFeedback.get_logs,
-                    from_block=from_block,
-                    to_block=to_block,
-                    argument_filters={"agentId": token_id}
-                )
-
-                for event in events:
-                    feedback = self._parse_feedback_event(event, network_key)
-                    feedbacks.append(feedback)
-
-            except Exception as e:
-                logger.warning(
-                    "onchain_feedback_batch_error",
-                    token_id=token_id,
-                    network_key=network_key,
-                    from_block=from_block,
-                    to_block=to_block,
-                    error=str(e)
-                )
-
-            from_block = to_block + 1
-
+    def _cache_of(self, network_key: str, token_id: int, watermark: int) -> FeedbackEventCache:
+        """The agent's cache entry (created empty at `watermark`), marked most recently used"""
+        key = (network_key, token_id)
+        cache = self._caches.get(key)
+        if cache is None:
+            cache = self._caches[key] = FeedbackEventCache(watermark=watermark)
+        self._caches.move_to_end(key)
+        while len(self._caches) > self.max_cached_agents:
+            self._caches.popitem(last=False)
+        return cache
+
+    async def _advance_cache(
+        self, cache: FeedbackEventCache, contract, token_id: int, to_block: int, network_key: str
+    ):
+        """Scan the agent's NewFeedback and FeedbackRevoked events from the watermark up to `to_block`
+
+        The watermark stops before the first failed chunk, so the next request retries it.
+        """
         logger.info(
-            "onchain_feedback_scan_completed",
+            "onchain_feedback_scan_started",
             token_id=token_id,
             network_key=network_key,
-            feedback_count=len(feedbacks)
+            from_block=cache.watermark + 1,
+            to_block=to_block
+        )
+        feedbacks, revoked, scanned_to = await self._scan(
+            contract, cache.watermark + 1, to_block, network_key, token_id, stop_on_error=True
         )
+        for feedback in cache.feedbacks:
+            if self._feedback_key(feedback) in revoked:
+                feedback["is_revoked"] = True
+        cache.feedbacks.extend(reversed(feedbacks))
+        cache.watermark = scanned_to
 
-        return feedbacks
+    async def _scan(
+        self,
+        contract,
+        from_block: int,
+        to_block: int,
+        network_key: str,
+        token_id: int,
+        stop_on_error: bool = False,
+    ) -> tuple[list[dict], set[tuple], int]:
+        """Scan an agent's NewFeedback and FeedbackRevoked events of [from_block, to_block]
+
+        A failed chunk is skipped; with stop_on_error (a cache advance) the
+        scan ends before it instead. Returns (parsed feedbacks, newest first,
+        with revocations in the range applied; keys of the revoked feedbacks;
+        last block scanned by both scans).
+        """
+        (events, feedbacks_to), (revocations, revocations_to) = await asyncio.gather(*(
+            self.scanner.scan(
+                event, from_block, to_block,
+                argument_filters={"agentId": token_id},
+                stop_on_error=stop_on_error
+            )
+            for event in (contract.events.NewFeedback, contract.events.FeedbackRevoked)
+        ))
+        scanned_to = min(feedbacks_to, revocations_to)
+        # A cache advance keeps only what both scans covered
+        through = scanned_to if stop_on_error else to_block
+        revoked = {
+            (args["agentId"], args["clientAddress"].lower(), args["feedbackIndex"])
+            for args in (event["args"] for event in revocations if event["blockNumber"] <= through)
+        }
+        feedbacks = [
+            self._parse_feedback_event(event, network_key)
+            for event in reversed(events) if event["blockNumber"] <= through
+        ]
+        for feedback in feedbacks:
+            if self._feedback_key(feedback) in revoked:
+                feedback["is_revoked"] = True
+        return feedbacks, revoked, scanned_to
+
+    @staticmethod
+    def _feedback_key(feedback: dict) -> tuple:
+        """(token_id, client address, feedback index): what a FeedbackRevoked event refers to"""
+        return feedback["token_id"], feedback["client_address"].lower(), feedback["feedback_index"]
 
     def _parse_feedback_event(self, event, network_key: str) -> dict:
         """Parse a NewFeedback event into our response format"""
@@ -211,8 +271,8 @@ class OnChainFeedbackService:
         block_number = event["blockNumber"]
         tx_hash = event["transactionHash"].hex()
 
-        # Convert bytes32 tags to string
-        tag1 = self._bytes32_to_string(args.get("tag1"))
+        # tag1 is an indexed string: the log only carries its keccak hash
+        tag1 = None
         tag2 = self._bytes32_to_string(args.get("tag2"))
 
         # Create unique ID from network + block + log index
@@ -221,15 +281,18 @@ class OnChainFeedbackService:
 
         return {
             "id": feedback_id,
+            "token_id": args.get("agentId"),
             "score": args.get("score", 0),
             "client_address": args.get("clientAddress", ""),
+            "feedback_index": args.get("feedbackIndex"),
             "tag1": tag1,
             "tag2": tag2,
-            "feedback_uri": args.get("feedbackUri"),
+            "feedback_uri": args.get("feedbackURI"),
             "feedback_hash": self._bytes32_to_hex(args.get("feedbackHash")),
-            "is_revoked": False,  # We'd need to check FeedbackRevoked events
+            "is_revoked": False,  # Set from FeedbackRevoked events by the scan
             "timestamp": None,  # Block timestamp would require additional call
             "block_number": block_number,
+            "log_index": log_index,
             "transaction_hash": tx_hash,
         }
 
@@ -4,98 +4,54 @@ Fallback service for querying validation events directly from the blockchain
 when Subgraph data is unavailable (e.g., for networks not indexed by the Subgraph).
 
 Supports multiple networks: Sepolia, Base Sepolia, Linea Sepolia, etc.
+Requests and responses are scanned concurrently, each in concurrent block
+chunks (RangeScanner).
 """
 
 import asyncio
 from typing import Optional
 import structlog
-from web3 import Web3
+from web3 import AsyncWeb3
 
 from src.core.networks_config import get_network
+from src.services.network_registry import get_network_registry
+from src.services.range_scanner import RangeScanner
+from src.services.rpc_client import use_shared_session
 
 logger = structlog.get_logger(__name__)
 
-# Batch size for scanning blocks (to avoid timeout)
-BLOCKS_PER_BATCH = 50000
-
-# Validation Registry ABI (minimal, only needed events)
-VALIDATION_REGISTRY_ABI = [
-    {
-        "anonymous": False,
-        "inputs": [
-            {"indexed": True, "internalType": "address", "name": "validatorAddress", "type": "address"},
-            {"indexed": True, "internalType": "uint256", "name": "agentId", "type": "uint256"},
-            {"indexed": False, "internalType": "string", "name": "requestUri", "type": "string"},
-            {"indexed": True, "internalType": "bytes32", "name": "requestHash", "type": "bytes32"},
-        ],
-        "name": "ValidationRequest",
-        "type": "event",
-    },
-    {
-        "anonymous": False,
-        "inputs": [
-            {"indexed": True, "internalType": "address", "name": "validatorAddress", "type": "address"},
-            {"indexed": True, "internalType": "uint256", "name": "agentId", "type": "uint256"},
-            {"indexed": True, "internalType": "bytes32", "name": "requestHash", "type": "bytes32"},
-            {"indexed": False, "internalType": "uint8", "name": "response", "type": "uint8"},
-            {"indexed": False, "internalType": "string", "name": "responseUri", "type": "string"},
-            {"indexed": False, "internalType": "bytes32", "name": "tag", "type": "bytes32"},
-        ],
-        "name": "ValidationResponse",
-        "type": "event",
-    },
-]
-
 
 class OnChainValidationService:
     """Service for querying validations directly from blockchain events"""
 
     def __init__(self):
         """Initialize the on-chain validation service"""
-        self._web3_clients: dict[str, Web3] = {}
-        self._contracts: dict[str, any] = {}
+        self.networks = get_network_registry()
+        self.scanner = RangeScanner()
         logger.info("onchain_validation_service_initialized")
 
-    def _get_web3(self, network_key: str) -> Optional[Web3]:
-        """Get or create Web3 client for a network"""
-        if network_key in self._web3_clients:
-            return self._web3_clients[network_key]
-
-        network = get_network(network_key)
-        if not network or not network.get("rpc_url"):
+    def _get_web3(self, network_key: str) -> Optional[AsyncWeb3]:
+        """Get the shared AsyncWeb3 client (RPC provider pool) of a network"""
+        network = self.networks.get(network_key)
+        w3 = network.async_web3 if network and network.rpc_urls else None
+        if w3 is None:
             logger.warning("network_not_configured", network_key=network_key)
-            return None
-
-        w3 = Web3(Web3.HTTPProvider(network["rpc_url"]))
-        self._web3_clients[network_key] = w3
         return w3
 
     def _get_contract(self, network_key: str):
-        """Get or create contract instance for a network"""
-        if network_key in self._contracts:
-            return self._contracts[network_key]
-
-        network = get_network(network_key)
+        """Get the shared async validation contract instance of a network"""
+        network = self.networks.get(network_key)
         if not network:
             return None
 
-        validation_address = network.get("contracts", {}).get("validation")
-        if not validation_address:
+        if not network.contract_address("validation"):
             logger.warning(
                 "validation_contract_not_configured",
                 network_key=network_key,
             )
             return None
 
-        w3 = self._get_web3(network_key)
-        if not w3:
-            return None
-
-        contract = w3.eth.contract(
-            address=validation_address, abi=VALIDATION_REGISTRY_ABI
-        )
-        self._contracts[network_key] = contract
-        return contract
+        return network.async_contract("validation")
 
     async def get_agent_validations(
         self,
@@ -176,7 +132,8 @@ class OnChainValidationService:
             return []
 
         # Get current block and start block
-        current_block = w3.eth.block_number
+        await use_shared_session(w3)
+        current_block = await w3.eth.block_number
         from_block = network.get("start_block", 0)
 
         logger.info(
@@ -187,12 +144,10 @@ class OnChainValidationService:
             to_block=current_block,
         )
 
-        # Fetch requests and responses separately
-        requests = await self._fetch_requests(
-            contract, token_id, from_block, current_block, network_key
-        )
-        responses = await self._fetch_responses(
-            contract, token_id, from_block, current_block, network_key
+        # Fetch requests and responses concurrently
+        requests, responses = await asyncio.gather(
+            self._fetch_requests(contract, token_id, from_block, current_block),
+            self._fetch_responses(contract, token_id, from_block, current_block),
         )
 
         # Merge requests and responses by requestHash
@@ -208,85 +163,53 @@ class OnChainValidationService:
         return validations
 
     async def _fetch_requests(
-        self, contract, token_id: int, from_block: int, to_block: int, network_key: str
+        self, contract, token_id: int, from_block: int, to_block: int
     ) -> dict[str, dict]:
         """Fetch ValidationRequest events"""
         requests: dict[str, dict] = {}
 
-        while from_block <= to_block:
-            batch_to = min(from_block + BLOCKS_PER_BATCH - 1, to_block)
-
-            try:
-                events = await asyncio.to_thread(
-                    contract.events.ValidationRequest.get_logs,
-                    from_block=from_block,
-                    to_block=batch_to,
-                    argument_filters={"agentId": token_id},
-                )
-
-                for event in events:
-                    args = event["args"]
-                    request_hash = args.get("requestHash", b"").hex()
-                    requests[request_hash] = {
-                        "request_hash": "0x" + request_hash,
-                        "request_uri": args.get("requestUri"),
-                        "validator_address": args.get("validatorAddress", ""),
-                        "block_number": event["blockNumber"],
-                        "transaction_hash": event["transactionHash"].hex(),
-                    }
-
-            except Exception as e:
-                logger.warning(
-                    "onchain_validation_request_batch_error",
-                    network_key=network_key,
-                    from_block=from_block,
-                    to_block=batch_to,
-                    error=str(e),
-                )
-
-            from_block = batch_to + 1
+        events, _ = await self.scanner.scan(
+            contract.events.ValidationRequest,
+            from_block,
+            to_block,
+            argument_filters={"agentId": token_id},
+        )
+        for event in events:
+            args = event["args"]
+            request_hash = args.get("requestHash", b"").hex()
+            requests[request_hash] = {
+                "request_hash": "0x" + request_hash,
+                "request_uri": args.get("requestUri"),
+                "validator_address": args.get("validatorAddress", ""),
+                "block_number": event["blockNumber"],
+                "transaction_hash": event["transactionHash"].hex(),
+            }
 
         return requests
 
     async def _fetch_responses(
-        self, contract, token_id: int, from_block: int, to_block: int, network_key: str
+        self, contract, token_id: int, from_block: int, to_block: int
     ) -> dict[str, dict]:
         """Fetch ValidationResponse events"""
         responses: dict[str, dict] = {}
 
-        while from_block <= to_block:
-            batch_to = min(from_block + BLOCKS_PER_BATCH - 1, to_block)
-
-            try:
-                events = await asyncio.to_thread(
-                    contract.events.ValidationResponse.get_logs,
-                    from_block=from_block,
-                    to_block=batch_to,
-                    argument_filters={"agentId": token_id},
-                )
-
-                for event in events:
-                    args = event["args"]
-                    request_hash = args.get("requestHash", b"").hex()
-                    # Use latest response for each request_hash
-                    responses[request_hash] = {
-                        "response": args.get("response"),
-                        "response_uri": args.get("responseUri"),
-                        "response_hash": None,
-                        "tag": self._bytes32_to_string(args.get("tag")),
-                        "completed_block": event["blockNumber"],
-                    }
-
-            except Exception as e:
-                logger.warning(
-                    "onchain_validation_response_batch_error",
-                    network_key=network_key,
-                    from_block=from_block,
-                    to_block=batch_to,
-                    error=str(e),
-                )
-
-            from_block = batch_to + 1
+        events, _ = await self.scanner.scan(
+            contract.events.ValidationResponse,
+            from_block,
+            to_block,
+            argument_filters={"agentId": token_id},
+        )
+        for event in events:
+            args = event["args"]
+            request_hash = args.get("requestHash", b"").hex()
+            # Use latest response for each request_hash (events are in block order)
+            responses[request_hash] = {
+                "response": args.get("response"),
+                "response_uri": args.get("responseUri"),
+                "response_hash": None,
+                "tag": self._bytes32_to_string(args.get("tag")),
+                "completed_block": event["blockNumber"],
+            }
 
         return responses
 
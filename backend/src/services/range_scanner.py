@@ -0,0 +1,98 @@
+"""Concurrent block range scanner for the on-chain fallback services
+
+Splits a block range into fixed chunks and fetches one event's logs for
+them with bounded concurrency. Requests go through the network's RPC
+provider pool (AsyncWeb3 contracts), so per-endpoint rate limits and
+failover apply as for the sync; results are merged in block order.
+"""
+
+import asyncio
+from typing import Optional
+
+import structlog
+
+from src.core.blockchain_config import FALLBACK_SCAN_CHUNK_BLOCKS, FALLBACK_SCAN_CONCURRENCY
+
+logger = structlog.get_logger(__name__)
+
+
+class RangeScanner:
+    """Chunked, concurrent eth_getLogs scans of one contract event"""
+
+    def __init__(
+        self,
+        chunk_blocks: int = FALLBACK_SCAN_CHUNK_BLOCKS,
+        concurrency: int = FALLBACK_SCAN_CONCURRENCY,
+    ):
+        """
+        Args:
+            chunk_blocks: Blocks per eth_getLogs request
+            concurrency: Chunks in flight per scan
+        """
+        self.chunk_blocks = max(1, chunk_blocks)
+        self.concurrency = max(1, concurrency)
+
+    async def scan(
+        self,
+        event,
+        from_block: int,
+        to_block: int,
+        argument_filters: Optional[dict] = None,
+        stop_on_error: bool = False,
+    ) -> tuple[list, int]:
+        """Logs of `event` (an AsyncContractEvent) in [from_block, to_block]
+
+        A failed chunk is logged and skipped; with stop_on_error the scan
+        ends before it instead (chunks above it are not fetched, or their
+        logs dropped), so callers that track a scanned-through block never
+        skip over a gap.
+
+        Returns (decoded logs in block/log-index order, last block of the
+        leading run of successful chunks).
+        """
+        chunks = [
+            (start, min(start + self.chunk_blocks - 1, to_block))
+            for start in range(from_block, to_block + 1, self.chunk_blocks)
+        ]
+        slots = asyncio.Semaphore(self.concurrency)
+        failed_from: list[int] = []  # Start of the lowest failed chunk (stop_on_error)
+
+        async def fetch(chunk_from: int, chunk_to: int) -> Optional[list]:
+            async with slots:
+                if stop_on_error and failed_from and chunk_from > failed_from[0]:
+                    return None
+                try:
+                    return await event.get_logs(
+                        from_block=chunk_from,
+                        to_block=chunk_to,
+                        argument_filters=argument_filters
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "range_scan_chunk_failed",
+                        event_name=event.event_name,
+                        from_block=chunk_from,
+                        to_block=chunk_to,
+                        error=str(e)[:200]
+                    )
+                    if not failed_from or chunk_from < failed_from[0]:
+                        failed_from[:] = [chunk_from]
+                    return None
+
+        results = await asyncio.gather(*(fetch(*chunk) for chunk in chunks))
+
+        logs = []
+        scanned_to = from_block - 1
+        gap = False
+        for (_, chunk_to), chunk_logs in zip(chunks, results):
+            if chunk_logs is None:
+                gap = True
+                if stop_on_error:
+                    break
+                continue
+            logs.extend(chunk_logs)
+            if not gap:
+                scanned_to = chunk_to
+
+        logs.sort(key=lambda log: (log["blockNumber"], log["logIndex"]))
+        return logs, scanned_to
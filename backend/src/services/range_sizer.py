@@ -0,0 +1,92 @@
+"""Adaptive block-range sizing for eth_getLogs
+
+Grows the window across sparse stretches and shrinks (bisects) it when the
+provider rejects a range for returning too many results or timing out.
+"""
+
+import re
+from typing import Optional
+
+# Window bounds (blocks per eth_getLogs request)
+MIN_BLOCKS_PER_RANGE = 10
+MAX_BLOCKS_PER_RANGE = 200000
+
+# Log counts used to steer the window
+SPARSE_LOGS_THRESHOLD = 100  # Fewer logs than this -> grow
+DENSE_LOGS_THRESHOLD = 2000  # More logs than this -> shrink
+
+GROWTH_FACTOR = 2
+
+# Provider error messages that mean "the range is too big", e.g.
+# "query returned more than 10000 results. Try with this block range [0x..., 0x...]"
+_RANGE_ERROR_PATTERNS = (
+    "query returned more than",
+    "more than 10000 results",
+    "too many results",
+    "log response size exceeded",
+    "response size exceeded",
+    "block range is too large",
+    "block range too large",
+    "exceed maximum block range",
+    "range limit exceeded",
+    "timeout",
+    "timed out",
+)
+_SUGGESTED_RANGE_RE = re.compile(r"\[(0x[0-9a-fA-F]+),\s*(0x[0-9a-fA-F]+)\]")
+
+
+def is_range_error(error: Exception) -> bool:
+    """Whether an eth_getLogs error means the range should be narrowed"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in _RANGE_ERROR_PATTERNS)
+
+
+def suggested_window(error: Exception) -> Optional[int]:
+    """Extract the block range some providers suggest in their error message"""
+    match = _SUGGESTED_RANGE_RE.search(str(error))
+    if not match:
+        return None
+    start, end = (int(value, 16) for value in match.groups())
+    return end - start + 1 if end >= start else None
+
+
+class AdaptiveRangeSizer:
+    """Tracks the current eth_getLogs window for one network"""
+
+    def __init__(
+        self,
+        initial_window: int,
+        min_window: int = MIN_BLOCKS_PER_RANGE,
+        max_window: int = MAX_BLOCKS_PER_RANGE,
+    ):
+        self.min_window = min_window
+        self.max_window = max(max_window, min_window)
+        self.window = self._clamp(initial_window)
+
+    def _clamp(self, window: int) -> int:
+        return max(self.min_window, min(self.max_window, int(window)))
+
+    def record_success(self, blocks: int, log_count: int):
+        """Adjust the window after a range of `blocks` returned `log_count` logs"""
+        if log_count > DENSE_LOGS_THRESHOLD:
+            # Scale down so the next range lands near the dense threshold
+            self.window = self._clamp(blocks * DENSE_LOGS_THRESHOLD // log_count)
+        elif log_count < SPARSE_LOGS_THRESHOLD and blocks >= self.window:
+            # Only grow on full-width ranges, the tail of a run says little
+            self.window = self._clamp(self.window * GROWTH_FACTOR)
+
+    def record_failure(self, blocks: int, error: Exception) -> bool:
+        """Shrink the window after a rejected range
+
+        Returns False when the window is already at its minimum, meaning the
+        error cannot be fixed by bisecting further.
+        """
+        if blocks <= self.min_window:
+            return False
+
+        hint = suggested_window(error)
+        if hint and hint < blocks:
+            self.window = self._clamp(hint)
+        else:
+            self.window = self._clamp(blocks // 2)
+        return True
@@ -0,0 +1,51 @@
+"""Async rate limiting primitives for RPC traffic"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Token bucket limiter shared by concurrent coroutines
+
+    Tokens are reserved synchronously before sleeping, so concurrent callers
+    queue up behind each other instead of all waking at once. No asyncio
+    primitives are held, which keeps an instance usable across event loops.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Create a bucket
+
+        Args:
+            rate: Tokens refilled per second (<= 0 disables limiting)
+            capacity: Maximum burst size, defaults to one second of tokens
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    def wait_time(self, tokens: float = 1.0) -> float:
+        """Seconds `acquire(tokens)` would wait right now (nothing is reserved)"""
+        if self.rate <= 0:
+            return 0.0
+
+        self._refill()
+        return max(0.0, tokens - self._tokens) / self.rate
+
+    async def acquire(self, tokens: float = 1.0):
+        """Wait until `tokens` can be spent"""
+        if self.rate <= 0:
+            return
+
+        self._refill()
+        self._tokens -= tokens
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
@@ -0,0 +1,191 @@
+"""Chain reorg detection and rollback
+
+Blocks within a network's confirmation depth of the head may still be
+replaced. For every such block the sync writes to, the block hash is kept
+in block_hashes together with the agent token IDs written from it; the
+sync checkpoint's stored hash is compared with the chain before each
+range/live batch. On a mismatch the fork point is found by walking the
+stored hashes back, rows written from orphaned blocks are deleted, and the
+sync resumes from the fork point.
+"""
+
+from typing import Iterable, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+from web3 import AsyncWeb3
+
+from src.models import Agent, Activity, BlockHash, BlockTimestamp, EnrichmentJob
+
+logger = structlog.get_logger(__name__)
+
+RPC_BATCH_SIZE = 50  # Block headers per JSON-RPC batch request
+
+
+class ChainReorgDetected(Exception):
+    """Data above `fork_block` came from blocks that are no longer canonical"""
+
+    def __init__(self, fork_block: int, reason: str = ""):
+        super().__init__(f"chain reorg below block {fork_block + 1}: {reason}")
+        self.fork_block = fork_block
+
+
+class ReorgGuard:
+    """Per-network store of unconfirmed block hashes"""
+
+    def __init__(self, chain_id: int, w3: AsyncWeb3, confirmation_depth: int):
+        self.chain_id = chain_id
+        self.w3 = w3
+        self.confirmation_depth = confirmation_depth
+
+    def is_unconfirmed(self, block_number: int, head: int) -> bool:
+        return block_number > head - self.confirmation_depth
+
+    def stored_hash(self, db: Session, block_number: int) -> Optional[str]:
+        row = db.get(BlockHash, (self.chain_id, block_number))
+        return row.block_hash if row else None
+
+    async def block_hashes(self, block_numbers: Iterable[int]) -> dict[int, str]:
+        """Current canonical hashes of blocks (batched eth_getBlockByNumber)"""
+        block_numbers = sorted(set(block_numbers))
+        hashes: dict[int, str] = {}
+        for i in range(0, len(block_numbers), RPC_BATCH_SIZE):
+            chunk = block_numbers[i:i + RPC_BATCH_SIZE]
+            if len(chunk) == 1:
+                blocks = [await self.w3.eth.get_block(chunk[0])]
+            else:
+                async with self.w3.batch_requests() as batch:
+                    for block_number in chunk:
+                        batch.add(self.w3.eth.get_block(block_number))
+                    blocks = await batch.async_execute()
+            for block in blocks:
+                hashes[block['number']] = block['hash'].to_0x_hex()
+        return hashes
+
+    async def detect(
+        self, db: Session, checkpoint: int, known: Optional[dict[int, str]] = None
+    ) -> Optional[int]:
+        """Fork point below the checkpoint, None if the checkpoint is still canonical
+
+        Only checkpoints with a stored hash (unconfirmed when synced) are checked.
+        """
+        stored = self.stored_hash(db, checkpoint)
+        if stored is None:
+            return None
+
+        chain_hash = (known or {}).get(checkpoint)
+        if chain_hash is None:
+            chain_hash = (await self.block_hashes([checkpoint]))[checkpoint]
+        if chain_hash == stored:
+            return None
+
+        # Highest stored block that is still canonical (so is every block below it)
+        rows = db.query(BlockHash).filter(
+            BlockHash.chain_id == self.chain_id,
+            BlockHash.block_number < checkpoint
+        ).order_by(BlockHash.block_number.desc()).all()
+        chain_hashes = await self.block_hashes(row.block_number for row in rows)
+        for row in rows:
+            if chain_hashes.get(row.block_number) == row.block_hash:
+                return row.block_number
+
+        # No stored block is canonical (hashes are sparse across range syncs):
+        # fall back below the confirmation window, which is final by definition
+        lowest = rows[-1].block_number if rows else checkpoint
+        fork_block = min(lowest - 1, checkpoint - self.confirmation_depth)
+        logger.info(
+            "reorg_fork_below_stored_hashes",
+            chain_id=self.chain_id,
+            checkpoint=checkpoint,
+            fork_block=fork_block,
+            confirmation_depth=self.confirmation_depth
+        )
+        return fork_block
+
+    def record(
+        self,
+        db: Session,
+        events: list,
+        checkpoint: int,
+        checkpoint_hash: Optional[str],
+        head: int,
+    ):
+        """Store hashes of unconfirmed blocks written in a batch, prune final ones (caller commits)
+
+        Args:
+            events: Decoded events applied in the batch
+            checkpoint: Block the sync checkpoint advances to
+            checkpoint_hash: Canonical hash of `checkpoint`, read before its logs
+            head: Current chain head
+        """
+        blocks: dict[int, dict] = {}
+        for event in events:
+            block_number = event['blockNumber']
+            if not self.is_unconfirmed(block_number, head):
+                continue
+            entry = blocks.setdefault(
+                block_number, {"hash": event['blockHash'].to_0x_hex(), "tokens": set()}
+            )
+            entry["tokens"].add(event['args']['agentId'])
+        if checkpoint_hash and self.is_unconfirmed(checkpoint, head):
+            blocks.setdefault(checkpoint, {"hash": checkpoint_hash, "tokens": set()})
+
+        for block_number, entry in blocks.items():
+            db.merge(BlockHash(
+                chain_id=self.chain_id,
+                block_number=block_number,
+                block_hash=entry["hash"],
+                touched_tokens=sorted(entry["tokens"]) or None
+            ))
+
+        db.query(BlockHash).filter(
+            BlockHash.chain_id == self.chain_id,
+            BlockHash.block_number <= head - self.confirmation_depth
+        ).delete(synchronize_session=False)
+
+    def touched_tokens(self, db: Session, fork_block: int) -> set[int]:
+        """Token IDs written from blocks above the fork point"""
+        rows = db.query(BlockHash.touched_tokens).filter(
+            BlockHash.chain_id == self.chain_id,
+            BlockHash.block_number > fork_block
+        ).all()
+        return {token_id for (tokens,) in rows for token_id in (tokens or [])}
+
+    def orphaned_agent_ids(self, db: Session, network_id: str, fork_block: int) -> list[str]:
+        """Agents registered in blocks above the fork point"""
+        return [
+            agent_id for (agent_id,) in db.query(Agent.id).filter(
+                Agent.network_id == network_id,
+                Agent.registered_block > fork_block
+            )
+        ]
+
+    def rollback(self, db: Session, network_id: str, fork_block: int) -> dict[str, int]:
+        """Delete rows written from blocks above the fork point (caller commits)
+
+        Returns counts of deleted rows, for logging.
+        """
+        orphaned = self.orphaned_agent_ids(db, network_id, fork_block)
+        network_agents = db.query(Agent.id).filter(Agent.network_id == network_id)
+
+        activities = db.query(Activity).filter(
+            Activity.agent_id.in_(network_agents.scalar_subquery()),
+            Activity.block_number > fork_block
+        ).delete(synchronize_session=False)
+        if orphaned:
+            activities += db.query(Activity).filter(
+                Activity.agent_id.in_(orphaned)
+            ).delete(synchronize_session=False)
+            db.query(EnrichmentJob).filter(
+                EnrichmentJob.agent_id.in_(orphaned)
+            ).delete(synchronize_session=False)
+            db.query(Agent).filter(Agent.id.in_(orphaned)).delete(synchronize_session=False)
+
+        # Orphaned blocks may have had different timestamps
+        for model in (BlockHash, BlockTimestamp):
+            db.query(model).filter(
+                model.chain_id == self.chain_id,
+                model.block_number > fork_block
+            ).delete(synchronize_session=False)
+
+        return {"agents_deleted": len(orphaned), "activities_deleted": activities}
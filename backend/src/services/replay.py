@@ -0,0 +1,357 @@
+"""Offline replay of archived events
+
+Rebuilds the chain-derived tables of a network (agents, activities,
+feedback ledger, reputation, validation index, sync checkpoints) from the raw log archive
+into another database, without any RPC: archived logs are decoded in
+(block, log_index) order and applied in batches through the sync's own
+write path (NetworkSyncService._apply_events: RangeWriteBuffer,
+ReputationLedger, ValidationIndex), so replayed state is exactly what the
+live sync would have written. The archive, block timestamps and block
+hashes are copied along, so the rebuilt database resumes syncing where
+the archive ends.
+
+Replays are deterministic: agents keep their IDs from the source
+database, activity IDs derive from (chain, tx hash, log index, type),
+block times come only from the copied block_timestamps table (a replay
+needing a block it lacks fails instead of guessing) and batches end at
+the same blocks on every run, so two replays of the same archive write
+the same chain-derived rows. Bookkeeping times (last_synced_at,
+updated_at, reputation_last_updated, enrichment job times and the
+created_at of reputation updates) are those of the replay run.
+
+Every batch is committed together with the target's stream cursors, so
+an interrupted replay simply continues when run again and a finished one
+is a no-op. Enrichment is carried over from the source where the
+replayed metadata URI is the one it came from. After a logic change,
+replay into a fresh database and swap it in for the live one.
+"""
+
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import Session, sessionmaker
+from web3 import AsyncWeb3
+from web3.providers import AsyncBaseProvider
+
+from src.db.database import Base
+from src.core.networks_config import get_network
+from src.models import (
+    Agent, SyncStatus, Network, Activity, ActivityType, BlockTimestamp, BlockHash,
+    RawLog, LogArchiveRange, Feedback, Validation,
+    EnrichmentJob, EnrichmentJobType, EnrichmentJobStatus,
+)
+from src.services.blockchain_sync import NetworkSyncService
+from src.services.log_reader import LogReader
+from src.services.log_archive import LogArchive
+from src.services.sync_cursors import SYNC_STREAMS, EVENT_STREAMS
+from src.services.sync_writer import dialect_insert
+
+logger = structlog.get_logger(__name__)
+
+REPLAY_BATCH_SIZE = 5000  # Archived logs decoded and applied per batch (one transaction)
+MAX_BLOCK = 2 ** 63 - 1
+
+# Agent columns filled in by the enrichment queue, carried over from the
+# source database when the replayed metadata URI is the one they came from
+ENRICHED_COLUMNS = (
+    "name", "description", "skills", "domains", "classification_source",
+    "endpoint_status", "endpoint_checked_at", "sync_status",
+)
+
+
+def stable_id(*parts) -> str:
+    """Deterministic UUID of a chain object (same input, same ID on every replay)"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, ":".join(str(part) for part in parts)))
+
+
+def _columns(row) -> dict:
+    return {column.name: getattr(row, column.name) for column in row.__table__.columns}
+
+
+class OfflineProvider(AsyncBaseProvider):
+    """Provider of the replay's client: any RPC request is an error"""
+
+    async def make_request(self, method, params):
+        raise RuntimeError(f"Offline replay attempted an RPC call: {method}")
+
+
+class ReplaySyncService(NetworkSyncService):
+    """NetworkSyncService writing a replay into its target database, without RPC"""
+
+    def __init__(self, network_key: str, network_id: str, source_agent_ids: dict[int, str]):
+        super().__init__(network_key, w3=AsyncWeb3(OfflineProvider()))
+        self.log_archive = None
+        self.network_id = network_id
+        self.source_agent_ids = source_agent_ids  # token_id -> agent ID in the source
+
+    def _get_network_id(self, db: Session) -> str:
+        return self.network_id
+
+    def _new_agent_id(self, token_id: int) -> str:
+        """Source database ID of the agent (a stable one for agents it does not have)"""
+        return self.source_agent_ids.get(token_id) or stable_id(
+            self.network_config["chain_id"], "agent", token_id
+        )
+
+    def _new_activity_id(self, event, activity_type: ActivityType) -> str:
+        """Same activity, same ID on every replay"""
+        return stable_id(
+            self.network_config["chain_id"], event['transactionHash'].hex(), event['logIndex'], activity_type.value
+        )
+
+    async def _resolve_block_timestamps(
+        self,
+        db: Session,
+        block_numbers: list[int],
+        prefetched: Optional[dict[int, int]] = None,
+    ) -> tuple[dict[int, int], dict[int, int]]:
+        """Timestamps copied from the source only; a block without one fails the replay"""
+        if not block_numbers:
+            return {}, {}
+
+        timestamps, missing = self.block_timestamps.lookup(db, block_numbers)
+        if missing:
+            raise ValueError(
+                f"Source has no block timestamp for {len(missing)} blocks of '{self.network_key}' "
+                f"(first: {missing[0]}), refusing to guess them"
+            )
+        return timestamps, {}
+
+
+class NetworkReplay:
+    """Replay of one network's archive from a source into a target session"""
+
+    def __init__(self, network_key: str, source: Session, target: Session):
+        self.network_key = network_key
+        self.network_config = get_network(network_key)
+        if not self.network_config:
+            raise ValueError(f"Network '{network_key}' not found in configuration")
+
+        self.source = source
+        self.target = target
+        self.chain_id = self.network_config["chain_id"]
+        self.start_block = self.network_config.get("start_block", 0)
+        self.archive = LogArchive(self.chain_id)
+        self.stats = {"events": 0, "agents": 0, "activities": 0, "skipped": 0}
+
+    async def run(self) -> dict:
+        """Replay the archive into the target (committed per batch), returns replay stats"""
+        started = time.monotonic()
+
+        try:
+            network_id = self._copy_network()
+            source_network = self.source.query(Network).filter(Network.chain_id == self.chain_id).first()
+            self.source_agents = {
+                agent.token_id: _columns(agent)
+                for agent in self.source.query(Agent).filter(Agent.network_id == source_network.id)
+            } if source_network else {}
+            self.service = ReplaySyncService(
+                self.network_key, network_id,
+                {token_id: agent["id"] for token_id, agent in self.source_agents.items()}
+            )
+
+            # Each stream is replayed as far as its archive coverage is complete
+            self.stream_readers: dict[str, LogReader] = {}
+            self.decoder = LogReader(None)
+            for stream, contract in self.service.stream_contracts.items():
+                self.stream_readers[stream] = LogReader(None)
+                self.stream_readers[stream].add_events(contract, SYNC_STREAMS[stream][1])
+                self.decoder.add_events(contract, SYNC_STREAMS[stream][1])
+            self.covered = {
+                stream: self.archive.covered_until(self.source, reader.pairs, self.start_block, MAX_BLOCK)
+                for stream, reader in self.stream_readers.items()
+            }
+
+            self._copy_block_tables()
+            self.tracker = self.service._get_sync_tracker(self.target)
+            self.service.cursors.load(self.target, self.tracker)
+            self.target.commit()
+            logger.info(
+                "replay_started",
+                network=self.network_key,
+                covered=self.covered,
+                positions=self.service.cursors.positions
+            )
+
+            agents_before = self._count(Agent, network_id)
+            activities_before = self._count(Activity, network_id)
+
+            # Logs at or below every cursor were applied by an earlier run
+            query = self.source.query(RawLog).filter(
+                RawLog.chain_id == self.chain_id,
+                RawLog.block_number > self.service.cursors.floor
+            ).order_by(RawLog.block_number, RawLog.log_index)
+
+            batch = []
+            for row in query.yield_per(REPLAY_BATCH_SIZE):
+                # Batches end on block boundaries, so cursors only cover complete blocks
+                if len(batch) >= REPLAY_BATCH_SIZE and row.block_number > batch[-1].block_number:
+                    await self._replay_batch(batch, batch[-1].block_number)
+                    batch = []
+                    logger.info(
+                        "replay_progress",
+                        network=self.network_key,
+                        block=row.block_number,
+                        events=self.stats["events"],
+                        events_per_second=round(self.stats["events"] / (time.monotonic() - started))
+                    )
+                batch.append(row)
+            await self._replay_batch(batch, max(self.covered.values()))
+
+            self._carry_over_enrichment(network_id)
+            self.target.commit()
+        except Exception:
+            self.target.rollback()
+            raise
+
+        self.stats["agents"] = self._count(Agent, network_id) - agents_before
+        self.stats["activities"] = self._count(Activity, network_id) - activities_before
+        self.stats["feedbacks"] = self._count(Feedback, network_id)
+        self.stats["validations"] = self._count(Validation, network_id)
+        self.stats["metadata_fetches"] = self.target.query(EnrichmentJob).join(
+            Agent, EnrichmentJob.agent_id == Agent.id
+        ).filter(
+            Agent.network_id == network_id,
+            EnrichmentJob.job_type == EnrichmentJobType.FETCH_METADATA,
+            EnrichmentJob.status == EnrichmentJobStatus.PENDING
+        ).count()
+        self.stats["positions"] = dict(self.service.cursors.positions)
+
+        seconds = time.monotonic() - started
+        self.stats["seconds"] = round(seconds, 2)
+        self.stats["events_per_second"] = round(self.stats["events"] / seconds) if seconds else 0
+        logger.info("replay_completed", network=self.network_key, **self.stats)
+        return self.stats
+
+    def _count(self, model, network_id: str) -> int:
+        """Target rows of the network (agents, or rows referencing them)"""
+        query = self.target.query(func.count(model.id))
+        if model is not Agent:
+            query = query.join(Agent, model.agent_id == Agent.id)
+        return query.filter(Agent.network_id == network_id).scalar()
+
+    def _copy_network(self) -> str:
+        """Network row in the target (copied from the source), returns its ID"""
+        network = self.target.query(Network).filter(Network.chain_id == self.chain_id).first()
+        if network:
+            return network.id
+
+        network = self.source.query(Network).filter(Network.chain_id == self.chain_id).first()
+        if network is None:
+            raise ValueError(f"Network '{self.network_key}' is not in the source database")
+        self.target.add(Network(**_columns(network)))
+        self.target.flush()
+        return network.id
+
+    def _copy_block_tables(self):
+        """Copy block timestamps, block hashes and archive coverage to the target"""
+        for model in (BlockTimestamp, BlockHash):
+            rows = [_columns(row) for row in self.source.query(model).filter(model.chain_id == self.chain_id)]
+            if rows:
+                self.target.execute(dialect_insert(self.target, model).on_conflict_do_nothing(), rows)
+
+        self.target.query(LogArchiveRange).filter(
+            LogArchiveRange.chain_id == self.chain_id
+        ).delete(synchronize_session=False)
+        for row in self.source.query(LogArchiveRange).filter(LogArchiveRange.chain_id == self.chain_id):
+            values = _columns(row)
+            values.pop("id")
+            self.target.add(LogArchiveRange(**values))
+        self.target.flush()
+
+    async def _replay_batch(self, rows: list[RawLog], to_block: int):
+        """Copy a batch of archived logs, apply its events and advance the cursors to `to_block` (commits)"""
+        if rows:
+            self.target.execute(
+                dialect_insert(self.target, RawLog).on_conflict_do_nothing(),
+                [_columns(row) for row in rows]
+            )
+
+        cursors = self.service.cursors
+        positions = dict(cursors.positions)
+        addresses = set(self.decoder.addresses)
+        events = []
+        for event in self.decoder.decode([
+            LogArchive._to_log(row) for row in rows if row.address in addresses
+        ]):
+            stream = EVENT_STREAMS[event['event']]
+            if event['blockNumber'] <= positions[stream]:
+                self.stats["skipped"] += 1
+            elif event['blockNumber'] <= self.covered[stream]:
+                events.append(event)
+        self.stats["events"] += len(events)
+
+        await self.service._apply_events(self.target, events, replay=to_block <= cursors.head)
+
+        # Streams move up to the batch end, or to where their archive coverage ends
+        targets: dict[int, list[str]] = {}
+        for stream, position in positions.items():
+            block = min(to_block, self.covered[stream])
+            if block > position:
+                targets.setdefault(block, []).append(stream)
+        for block, streams in sorted(targets.items()):
+            self.service._advance_streams(self.target, self.tracker, streams, block)
+        self.tracker.current_block = max(self.tracker.current_block or 0, cursors.head)
+        self.target.commit()
+
+    def _carry_over_enrichment(self, network_id: str):
+        """Copy source enrichment to pending agents whose metadata URI it came from (caller commits)
+
+        Their metadata fetch jobs are dropped; agents still pending in the
+        source keep theirs.
+        """
+        carried = []
+        for agent in self.target.query(Agent).filter(
+            Agent.network_id == network_id,
+            Agent.sync_status == SyncStatus.SYNCING
+        ):
+            source = self.source_agents.get(agent.token_id)
+            if not source or source["metadata_uri"] != agent.metadata_uri:
+                continue
+            for column in ENRICHED_COLUMNS:
+                setattr(agent, column, source[column])
+            agent.updated_at = datetime.utcnow()
+            if source["sync_status"] != SyncStatus.SYNCING:
+                carried.append(agent.id)
+
+        if carried:
+            self.target.query(EnrichmentJob).filter(
+                EnrichmentJob.agent_id.in_(carried),
+                EnrichmentJob.job_type == EnrichmentJobType.FETCH_METADATA,
+                EnrichmentJob.status == EnrichmentJobStatus.PENDING
+            ).delete(synchronize_session=False)
+        logger.info("replay_enrichment_carried_over", network=self.network_key, agents=len(carried))
+
+
+def replay_databases(source_url: str, target_url: str, network_keys: list[str]) -> dict[str, dict]:
+    """Replay the archives of `network_keys` from one database into another
+
+    The target's schema is created if needed. Returns network -> replay stats.
+    """
+    if source_url == target_url:
+        raise ValueError("Replay target must be a different database than the source")
+
+    def session_factory(url: str) -> sessionmaker:
+        engine = create_engine(
+            url, connect_args={"check_same_thread": False} if "sqlite" in url else {}
+        )
+        return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    Source = session_factory(source_url)
+    Target = session_factory(target_url)
+    Base.metadata.create_all(bind=Target.kw["bind"])
+
+    results = {}
+    for network_key in network_keys:
+        source, target = Source(), Target()
+        try:
+            results[network_key] = asyncio.run(NetworkReplay(network_key, source, target).run())
+        finally:
+            source.close()
+            target.close()
+    return results
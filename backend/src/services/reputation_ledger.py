@@ -0,0 +1,154 @@
+"""Local feedback ledger and reputation aggregation
+
+NewFeedback events carry everything getSummary aggregates (client, index,
+score, tags) and FeedbackRevoked names the feedback it revokes, so the
+sync records every feedback in the feedbacks table and derives an agent's
+reputation (count and integer average of its unrevoked scores) from it
+locally, without eth_call reads. A sampled getSummary reconciliation
+(NetworkSyncService.reconcile_reputations) checks the local aggregates
+against the contract.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from web3 import Web3
+
+from src.models import Agent, Feedback
+from src.services.sync_writer import dialect_insert
+
+logger = structlog.get_logger(__name__)
+
+
+def average_score(total: int, count: int) -> int:
+    """getSummary average: integer division over unrevoked feedback, 0 without any"""
+    return total // count if count else 0
+
+
+def feedback_row(event, agent_id: str, block_timestamp: Optional[int] = None) -> dict:
+    """feedbacks row of a decoded NewFeedback event (block_timestamp in Unix seconds, stored as naive UTC)"""
+    args = event['args']
+    return {
+        "agent_id": agent_id,
+        "client_address": args['clientAddress'],
+        "feedback_index": args['feedbackIndex'],
+        "score": args['score'],
+        "tag1": None,  # Indexed string: the log only carries its keccak hash
+        "tag2": args.get('tag2') or None,
+        "endpoint": args.get('endpoint') or None,
+        "feedback_uri": args.get('feedbackURI') or None,
+        "feedback_hash": Web3.to_hex(args['feedbackHash']) if args.get('feedbackHash') else None,
+        "revoked": False,
+        "block_number": event['blockNumber'],
+        "log_index": event['logIndex'],
+        "tx_hash": event['transactionHash'].hex() if 'transactionHash' in event else None,
+        "block_timestamp": datetime.utcfromtimestamp(block_timestamp) if block_timestamp is not None else None,
+    }
+
+
+class ReputationLedger:
+    """Feedback ledger of one network"""
+
+    def __init__(self, network_key: str):
+        self.network_key = network_key
+
+    def record(
+        self, db: Session, network_id: str, events: list, block_timestamps: Optional[dict[int, int]] = None
+    ) -> int:
+        """Store NewFeedback rows and apply FeedbackRevoked flags (caller commits)
+
+        Idempotent: feedback already on record is kept, so replayed ranges
+        can go through here again. Returns the number of events recorded.
+
+        Args:
+            block_timestamps: block number -> Unix timestamp of the NewFeedback blocks
+        """
+        block_timestamps = block_timestamps or {}
+        token_ids = {event['args']['agentId'] for event in events}
+        agent_ids = dict(db.query(Agent.token_id, Agent.id).filter(
+            Agent.network_id == network_id,
+            Agent.token_id.in_(list(token_ids))
+        ).all())
+
+        rows = []
+        revocations = []
+        for event in events:
+            agent_id = agent_ids.get(event['args']['agentId'])
+            if agent_id is None:
+                logger.warning(
+                    "agent_not_found_for_feedback",
+                    network=self.network_key,
+                    token_id=event['args']['agentId']
+                )
+                continue
+            if event['event'] == 'NewFeedback':
+                rows.append(feedback_row(event, agent_id, block_timestamps.get(event['blockNumber'])))
+            else:
+                revocations.append((agent_id, event))
+
+        # Inserted first: a feedback can be given and revoked within one range
+        if rows:
+            db.execute(
+                dialect_insert(db, Feedback).on_conflict_do_nothing(
+                    index_elements=["agent_id", "client_address", "feedback_index"]
+                ),
+                rows
+            )
+        for agent_id, event in revocations:
+            db.query(Feedback).filter(
+                Feedback.agent_id == agent_id,
+                Feedback.client_address == event['args']['clientAddress'],
+                Feedback.feedback_index == event['args']['feedbackIndex'],
+                Feedback.revoked.is_(False)
+            ).update(
+                {Feedback.revoked: True, Feedback.revoked_block: event['blockNumber']},
+                synchronize_session=False
+            )
+
+        return len(rows) + len(revocations)
+
+    def summaries(
+        self, db: Session, network_id: str, token_ids: Optional[list[int]] = None
+    ) -> dict[int, tuple[int, int]]:
+        """(count, average_score) of each agent (all of the network's by default) from its unrevoked feedback
+
+        Agents on record without feedback get (0, 0); unknown agents are left out.
+        """
+        if token_ids is not None and not token_ids:
+            return {}
+
+        query = db.query(
+            Agent.token_id, func.count(Feedback.id), func.coalesce(func.sum(Feedback.score), 0)
+        ).outerjoin(
+            Feedback, (Feedback.agent_id == Agent.id) & Feedback.revoked.is_(False)
+        ).filter(Agent.network_id == network_id)
+        if token_ids is not None:
+            query = query.filter(Agent.token_id.in_(list(token_ids)))
+        rows = query.group_by(Agent.token_id).all()
+
+        return {
+            token_id: (int(count), average_score(int(total), int(count)))
+            for token_id, count, total in rows
+        }
+
+    def rollback(self, db: Session, network_id: str, fork_block: int) -> int:
+        """Drop feedback and revocations above the fork point (reorg rollback, caller commits)
+
+        Returns the number of feedback rows deleted.
+        """
+        agent_ids = db.query(Agent.id).filter(Agent.network_id == network_id).scalar_subquery()
+        deleted = db.query(Feedback).filter(
+            Feedback.agent_id.in_(agent_ids),
+            Feedback.block_number > fork_block
+        ).delete(synchronize_session=False)
+        db.query(Feedback).filter(
+            Feedback.agent_id.in_(agent_ids),
+            Feedback.revoked_block > fork_block
+        ).update(
+            {Feedback.revoked: False, Feedback.revoked_block: None},
+            synchronize_session=False
+        )
+        return deleted
@@ -0,0 +1,118 @@
+"""Batched reputation reader
+
+Resolves getSummary for many agents at once: chunks of calls are packed into
+Multicall3 aggregate3, falling back to JSON-RPC batched eth_call on chains
+where Multicall3 is not deployed.
+"""
+
+from typing import Iterable, Optional
+from web3 import AsyncWeb3, Web3
+import structlog
+
+from src.core.reputation_config import (
+    MULTICALL3_ADDRESS,
+    MULTICALL3_ABI,
+    MULTICALL_CHUNK_SIZE,
+)
+
+logger = structlog.get_logger(__name__)
+
+SUMMARY_OUTPUT_TYPES = ["uint64", "uint8"]
+
+
+class ReputationReader:
+    """Reads (count, averageScore) summaries for sets of agents"""
+
+    def __init__(
+        self,
+        w3: AsyncWeb3,
+        reputation_contract,
+        multicall_address: Optional[str] = None,
+        chunk_size: int = MULTICALL_CHUNK_SIZE,
+    ):
+        self.w3 = w3
+        self.contract = reputation_contract
+        self.multicall = w3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address or MULTICALL3_ADDRESS),
+            abi=MULTICALL3_ABI
+        )
+        self.chunk_size = chunk_size
+        self._multicall_available: Optional[bool] = None
+
+    def _summary_call_data(self, token_id: int) -> str:
+        # Empty client list and tags = summary over all feedback
+        return self.contract.encode_abi("getSummary", args=[token_id, [], "", ""])
+
+    def _decode_summary(self, return_data: bytes) -> tuple[int, int]:
+        count, average_score = self.w3.codec.decode(SUMMARY_OUTPUT_TYPES, return_data)
+        return int(count), int(average_score)
+
+    async def _has_multicall(self) -> bool:
+        if self._multicall_available is None:
+            try:
+                code = await self.w3.eth.get_code(self.multicall.address)
+                self._multicall_available = len(code) > 0
+            except Exception as e:
+                logger.warning("multicall_probe_failed", error=str(e))
+                self._multicall_available = False
+
+            if not self._multicall_available:
+                logger.info(
+                    "multicall_unavailable_using_batch",
+                    multicall=self.multicall.address
+                )
+        return self._multicall_available
+
+    async def get_summaries(
+        self, token_ids: Iterable[int], block_identifier="latest"
+    ) -> dict[int, tuple[int, int]]:
+        """Resolve summaries for distinct token IDs
+
+        Returns {token_id: (count, average_score)} as of `block_identifier`.
+        Agents whose call failed are left out of the result.
+        """
+        token_ids = sorted(set(token_ids))
+        summaries: dict[int, tuple[int, int]] = {}
+
+        for i in range(0, len(token_ids), self.chunk_size):
+            chunk = token_ids[i:i + self.chunk_size]
+            if await self._has_multicall():
+                summaries.update(await self._read_multicall(chunk, block_identifier))
+            else:
+                summaries.update(await self._read_batch(chunk, block_identifier))
+
+        return summaries
+
+    async def _read_multicall(self, token_ids: list[int], block_identifier) -> dict[int, tuple[int, int]]:
+        calls = [
+            (self.contract.address, True, self._summary_call_data(token_id))
+            for token_id in token_ids
+        ]
+        results = await self.multicall.functions.aggregate3(calls).call(block_identifier=block_identifier)
+
+        summaries = {}
+        for token_id, (success, return_data) in zip(token_ids, results):
+            if not success:
+                logger.warning("summary_call_failed", token_id=token_id, via="multicall")
+                continue
+            summaries[token_id] = self._decode_summary(return_data)
+        return summaries
+
+    async def _read_batch(self, token_ids: list[int], block_identifier) -> dict[int, tuple[int, int]]:
+        async with self.w3.batch_requests() as batch:
+            for token_id in token_ids:
+                batch.add(self.w3.eth.call({
+                    "to": self.contract.address,
+                    "data": self._summary_call_data(token_id)
+                }, block_identifier))
+            results = await batch.async_execute()
+
+        summaries = {}
+        for token_id, return_data in zip(token_ids, results):
+            try:
+                summaries[token_id] = self._decode_summary(return_data)
+            except Exception as e:
+                logger.warning(
+                    "summary_call_failed", token_id=token_id, via="batch", error=str(e)
+                )
+        return summaries
@@ -4,25 +4,20 @@ This service synchronizes reputation scores from the ReputationRegistry contract
 """
 
 from datetime import datetime
-import asyncio
+from typing import Optional
 import structlog
-from web3 import Web3
 from sqlalchemy.orm import Session
 
 from src.db.database import SessionLocal
 from src.models import Agent, Activity, ActivityType
-from src.core.reputation_config import (
-    REPUTATION_REGISTRY_ADDRESS,
-    REPUTATION_REGISTRY_ABI,
-)
-from src.core.blockchain_config import SEPOLIA_RPC_URL
+from src.services.network_registry import get_network_registry
+from src.services.reputation_reader import ReputationReader
+from src.services.rpc_client import use_shared_session
 
 logger = structlog.get_logger(__name__)
 
-# 并发配置（优化：降低并发和批量大小以减少 RPC 压力）
-BATCH_SIZE = 20  # 每批处理的 agent 数量（降低以减少内存和请求压力）
-MAX_CONCURRENT_REQUESTS = 3  # 最大并发请求数（降低以避免 429 错误）
-REQUEST_DELAY_SECONDS = 0.5  # 每批次之间的延迟（避免请求过快）
+# 批量配置：每批 agent 的 getSummary 通过一次 Multicall3 调用完成
+BATCH_SIZE = 500  # 每批处理的 agent 数量（每批提交一次数据库）
 
 
 class ReputationSyncService:
@@ -30,21 +25,25 @@ class ReputationSyncService:
 
     def __init__(self):
         """Initialize the reputation sync service"""
-        self.w3 = Web3(Web3.HTTPProvider(SEPOLIA_RPC_URL))
-        self.contract = self.w3.eth.contract(
-            address=REPUTATION_REGISTRY_ADDRESS,
-            abi=REPUTATION_REGISTRY_ABI
+        # 与链上同步共用 Sepolia 的 AsyncWeb3 与合约实例（共享 RPC 节点池的限流额度）
+        self.network = get_network_registry().get("sepolia")
+        self.w3 = self.network.async_web3
+        self.contract = self.network.async_contract("reputation")
+        self.reader = ReputationReader(
+            self.w3,
+            self.contract,
+            multicall_address=self.network.contract_address("multicall3")
         )
         logger.info(
             "reputation_sync_initialized",
-            reputation_registry=REPUTATION_REGISTRY_ADDRESS,
-            identity_registry=self.contract.functions.getIdentityRegistry().call()
+            reputation_registry=self.contract.address
         )
 
     async def sync(self):
-        """Sync reputation scores for all agents with concurrent requests"""
+        """Sync reputation scores for all agents with batched getSummary reads"""
         db = SessionLocal()
         try:
+            await use_shared_session(self.w3)
             logger.info("reputation_sync_started")
 
             # Get all agents with token_id
@@ -55,9 +54,6 @@ class ReputationSyncService:
             updated_count = 0
             error_count = 0
 
-            # 创建信号量来限制并发数
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
-
             # 分批处理
             for i in range(0, total_agents, BATCH_SIZE):
                 batch = agents[i:i + BATCH_SIZE]
@@ -71,23 +67,25 @@ class ReputationSyncService:
                     batch_size=len(batch)
                 )
 
-                # 并发处理当前批次
-                tasks = []
-                for agent in batch:
-                    task = self._update_agent_reputation_with_semaphore(
-                        semaphore, db, agent
-                    )
-                    tasks.append(task)
-
-                # 等待当前批次完成
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                # 一次性读取当前批次所有 agent 的 summary
+                summaries = await self.reader.get_summaries(
+                    [agent.token_id for agent in batch]
+                )
 
-                # 统计结果
-                for result in results:
-                    if isinstance(result, Exception):
+                for agent in batch:
+                    summary = summaries.get(agent.token_id)
+                    if summary is None:
                         error_count += 1
-                    else:
-                        updated_count += 1
+                        logger.warning(
+                            "reputation_fetch_failed",
+                            token_id=agent.token_id,
+                            agent_name=agent.name
+                        )
+                        continue
+                    self._apply_summary(db, agent, *summary)
+                    updated_count += 1
+
+                db.commit()
 
                 logger.info(
                     "reputation_sync_batch_completed",
@@ -96,10 +94,6 @@ class ReputationSyncService:
                     total=total_agents
                 )
 
-                # Add delay between batches to avoid rate limiting
-                if i + BATCH_SIZE < total_agents:  # Don't delay after last batch
-                    await asyncio.sleep(REQUEST_DELAY_SECONDS)
-
             logger.info(
                 "reputation_sync_completed",
                 updated=updated_count,
@@ -113,79 +107,54 @@ class ReputationSyncService:
         finally:
             db.close()
 
-    async def _update_agent_reputation_with_semaphore(
-        self, semaphore: asyncio.Semaphore, db: Session, agent: Agent
-    ):
-        """Update agent reputation with semaphore control"""
-        async with semaphore:
-            try:
-                await self._update_agent_reputation(db, agent)
-            except Exception as e:
-                logger.warning(
-                    "reputation_update_failed",
-                    token_id=agent.token_id,
+    def _apply_summary(self, db: Session, agent: Agent, count: int, average_score: int):
+        """Apply a (count, average_score) summary to an agent (caller commits)"""
+        # Only update if there's actual feedback
+        if count > 0:
+            old_score = agent.reputation_score
+            agent.reputation_score = float(average_score)
+            agent.reputation_count = int(count)
+            agent.reputation_last_updated = datetime.utcnow()
+
+            # Create activity record if score changed
+            if old_score != float(average_score):
+                activity = Activity(
                     agent_id=agent.id,
-                    error=str(e)
+                    activity_type=ActivityType.REPUTATION_UPDATE,
+                    description=f"Reputation updated: {old_score:.1f} → {average_score:.1f} ({count} reviews)",
+                    tx_hash=None
                 )
-                raise
+                db.add(activity)
 
-    async def _update_agent_reputation(self, db: Session, agent: Agent):
-        """Update reputation score for a single agent"""
-        try:
-            # Call getSummary(agentId, [], 0, 0) in thread pool
-            # Empty array = all clients, 0 bytes = all tags
-            count, average_score = await asyncio.to_thread(
-                self.contract.functions.getSummary(
-                    agent.token_id,
-                    [],  # All clients
-                    b'\x00' * 32,  # tag1 = 0 (no filter)
-                    b'\x00' * 32   # tag2 = 0 (no filter)
-                ).call
+            logger.info(
+                "reputation_updated",
+                token_id=agent.token_id,
+                agent_name=agent.name,
+                score=average_score,
+                count=count
+            )
+        else:
+            # No feedback yet, keep existing score
+            logger.debug(
+                "no_reputation_data",
+                token_id=agent.token_id,
+                agent_name=agent.name
             )
 
-            # Only update if there's actual feedback
-            if count > 0:
-                old_score = agent.reputation_score
-                agent.reputation_score = float(average_score)
-                agent.reputation_count = int(count)
-                agent.reputation_last_updated = datetime.utcnow()
-
-                db.commit()
-
-                # Create activity record if score changed
-                if old_score != float(average_score):
-                    activity = Activity(
-                        agent_id=agent.id,
-                        activity_type=ActivityType.REPUTATION_UPDATE,
-                        description=f"Reputation updated: {old_score:.1f} → {average_score:.1f} ({count} reviews)",
-                        tx_hash=None
-                    )
-                    db.add(activity)
-                    db.commit()
-
-                logger.info(
-                    "reputation_updated",
-                    token_id=agent.token_id,
-                    agent_name=agent.name,
-                    score=average_score,
-                    count=count
-                )
-            else:
-                # No feedback yet, keep existing score
-                logger.debug(
-                    "no_reputation_data",
-                    token_id=agent.token_id,
-                    agent_name=agent.name
-                )
-
-        except Exception as e:
+    async def _update_agent_reputation(self, db: Session, agent: Agent):
+        """Update reputation score for a single agent"""
+        await use_shared_session(self.w3)
+        summaries = await self.reader.get_summaries([agent.token_id])
+        if agent.token_id not in summaries:
             logger.warning(
                 "reputation_fetch_failed",
                 token_id=agent.token_id,
-                agent_name=agent.name,
-                error=str(e)
+                agent_name=agent.name
             )
-            raise
+            raise RuntimeError(f"getSummary failed for agent #{agent.token_id}")
+
+        self._apply_summary(db, agent, *summaries[agent.token_id])
+        db.commit()
 
     async def sync_single_agent(self, token_id: int):
         """Sync reputation for a single agent by token_id"""
@@ -207,5 +176,13 @@ class ReputationSyncService:
             db.close()
 
 
-# Global instance
-reputation_sync_service = ReputationSyncService()
+# Singleton instance (created on first use: it needs the network's RPC URL)
+_reputation_sync_service: Optional[ReputationSyncService] = None
+
+
+def get_reputation_sync_service() -> ReputationSyncService:
+    """Get singleton instance of ReputationSyncService"""
+    global _reputation_sync_service
+    if _reputation_sync_service is None:
+        _reputation_sync_service = ReputationSyncService()
+    return _reputation_sync_service
@@ -0,0 +1,78 @@
+"""Async JSON-RPC client helpers
+
+AsyncWeb3 instances used by the sync engine run directly on the app's event
+loop and share one pooled aiohttp session, so RPC I/O from every network
+overlaps without a worker thread or event loop per run. Requests go through
+an RpcProviderPool, which rate limits and fails over per endpoint.
+"""
+
+import asyncio
+from typing import Optional, Union
+
+import aiohttp
+import structlog
+from web3 import AsyncWeb3
+from web3.middleware import ExtraDataToPOAMiddleware
+
+from src.core.blockchain_config import RPC_MAX_REQUESTS_PER_SECOND
+from src.services.rpc_pool import RpcProviderPool
+
+logger = structlog.get_logger(__name__)
+
+RPC_TIMEOUT_SECONDS = 30
+RPC_CONNECTION_LIMIT = 20  # Pooled connections shared by all providers
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def create_async_web3(
+    rpc_urls: Union[str, list[str]],
+    rate_limit: float = RPC_MAX_REQUESTS_PER_SECOND,
+) -> AsyncWeb3:
+    """Create an AsyncWeb3 client over one or more HTTP RPC endpoints
+
+    Args:
+        rpc_urls: Endpoint URL(s) of the same chain, in order of preference
+        rate_limit: Requests per second allowed per endpoint
+
+    Call `use_shared_session(w3)` from the event loop before issuing requests.
+    """
+    if isinstance(rpc_urls, str):
+        rpc_urls = [rpc_urls]
+    w3 = AsyncWeb3(RpcProviderPool(rpc_urls, rate_limit))
+
+    # Inject POA middleware for chains like BSC that use Proof of Authority
+    # This handles the extraData field that exceeds 32 bytes in POA chains
+    w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+    return w3
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session for the running event loop"""
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=RPC_TIMEOUT_SECONDS),
+            connector=aiohttp.TCPConnector(limit=RPC_CONNECTION_LIMIT),
+        )
+        _session_loop = loop
+        logger.debug("rpc_http_session_created")
+    return _session
+
+
+async def use_shared_session(w3: AsyncWeb3):
+    """Point an AsyncWeb3 HTTP provider (or provider pool) at the shared session"""
+    await w3.provider.cache_async_session(await get_http_session())
+
+
+async def close_http_session():
+    """Close the shared session (application shutdown)"""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -0,0 +1,177 @@
+"""RPC provider pool
+
+A web3 async provider that spreads JSON-RPC traffic over several HTTP
+endpoints of the same chain. Each endpoint has its own token bucket and a
+passive health score (EWMA latency + expected limiter wait); every request
+goes to the best scored endpoint that is not cooling down. Throttling (429),
+server errors (5xx), timeouts and connection errors put the endpoint into an
+exponential cooldown and the request is retried on the next one, so callers
+never see a transient provider failure unless every endpoint keeps failing.
+"""
+
+import asyncio
+import time
+from typing import Any, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import aiohttp
+import structlog
+from web3 import AsyncHTTPProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from src.services.rate_limiter import TokenBucket
+
+logger = structlog.get_logger(__name__)
+
+LATENCY_EWMA_ALPHA = 0.3  # Weight of the newest latency sample
+INITIAL_LATENCY_SECONDS = 0.5  # Assumed latency of an endpoint with no samples
+COOLDOWN_BASE_SECONDS = 1.0  # First cooldown after a retryable failure
+COOLDOWN_MAX_SECONDS = 60.0
+MAX_ATTEMPTS_PER_PROVIDER = 2  # Attempts per request = providers * this
+
+RATE_LIMIT_MARKERS = ("rate limit", "too many requests", "exceeded its", "429")
+
+
+def is_retryable_error(e: Exception) -> bool:
+    """Whether an exception means "try another endpoint" (throttled / unavailable)"""
+    if isinstance(e, aiohttp.ClientResponseError):
+        return e.status == 429 or e.status >= 500
+    return isinstance(e, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
+
+
+def is_rate_limited_response(response: Any) -> bool:
+    """Whether a JSON-RPC error payload is a throttling response"""
+    if not isinstance(response, dict) or not isinstance(response.get("error"), dict):
+        return False
+    error = response["error"]
+    if error.get("code") == 429:
+        return True
+    message = str(error.get("message", "")).lower()
+    return any(marker in message for marker in RATE_LIMIT_MARKERS)
+
+
+class RateLimitedResponse(Exception):
+    """A provider answered with a JSON-RPC throttling error"""
+
+
+class RpcEndpoint:
+    """One HTTP endpoint with its limiter and health state"""
+
+    def __init__(self, url: str, rate_limit: float):
+        self.url = url
+        parsed = urlparse(url)  # Only host:port is logged, URLs may embed API keys
+        self.name = f"{parsed.hostname}:{parsed.port}" if parsed.port else (parsed.hostname or "rpc")
+        self.provider = AsyncHTTPProvider(url, exception_retry_configuration=None)
+        self.limiter = TokenBucket(rate_limit)
+        self.latency = INITIAL_LATENCY_SECONDS
+        self.failures = 0
+        self.cooldown_until = 0.0
+
+    def cooling_down(self, now: float) -> bool:
+        return self.cooldown_until > now
+
+    def score(self) -> float:
+        """Expected seconds until a response (lower is better)"""
+        return self.limiter.wait_time() + self.latency
+
+    def record_success(self, latency: float):
+        self.latency += LATENCY_EWMA_ALPHA * (latency - self.latency)
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        cooldown = min(COOLDOWN_MAX_SECONDS, COOLDOWN_BASE_SECONDS * 2 ** (self.failures - 1))
+        self.cooldown_until = time.monotonic() + cooldown
+
+
+class RpcProviderPool(AsyncJSONBaseProvider):
+    """Async web3 provider routing requests over several endpoints"""
+
+    def __init__(self, urls: List[str], rate_limit: float):
+        """Create a pool
+
+        Args:
+            urls: Endpoint URLs of the same chain, in order of preference
+            rate_limit: Requests per second allowed per endpoint (<= 0 = unlimited)
+        """
+        super().__init__()
+        if not urls:
+            raise ValueError("RpcProviderPool needs at least one RPC URL")
+        self.endpoints = [RpcEndpoint(url, rate_limit) for url in urls]
+
+    async def cache_async_session(self, session: aiohttp.ClientSession):
+        """Share one aiohttp session across all endpoints"""
+        for endpoint in self.endpoints:
+            await endpoint.provider.cache_async_session(session)
+
+    def _pick(self) -> RpcEndpoint:
+        now = time.monotonic()
+        ready = [e for e in self.endpoints if not e.cooling_down(now)]
+        if ready:
+            return min(ready, key=lambda e: e.score())
+        return min(self.endpoints, key=lambda e: e.cooldown_until)
+
+    async def _send(self, method: str, request):
+        """Run `request(provider)` on the healthiest endpoint, failing over"""
+        attempts = len(self.endpoints) * MAX_ATTEMPTS_PER_PROVIDER
+        last_error: Optional[Exception] = None
+
+        for attempt in range(attempts):
+            endpoint = self._pick()
+
+            # Every endpoint is cooling down: wait for the first to recover
+            wait = endpoint.cooldown_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            await endpoint.limiter.acquire()
+            started = time.monotonic()
+            try:
+                response = await request(endpoint.provider)
+                if is_rate_limited_response(response):
+                    raise RateLimitedResponse(response["error"].get("message"))
+            except Exception as e:
+                if not isinstance(e, RateLimitedResponse) and not is_retryable_error(e):
+                    raise
+                endpoint.record_failure()
+                last_error = e
+                logger.warning(
+                    "rpc_endpoint_failed",
+                    endpoint=endpoint.name,
+                    method=method,
+                    attempt=attempt + 1,
+                    failures=endpoint.failures,
+                    error=str(e)[:200]
+                )
+                continue
+
+            endpoint.record_success(time.monotonic() - started)
+            return response
+
+        raise last_error
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self._send(
+            method, lambda provider: provider.make_request(method, params)
+        )
+
+    async def make_batch_request(
+        self, requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        return await self._send(
+            "batch", lambda provider: provider.make_batch_request(requests)
+        )
+
+    def health(self) -> list[dict]:
+        """Current endpoint health, for logging and diagnostics"""
+        now = time.monotonic()
+        return [
+            {
+                "endpoint": e.name,
+                "latency_ms": round(e.latency * 1000),
+                "failures": e.failures,
+                "cooling_down": e.cooling_down(now),
+            }
+            for e in self.endpoints
+        ]
@@ -4,14 +4,11 @@ import asyncio
 from datetime import datetime, timezone
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
-from src.services.blockchain_sync import (
-    get_sync_service,
-    sync_sepolia,
-    sync_base_sepolia,
-    sync_bsc_testnet,
-)
-from src.core.networks_config import get_enabled_networks
+from src.services.sync_orchestrator import get_sync_orchestrator
+from src.core.blockchain_config import ENRICHMENT_POLL_SECONDS
+from src.services.enrichment_queue import get_enrichment_worker
 import structlog
 
 logger = structlog.get_logger()
@@ -27,36 +24,12 @@ STARTUP_SCAN_THRESHOLD = 10  # Trigger startup scan if unchecked agents >= this
 def start_scheduler():
     """Start the background task scheduler with multi-network support"""
 
-    async def sync_sepolia_task():
-        """Periodic Sepolia blockchain sync task"""
+    async def enrichment_task():
+        """Drain the agent enrichment queue (metadata fetch + classification)"""
         try:
-            logger.info("scheduler_task_started", task="sepolia_sync")
-            await asyncio.to_thread(_sync_network_blocking, "sepolia")
-            logger.info("scheduler_task_completed", task="sepolia_sync")
+            await get_enrichment_worker().drain()
         except Exception as e:
-            logger.error("scheduler_task_failed", task="sepolia_sync", error=str(e))
-
-    async def sync_base_sepolia_task():
-        """Periodic Base Sepolia blockchain sync task"""
-        try:
-            logger.info("scheduler_task_started", task="base_sepolia_sync")
-            await asyncio.to_thread(_sync_network_blocking, "base-sepolia")
-            logger.info("scheduler_task_completed", task="base_sepolia_sync")
-        except Exception as e:
-            logger.error(
-                "scheduler_task_failed", task="base_sepolia_sync", error=str(e)
-            )
-
-    async def sync_bsc_testnet_task():
-        """Periodic BSC Testnet blockchain sync task"""
-        try:
-            logger.info("scheduler_task_started", task="bsc_testnet_sync")
-            await asyncio.to_thread(_sync_network_blocking, "bsc-testnet")
-            logger.info("scheduler_task_completed", task="bsc_testnet_sync")
-        except Exception as e:
-            logger.error(
-                "scheduler_task_failed", task="bsc_testnet_sync", error=str(e)
-            )
+            logger.error("scheduler_task_failed", task="enrichment", error=str(e))
 
     async def endpoint_scan_task():
         """Daily endpoint health scan task"""
@@ -67,29 +40,21 @@ def start_scheduler():
         except Exception as e:
             logger.error("scheduler_task_failed", task="endpoint_scan", error=str(e))
 
-    # Add Sepolia sync job - runs every 2 minutes
+    # Add one sync job per enabled network - networks sync concurrently and independently
+    orchestrator = get_sync_orchestrator()
+    orchestrator.schedule(scheduler)
+
+    # Add enrichment queue job - new agents get metadata within seconds of being synced
     scheduler.add_job(
-        sync_sepolia_task,
-        trigger=CronTrigger(minute='*/2'),
-        id='sepolia_sync',
-        name='Sync Sepolia blockchain data',
+        enrichment_task,
+        trigger=IntervalTrigger(seconds=ENRICHMENT_POLL_SECONDS),
+        id='enrichment',
+        name='Enrich synced agents (metadata + classification)',
         replace_existing=True,
-        max_instances=1
+        max_instances=1,
+        coalesce=True
     )
 
-    # Note: Base Sepolia and BSC Testnet sync jobs disabled (Jan 2026)
-    # These networks are pending deployment of new contracts
-    # Uncomment when contracts are deployed:
-    #
-    # scheduler.add_job(
-    #     sync_base_sepolia_task,
-    #     trigger=CronTrigger(minute='1-59/2'),
-    #     id='base_sepolia_sync',
-    #     name='Sync Base Sepolia blockchain data',
-    #     replace_existing=True,
-    #     max_instances=1
-    # )
-
     # Add endpoint health scan job - runs daily at 03:00 UTC
     scheduler.add_job(
         endpoint_scan_task,
@@ -104,17 +69,19 @@ def start_scheduler():
     scheduler.start()
 
     # Get next run times for logging
-    sepolia_job = scheduler.get_job('sepolia_sync')
     endpoint_scan_job = scheduler.get_job('endpoint_scan')
 
     logger.info(
         "scheduler_started",
-        networks=["sepolia"],  # Only Sepolia enabled (Jan 2026)
-        sepolia_schedule="Every 2 minutes (:00, :02, :04, ...)",
-        sepolia_next_run=sepolia_job.next_run_time.strftime('%Y-%m-%d %H:%M:%S') if sepolia_job and sepolia_job.next_run_time else 'N/A',
+        networks=list(orchestrator.loops),
+        sync_schedules={
+            key: f"Every {loop.interval_minutes} minutes" for key, loop in orchestrator.loops.items()
+        },
+        live_tail={key: loop.tail.mode for key, loop in orchestrator.loops.items() if loop.tail},
         endpoint_scan_schedule=f"Daily at {ENDPOINT_SCAN_HOUR:02d}:00 UTC",
         endpoint_scan_next_run=endpoint_scan_job.next_run_time.strftime('%Y-%m-%d %H:%M:%S') if endpoint_scan_job and endpoint_scan_job.next_run_time else 'N/A',
-        reputation_mode="EVENT-DRIVEN (via NewFeedback/FeedbackRevoked events)"
+        reputation_mode="EVENT-DRIVEN (local feedback ledger, sampled getSummary reconciliation)",
+        enrichment_schedule=f"Every {ENRICHMENT_POLL_SECONDS} seconds"
     )
 
     # Check for unchecked agents on startup and trigger scan if needed
@@ -154,22 +121,12 @@ def _check_and_trigger_startup_scan():
         logger.error("startup_scan_check_failed", error=str(e))
 
 
-def _sync_network_blocking(network_key: str):
-    """Blocking wrapper for network sync - runs in thread pool"""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        service = get_sync_service(network_key)
-        loop.run_until_complete(service.sync())
-    finally:
-        loop.close()
-
-
 def _run_endpoint_scan_blocking():
     """Run endpoint health scan for all unchecked agents - runs in thread pool"""
     from src.db.database import SessionLocal
     from src.models import Agent
     from src.services.endpoint_health_service import get_endpoint_health_service
+    from src.services.metadata_fetcher import close_metadata_fetcher
     from datetime import datetime
 
     loop = asyncio.new_event_loop()
@@ -240,6 +197,8 @@ def _run_endpoint_scan_blocking():
             db.close()
 
     finally:
+        # Release the pooled metadata client bound to this loop
+        loop.run_until_complete(close_metadata_fetcher())
         loop.close()
 
 
@@ -0,0 +1,143 @@
+"""Per-stream sync cursors
+
+Each event stream of a network (identity, reputation, validation) has its own
+checkpoint in sync_cursors, so one stream can be added, reset for a
+replay or backfilled without resyncing the others. The range sync starts
+at the lowest cursor and fetches, for every range, only the streams whose
+cursor is below the range end; once the cursors are level again all
+streams share one eth_getLogs request per range.
+
+BlockchainSync.last_block is kept at the lowest cursor (the block through
+which the network is fully synced); the highest cursor is the checkpoint
+the reorg guard and the live tail work from.
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+import structlog
+from sqlalchemy.orm import Session
+
+from src.models import BlockchainSync, SyncCursor
+
+logger = structlog.get_logger(__name__)
+
+# Events tracked by the sync engine
+IDENTITY_EVENTS = ["Registered", "URIUpdated"]
+REPUTATION_EVENTS = ["NewFeedback", "FeedbackRevoked"]
+VALIDATION_EVENTS = ["ValidationRequest", "ValidationResponse"]
+
+# Event streams, each synced through its own cursor: stream -> (contract kind, events)
+SYNC_STREAMS = {
+    "identity": ("identity", IDENTITY_EVENTS),
+    "reputation": ("reputation", REPUTATION_EVENTS),
+    "validation": ("validation", VALIDATION_EVENTS),
+}
+EVENT_STREAMS = {event: stream for stream, (_, events) in SYNC_STREAMS.items() for event in events}
+# Events whose block timestamp is stored with the row they produce
+TIMESTAMPED_EVENTS = ("Registered", "NewFeedback", "ValidationRequest", "ValidationResponse")
+
+# Streams covered by the single BlockchainSync checkpoint before cursors existed
+LEGACY_STREAMS = ("identity", "reputation")
+
+
+class StreamCursors:
+    """Cursor positions of one network's streams"""
+
+    def __init__(self, network_key: str, contracts: dict[str, str], start_block: int):
+        """
+        Args:
+            network_key: Key from networks_config.py
+            contracts: stream -> contract address, for the streams the network has
+            start_block: First block of the network's contracts
+        """
+        self.network_key = network_key
+        self.contracts = contracts
+        self.start_block = start_block
+        self.positions: dict[str, int] = {}  # stream -> last synced block, as last loaded/written
+
+    @property
+    def floor(self) -> int:
+        """Block through which every stream is synced"""
+        return min(self.positions.values())
+
+    @property
+    def head(self) -> int:
+        """Block through which the furthest stream is synced"""
+        return max(self.positions.values())
+
+    @staticmethod
+    def behind(positions: dict[str, int], block: int) -> list[str]:
+        """Streams of a position snapshot not yet synced through `block`"""
+        return [stream for stream, last_block in positions.items() if last_block < block]
+
+    def lagging(self) -> list[str]:
+        """Streams behind the furthest one (new or replaying)"""
+        return self.behind(self.positions, self.head) if self.positions else []
+
+    def load(self, db: Session, sync_tracker: BlockchainSync) -> dict[str, int]:
+        """Read the cursors, creating missing ones (commits if any were created)
+
+        On the first load the legacy streams start from the network's
+        BlockchainSync checkpoint; streams added later start from start_block.
+        """
+        rows = {
+            row.stream: row for row in db.query(SyncCursor).filter(
+                SyncCursor.network_name == self.network_key
+            )
+        }
+
+        created = []
+        for stream, address in self.contracts.items():
+            if stream in rows:
+                continue
+            if not rows and stream in LEGACY_STREAMS:
+                last_block = sync_tracker.last_block
+            else:
+                last_block = self.start_block - 1
+            rows[stream] = SyncCursor(
+                network_name=self.network_key,
+                stream=stream,
+                contract_address=address,
+                last_block=last_block
+            )
+            db.add(rows[stream])
+            created.append(stream)
+
+        if created:
+            db.commit()
+            logger.info("sync_cursors_created", network=self.network_key, streams=created)
+
+        self.positions = {stream: rows[stream].last_block for stream in self.contracts}
+        return dict(self.positions)
+
+    def advance(self, db: Session, streams: Iterable[str], block: int):
+        """Move cursors of `streams` forward to `block` (caller commits)"""
+        streams = list(streams)
+        if not streams:
+            return
+        db.query(SyncCursor).filter(
+            SyncCursor.network_name == self.network_key,
+            SyncCursor.stream.in_(streams),
+            SyncCursor.last_block < block
+        ).update(
+            {SyncCursor.last_block: block, SyncCursor.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        for stream in streams:
+            self.positions[stream] = max(self.positions[stream], block)
+
+    def rewind(self, db: Session, block: int, streams: Optional[Iterable[str]] = None):
+        """Move cursors above `block` back to it, all streams by default (caller commits)"""
+        streams = list(streams) if streams is not None else list(self.contracts)
+        db.query(SyncCursor).filter(
+            SyncCursor.network_name == self.network_key,
+            SyncCursor.stream.in_(streams),
+            SyncCursor.last_block > block
+        ).update(
+            {SyncCursor.last_block: block, SyncCursor.updated_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        for stream in streams:
+            if stream in self.positions:
+                self.positions[stream] = min(self.positions[stream], block)
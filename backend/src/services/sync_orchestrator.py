@@ -0,0 +1,212 @@
+"""Multi-network sync orchestrator
+
+Runs one independently scheduled sync loop per enabled network. Loops
+overlap freely on the event loop; each network has its own RPC provider
+pool (and so its own request budget), its own schedule and its own
+failure backoff, so a slow or failing network never delays the others.
+
+With LIVE_TAIL_ENABLED every loop of a network with a ws_url (any network
+with LIVE_TAIL_POLLING_ENABLED) also runs a LiveTail; the scheduled
+range sync is skipped while the tail is streaming and every stream cursor
+is at the head, and takes over again whenever the tail is disconnected.
+
+Reputation is aggregated locally by the sync; a separate job per network
+checks a sample of agents against getSummary every
+REPUTATION_RECONCILE_INTERVAL_MINUTES.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from src.core.blockchain_config import (
+    SYNC_INTERVAL_MINUTES,
+    SYNC_FAILURE_BACKOFF_MAX_MINUTES,
+    LIVE_TAIL_ENABLED,
+    LIVE_TAIL_POLLING_ENABLED,
+    REPUTATION_RECONCILE_INTERVAL_MINUTES,
+    REPUTATION_RECONCILE_SAMPLE_SIZE,
+)
+from src.core.networks_config import get_enabled_networks, get_rpc_urls
+from src.services.blockchain_sync import NetworkSyncService, get_sync_service
+from src.services.live_tail import LiveTail
+
+logger = structlog.get_logger(__name__)
+
+
+class NetworkSyncLoop:
+    """Scheduled sync of one network with its own failure backoff"""
+
+    def __init__(self, network_key: str, service: NetworkSyncService):
+        self.network_key = network_key
+        self.service = service
+        self.interval_minutes = service.network_config.get(
+            "sync_interval_minutes", SYNC_INTERVAL_MINUTES
+        )
+        self.consecutive_failures = 0
+        self.retry_after = 0.0  # time.monotonic() before which runs are skipped
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+        self.tail: Optional[LiveTail] = None
+        if (
+            LIVE_TAIL_ENABLED and service.network_config.get("live_tail", True)
+            and (service.network_config.get("ws_url") or LIVE_TAIL_POLLING_ENABLED)
+        ):
+            self.tail = LiveTail(service)
+
+    @property
+    def job_id(self) -> str:
+        return f"{self.network_key}_sync"
+
+    async def run(self, force: bool = False):
+        """Run one sync of the network (skipped while backing off, unless forced)"""
+        # Streams that are behind (new or replaying) still need the range sync
+        if (
+            not force and self.tail is not None and self.tail.streaming
+            and not self.service.cursors.lagging()
+        ):
+            logger.debug("network_sync_skipped", network=self.network_key, reason="live_tail_streaming")
+            return
+
+        if not force and time.monotonic() < self.retry_after:
+            logger.info(
+                "network_sync_backing_off",
+                network=self.network_key,
+                consecutive_failures=self.consecutive_failures
+            )
+            return
+
+        logger.info("scheduler_task_started", task=self.job_id)
+        started = time.monotonic()
+        try:
+            await self.service.sync()
+            error = self.service.last_error
+        except Exception as e:
+            error = str(e)
+
+        self.last_run_at = datetime.utcnow()
+        self.last_duration = time.monotonic() - started
+        self.last_error = error
+
+        if error is None:
+            self.consecutive_failures = 0
+            self.retry_after = 0.0
+            logger.info(
+                "scheduler_task_completed",
+                task=self.job_id,
+                duration_seconds=round(self.last_duration, 2)
+            )
+            return
+
+        # Back off exponentially in whole sync intervals
+        self.consecutive_failures += 1
+        backoff_minutes = min(
+            SYNC_FAILURE_BACKOFF_MAX_MINUTES,
+            self.interval_minutes * (2 ** (self.consecutive_failures - 1) - 1)
+        )
+        self.retry_after = time.monotonic() + backoff_minutes * 60
+        logger.error(
+            "scheduler_task_failed",
+            task=self.job_id,
+            consecutive_failures=self.consecutive_failures,
+            backoff_minutes=backoff_minutes,
+            error=error[:500]
+        )
+
+    async def reconcile(self):
+        """Sampled reputation reconciliation (errors are logged, the next run retries)"""
+        try:
+            await self.service.reconcile_reputations()
+        except Exception as e:
+            logger.warning("reputation_reconcile_failed", network=self.network_key, error=str(e))
+
+    def status(self) -> dict:
+        return {
+            "network": self.network_key,
+            "interval_minutes": self.interval_minutes,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_duration_seconds": round(self.last_duration, 2) if self.last_duration is not None else None,
+            "consecutive_failures": self.consecutive_failures,
+            "last_error": self.last_error,
+            "live_tail": {
+                "mode": self.tail.mode,
+                "streaming": self.tail.streaming,
+                "failures": self.tail.failures,
+            } if self.tail else None,
+        }
+
+
+class SyncOrchestrator:
+    """One NetworkSyncLoop per enabled network"""
+
+    def __init__(self):
+        self.loops: dict[str, NetworkSyncLoop] = {}
+        for network_key, config in get_enabled_networks().items():
+            if not get_rpc_urls(config):
+                logger.warning("network_sync_skipped", network=network_key, reason="no_rpc_url")
+                continue
+            try:
+                service = get_sync_service(network_key)
+            except Exception as e:
+                # e.g. contracts not deployed yet or no RPC URL: skip only this network
+                logger.warning("network_sync_unavailable", network=network_key, error=str(e))
+                continue
+            self.loops[network_key] = NetworkSyncLoop(network_key, service)
+
+    def schedule(self, scheduler: AsyncIOScheduler):
+        """Add one sync job per network to the scheduler and start the live tails"""
+        for loop in self.loops.values():
+            if loop.tail is not None:
+                loop.tail.start()
+            scheduler.add_job(
+                loop.run,
+                trigger=IntervalTrigger(minutes=loop.interval_minutes),
+                id=loop.job_id,
+                name=f"Sync {loop.service.network_config['name']} blockchain data",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True
+            )
+            if REPUTATION_RECONCILE_SAMPLE_SIZE > 0:
+                scheduler.add_job(
+                    loop.reconcile,
+                    trigger=IntervalTrigger(minutes=REPUTATION_RECONCILE_INTERVAL_MINUTES),
+                    id=f"{loop.network_key}_reputation_reconcile",
+                    name=f"Reconcile {loop.service.network_config['name']} reputation sample",
+                    replace_existing=True,
+                    max_instances=1,
+                    coalesce=True
+                )
+
+    async def stop(self):
+        """Stop the live tails (application shutdown)"""
+        await asyncio.gather(
+            *(loop.tail.stop() for loop in self.loops.values() if loop.tail is not None)
+        )
+
+    async def sync_all(self):
+        """Sync every network once, concurrently"""
+        await asyncio.gather(*(loop.run(force=True) for loop in self.loops.values()))
+
+    def status(self) -> list[dict]:
+        """Per-network run status, for logging and diagnostics"""
+        return [loop.status() for loop in self.loops.values()]
+
+
+# Global orchestrator instance
+_sync_orchestrator: Optional[SyncOrchestrator] = None
+
+
+def get_sync_orchestrator() -> SyncOrchestrator:
+    """Get the sync orchestrator singleton"""
+    global _sync_orchestrator
+    if _sync_orchestrator is None:
+        _sync_orchestrator = SyncOrchestrator()
+    return _sync_orchestrator
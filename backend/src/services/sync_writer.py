@@ -0,0 +1,121 @@
+"""Per-range write buffer for the chain sync
+
+Collects the agent rows, activities, URI updates and enrichment jobs
+produced by one block range and writes them with a handful of bulk
+statements. Nothing is committed here: the sync commits the buffer
+together with the BlockchainSync checkpoint, so a range is applied
+atomically.
+"""
+
+from datetime import datetime
+
+import structlog
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from src.models import Agent, Activity, SyncStatus
+from src.services.enrichment_queue import enqueue_metadata_fetches
+
+logger = structlog.get_logger(__name__)
+
+
+def dialect_insert(db: Session, table):
+    """INSERT construct of the session's dialect (supports ON CONFLICT)"""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(table)
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+    return sqlite_insert(table)
+
+
+class RangeWriteBuffer:
+    """Buffered writes of one sync range (caller commits)"""
+
+    def __init__(self, db: Session, network_id: str):
+        self.db = db
+        self.network_id = network_id
+        self._agents: dict[int, dict] = {}  # token_id -> agent row
+        self._activities: dict[int, dict] = {}  # token_id -> REGISTERED activity row
+        self._uri_updates: dict[int, str] = {}  # token_id -> latest URI
+
+    def register_agent(self, agent_row: dict, activity_row: dict):
+        """Buffer a new agent and its registration activity"""
+        token_id = agent_row["token_id"]
+        if token_id in self._agents:
+            return
+        self._agents[token_id] = agent_row
+        self._activities[token_id] = activity_row
+
+    def update_uri(self, token_id: int, metadata_uri: str):
+        """Buffer a URIUpdated (the latest one in the range wins)"""
+        if token_id in self._agents:
+            # Registered in this same range: insert it with the new URI directly
+            self._agents[token_id]["metadata_uri"] = metadata_uri
+        self._uri_updates[token_id] = metadata_uri
+
+    def flush(self) -> dict[str, int]:
+        """Execute the buffered writes in the current transaction
+
+        Returns counts of written rows, for logging.
+        """
+        inserted = self._insert_agents()
+
+        # Agents inserted above already carry their latest URI and a fetch job
+        for token_id, row in self._agents.items():
+            if row["id"] in inserted:
+                self._uri_updates.pop(token_id, None)
+        updated = self._apply_uri_updates()
+
+        return {"agents_inserted": len(inserted), "uris_updated": updated}
+
+    def _insert_agents(self) -> set[str]:
+        """Insert buffered agents, returns the IDs actually inserted"""
+        if not self._agents:
+            return set()
+
+        # Agents already on record (from an earlier or concurrent run) are skipped
+        stmt = dialect_insert(self.db, Agent).on_conflict_do_nothing(
+            index_elements=["token_id", "network_id"]
+        ).returning(Agent.id)
+        inserted = set(self.db.execute(stmt, list(self._agents.values())).scalars())
+
+        skipped = len(self._agents) - len(inserted)
+        if skipped:
+            logger.info("agents_already_exist", count=skipped)
+
+        activities = [
+            self._activities[token_id]
+            for token_id, row in self._agents.items() if row["id"] in inserted
+        ]
+        if activities:
+            self.db.execute(insert(Activity), activities)
+
+        enqueue_metadata_fetches(self.db, {
+            row["id"]: row["metadata_uri"]
+            for row in self._agents.values() if row["id"] in inserted
+        })
+        return inserted
+
+    def _apply_uri_updates(self) -> int:
+        """Point existing agents at their new URIs, returns the number updated"""
+        if not self._uri_updates:
+            return 0
+
+        agents = self.db.query(Agent).filter(
+            Agent.token_id.in_(list(self._uri_updates)),
+            Agent.network_id == self.network_id
+        ).all()
+
+        now = datetime.utcnow()
+        for agent in agents:
+            agent.metadata_uri = self._uri_updates[agent.token_id]
+            agent.last_synced_at = now
+            agent.sync_status = SyncStatus.SYNCING
+
+        missing = set(self._uri_updates) - {agent.token_id for agent in agents}
+        for token_id in missing:
+            logger.warning("agent_not_found", token_id=token_id)
+
+        # Metadata is refetched by the enrichment queue
+        enqueue_metadata_fetches(self.db, {agent.id: agent.metadata_uri for agent in agents})
+        return len(agents)
@@ -0,0 +1,151 @@
+"""Local validation index
+
+ValidationRequest and ValidationResponse events are synced as the
+validation stream and merged by request hash into the validations table:
+one row per request, carrying its latest response. The validations API
+reads them from there instead of scanning the registry's logs per call.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+import structlog
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from web3 import Web3
+
+from src.models import Agent, Validation
+from src.services.sync_writer import dialect_insert
+
+logger = structlog.get_logger(__name__)
+
+# Columns a ValidationResponse fills in (empty while the request is pending)
+RESPONSE_COLUMNS = ("response", "response_uri", "tag", "response_block", "completed_at")
+
+
+def tag_string(value) -> Optional[str]:
+    """Readable bytes32 tag (None when empty)"""
+    if not value or not any(value):
+        return None
+    return value.rstrip(b"\x00").decode("utf-8", errors="ignore") or None
+
+
+def _timestamp(block_timestamps: dict[int, int], block_number: int) -> Optional[datetime]:
+    """Naive UTC time of a block (None if unknown)"""
+    block_timestamp = block_timestamps.get(block_number)
+    return datetime.utcfromtimestamp(block_timestamp) if block_timestamp is not None else None
+
+
+def validation_row(event, agent_id: str, block_timestamp: Optional[int] = None) -> dict:
+    """validations row of a decoded ValidationRequest event (block_timestamp in Unix seconds, stored as naive UTC)"""
+    args = event['args']
+    return {
+        "agent_id": agent_id,
+        "request_hash": Web3.to_hex(args['requestHash']),
+        "validator_address": args['validatorAddress'],
+        "request_uri": args.get('requestUri') or None,
+        "block_number": event['blockNumber'],
+        "log_index": event['logIndex'],
+        "tx_hash": event['transactionHash'].hex() if 'transactionHash' in event else None,
+        "requested_at": datetime.utcfromtimestamp(block_timestamp) if block_timestamp is not None else None,
+    }
+
+
+class ValidationIndex:
+    """Validation index of one network"""
+
+    def __init__(self, network_key: str):
+        self.network_key = network_key
+
+    def record(
+        self, db: Session, network_id: str, events: list, block_timestamps: Optional[dict[int, int]] = None
+    ) -> int:
+        """Store ValidationRequest rows and merge ValidationResponse events into them (caller commits)
+
+        Idempotent: requests already on record are kept and a response only
+        replaces one from the same or an earlier block, so replayed ranges
+        can go through here again. Returns the number of events recorded.
+
+        Args:
+            events: Decoded validation events in block/log-index order
+            block_timestamps: block number -> Unix timestamp of the event blocks
+        """
+        block_timestamps = block_timestamps or {}
+        token_ids = {event['args']['agentId'] for event in events}
+        agent_ids = dict(db.query(Agent.token_id, Agent.id).filter(
+            Agent.network_id == network_id,
+            Agent.token_id.in_(list(token_ids))
+        ).all())
+
+        rows = []
+        responses = []
+        for event in events:
+            agent_id = agent_ids.get(event['args']['agentId'])
+            if agent_id is None:
+                logger.warning(
+                    "agent_not_found_for_validation",
+                    network=self.network_key,
+                    token_id=event['args']['agentId']
+                )
+                continue
+            if event['event'] == 'ValidationRequest':
+                rows.append(validation_row(event, agent_id, block_timestamps.get(event['blockNumber'])))
+            else:
+                responses.append((agent_id, event))
+
+        # Inserted first: a request can be answered within one range
+        if rows:
+            db.execute(
+                dialect_insert(db, Validation).on_conflict_do_nothing(
+                    index_elements=["agent_id", "request_hash"]
+                ),
+                rows
+            )
+        recorded = len(rows)
+        for agent_id, event in responses:
+            args = event['args']
+            block_number = event['blockNumber']
+            updated = db.query(Validation).filter(
+                Validation.agent_id == agent_id,
+                Validation.request_hash == Web3.to_hex(args['requestHash']),
+                or_(Validation.response_block.is_(None), Validation.response_block <= block_number)
+            ).update(
+                {
+                    Validation.response: args['response'],
+                    Validation.response_uri: args.get('responseUri') or None,
+                    Validation.tag: tag_string(args.get('tag')),
+                    Validation.response_block: block_number,
+                    Validation.completed_at: _timestamp(block_timestamps, block_number),
+                },
+                synchronize_session=False
+            )
+            if updated:
+                recorded += 1
+            else:
+                logger.debug(
+                    "validation_response_skipped",
+                    network=self.network_key,
+                    token_id=args['agentId'],
+                    request_hash=Web3.to_hex(args['requestHash']),
+                    block_number=block_number
+                )
+
+        return recorded
+
+    def rollback(self, db: Session, network_id: str, fork_block: int) -> int:
+        """Drop requests and responses above the fork point (reorg rollback, caller commits)
+
+        A request whose latest response is orphaned goes back to pending; an
+        earlier response it replaced is not restored. Returns the number of
+        requests deleted.
+        """
+        agent_ids = db.query(Agent.id).filter(Agent.network_id == network_id).scalar_subquery()
+        deleted = db.query(Validation).filter(
+            Validation.agent_id.in_(agent_ids),
+            Validation.block_number > fork_block
+        ).delete(synchronize_session=False)
+        db.query(Validation).filter(
+            Validation.agent_id.in_(agent_ids),
+            Validation.response_block > fork_block
+        ).update(dict.fromkeys(RESPONSE_COLUMNS), synchronize_session=False)
+        return deleted
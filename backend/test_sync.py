@@ -1,12 +1,12 @@
 """Test blockchain sync manually"""
 
 import asyncio
-from src.services.blockchain_sync import blockchain_sync_service
+from src.services.blockchain_sync import get_sync_service
 
 async def main():
     print("Starting manual blockchain sync...")
     try:
-        await blockchain_sync_service.sync()
+        await get_sync_service("sepolia").sync()
         print("Sync completed successfully!")
     except Exception as e:
         print(f"Sync failed: {e}")
@@ -0,0 +1,78 @@
+"""Feedback and validation timestamps are stored and served as UTC, whatever the server's time zone"""
+
+import os
+import time
+
+import pytest
+from hexbytes import HexBytes
+
+from src.api.feedback import _utc_iso
+from src.services.reputation_ledger import feedback_row
+from src.services.validation_index import _timestamp, validation_row
+
+BLOCK_TIMESTAMP = 1700000000  # 2023-11-14T22:13:20Z
+
+
+@pytest.fixture
+def non_utc_timezone():
+    """Run the test with the process in UTC+8"""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "Asia/Shanghai"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+def new_feedback_event() -> dict:
+    return {
+        "event": "NewFeedback",
+        "args": {
+            "agentId": 1,
+            "clientAddress": "0x" + "22" * 20,
+            "feedbackIndex": 1,
+            "score": 80,
+            "tag2": "",
+            "endpoint": "",
+            "feedbackURI": "",
+            "feedbackHash": b"\x00" * 32,
+        },
+        "blockNumber": 100,
+        "logIndex": 0,
+        "transactionHash": HexBytes("0x" + "ab" * 32),
+    }
+
+
+def test_feedback_timestamp_is_serialized_as_utc(non_utc_timezone):
+    row = feedback_row(new_feedback_event(), "agent-id", BLOCK_TIMESTAMP)
+
+    assert _utc_iso(row["block_timestamp"]) == "2023-11-14T22:13:20Z"
+
+
+def test_feedback_without_timestamp():
+    row = feedback_row(new_feedback_event(), "agent-id")
+
+    assert row["block_timestamp"] is None
+    assert _utc_iso(row["block_timestamp"]) is None
+
+
+def test_validation_timestamps_are_serialized_as_utc(non_utc_timezone):
+    event = {
+        "event": "ValidationRequest",
+        "args": {
+            "agentId": 1,
+            "validatorAddress": "0x" + "33" * 20,
+            "requestHash": b"\x01" * 32,
+            "requestUri": "",
+        },
+        "blockNumber": 100,
+        "logIndex": 0,
+        "transactionHash": HexBytes("0x" + "cd" * 32),
+    }
+    row = validation_row(event, "agent-id", BLOCK_TIMESTAMP)
+
+    assert _utc_iso(row["requested_at"]) == "2023-11-14T22:13:20Z"
+    assert _utc_iso(_timestamp({101: BLOCK_TIMESTAMP + 12}, 101)) == "2023-11-14T22:13:32Z"
@@ -12,46 +12,23 @@ echo "🔄 重置 ${NETWORK_KEY} 网络的同步状态（Docker 环境）..."
 # 进入后端容器执行重置操作（使用内联 Python 代码）
 docker compose exec backend uv run python -c "
 import sys
-from src.db.database import SessionLocal
-from src.models import Network, BlockchainSync
+import asyncio
+from src.core.networks_config import get_network
+from src.services.blockchain_sync import get_sync_service
 
 network_key = '${NETWORK_KEY}'
-db = SessionLocal()
-
-try:
-    # 查找网络
-    network = db.query(Network).filter(Network.id == network_key).first()
-    if not network:
-        print(f'❌ 网络未找到: {network_key}')
-        print('可用网络: sepolia, base-sepolia')
-        sys.exit(1)
-    
-    print(f'📋 网络: {network.name} (Chain ID: {network.chain_id})')
-
-    # 获取起始区块（从 networks_config）
-    from src.core.networks_config import NETWORKS
-    network_config = NETWORKS.get(network_key)
-    start_block = network_config.get('start_block', 0) if network_config else 0
-
-    # 查找同步记录（使用 network_name 字段）
-    sync = db.query(BlockchainSync).filter(
-        BlockchainSync.network_name == network_key
-    ).first()
-
-    if sync:
-        old_block = sync.last_block
-        sync.last_block = start_block
-        sync.current_block = start_block
-        sync.status = 'idle'
-        db.commit()
-        print(f'✅ 同步状态已重置')
-        print(f'   从区块 {old_block} 重置到 {start_block}')
-    else:
-        print(f'⚠️  该网络还没有同步记录')
-        print(f'💡 提示: 首次同步会自动创建记录')
-    
-finally:
-    db.close()
+if not get_network(network_key):
+    print(f'❌ 网络未找到: {network_key}')
+    print('可用网络: sepolia, base-sepolia')
+    sys.exit(1)
+
+# 回退所有事件流游标（sync_cursors）并清除回填分区，下次同步从 start_block 重新扫描
+service = get_sync_service(network_key)
+positions = asyncio.run(service.reset_streams(list(service.stream_contracts)))
+print(f'📋 网络: {service.network_config[\"name\"]} (Chain ID: {service.network_config[\"chain_id\"]})')
+print(f'✅ 同步状态已重置')
+for stream, block in positions.items():
+    print(f'   {stream}: 回退到区块 {block}')
 "
 
 echo ""